@@ -1,64 +1,48 @@
-import json
 from typing import List, Tuple
 
+import frequency_store
+import wordlist
+
 
 def sort_words(word_list):
-    x = json.load(open("total.json"))
-    max_val = max(x["letters"].values())
-    x["letters"] = {
-        k: v / max_val for k, v in x["letters"].items()
-    }  # Normalized letter frequencies.
-    # print(x)
-    return [
-        s
-        for s, _ in sorted(
-            [score_word(word, x["letters"]) for word in word_list],
-            key=lambda y: y[1],
-            reverse=True,
-        )
-    ]
+    """Words by normalized letter frequency (total.json), best first."""
+    return frequency_store.get_store().sort(word_list, frequency_store.LETTERS)
 
 
 def sort_words2(word_list):
-    x = json.load(open("total.json"))
-    max_val = max(x["letters"].values())
-    x["letters"] = {
-        k: v / max_val for k, v in x["letters"].items()
-    }  # Normalized letter frequencies.
-    with open("word_frequencies.csv", "r") as f:
-        lines = f.read().splitlines()
-        x["words"] = {
-            line.split(",")[0]: float(line.split(",")[1]) for line in lines[1:]
-        }
-    return [
-        s
-        for s, _ in sorted(
-            [score_word2(word, x["letters"], x["words"]) for word in word_list],
-            key=lambda y: y[1],
-            reverse=True,
-        )
-    ]
-
-
-def score_word(word, lfreq):
-    return word, sum(lfreq.get(letter, 0) for letter in word) * (
-        1 + 0.20 * (len(set(word)) == 5)
-    )
-
-
-def score_word2(word, lfreq, wfreq):
-    return word, sum(lfreq.get(letter, 0) for letter in word) * (
-        1 + 0.20 * (len(set(word)) == 5)
-    ) + 1e2 * wfreq.get(word, 0)
+    """Words by letter frequency plus word frequency (word_frequencies.csv), best first."""
+    return frequency_store.get_store().sort(word_list, frequency_store.COMBINED)
 
 
 def filter_words(word_list, not_removed_letters):
     return [word for word in word_list if not_removed(word, not_removed_letters)]
 
 
-def solvable_words(word_list, letters, positions: List[Tuple[str, int, bool]]):
-    return sort_words2(
-        [word for word in word_list if found_letters(word, letters, positions)]
+def solvable_words(word_list, letters, positions: List[Tuple[str, int, bool]], k=None):
+    """Words consistent with the clues, best first (only the top k if k is given)."""
+    return frequency_store.get_store().top(
+        word_list, k, keep=lambda w: found_letters(w, letters, positions)
+    )[0]
+
+
+def best_words(
+    word_list,
+    not_removed_letters,
+    letters,
+    positions: List[Tuple[str, int, bool]],
+    k=5,
+):
+    """
+    One pass of filter_words -> sort_words -> solvable_words: (the top k solvable words,
+    how many words are solvable). Same words and order as the three steps in sequence.
+    """
+    return frequency_store.get_store().top(
+        word_list,
+        k,
+        keep=lambda w: not_removed(w, not_removed_letters)
+        and found_letters(w, letters, positions),
+        table=frequency_store.COMBINED,
+        then=frequency_store.LETTERS,
     )
 
 
@@ -75,24 +59,8 @@ def found_letters(w, letters, positions: List[Tuple[str, int, bool]]):
     )
 
 
-if __name__ != "__main__":
-    # Example usage
-    with open("fives.txt", "r") as f:
-        words = f.read().splitlines()
-    filtered_words = filter_words(words, not_removed_letters="ars")
-    # print("Filtered words:", filtered_words)
-    sorted_words = sort_words(filtered_words)
-    print(sorted_words[:5])  # Get top 5 words based on frequency scores.
-    solvable = solvable_words(
-        sorted_words, letters="oe", positions=[("o", 2, True), ("e", 4, False)]
-    )
-    print(
-        "Solvable words:", solvable[: min(len(solvable), 5)]
-    )  # Get top 5 solvable words.
-
 if __name__ == "__main__":
-    with open("fives.txt", "r") as f:
-        words = f.read().splitlines()
+    words = wordlist.load_words("fives.txt")
     positions_list = []
     not_removed_letters = ""
     letters = ""
@@ -126,7 +94,7 @@ if __name__ == "__main__":
         sorted_words = sort_words(filtered_words)
         print(sorted_words[:5])  # Get top 5 words based on frequency scores.
         solvable = solvable_words(
-            sorted_words, letters=letters, positions=positions_list
+            sorted_words, letters=letters, positions=positions_list, k=5
         )
         print(
             "Solvable words:", solvable[: min(len(solvable), 5)]
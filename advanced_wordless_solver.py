@@ -1,54 +1,18 @@
-import json
+import frequency_store
+import wordlist
 
 
 def sort_words(word_list):
-    x = json.load(open("total.json"))
-    max_val = max(x["letters"].values())
-    x["letters"] = {
-        k: v / max_val for k, v in x["letters"].items()
-    }  # Normalized letter frequencies.
-    # print(x)
-    return [
-        s
-        for s, _ in sorted(
-            [score_word(word, x["letters"]) for word in word_list],
-            key=lambda y: y[1],
-            reverse=True,
-        )
-    ]
+    return _store().sort(word_list, frequency_store.LETTERS)
 
 
 def sort_words2(word_list):
-    x = json.load(open("total.json"))
-    max_val = max(x["letters"].values())
-    x["letters"] = {
-        k: v / max_val for k, v in x["letters"].items()
-    }  # Normalized letter frequencies.
-    with open("word_frequencies.csv", "r") as f:
-        lines = f.read().splitlines()
-        x["words"] = {
-            line.split(",")[0]: float(line.split(",")[1]) for line in lines[1:]
-        }
-    return [
-        s
-        for s, _ in sorted(
-            [score_word2(word, x["letters"], x["words"]) for word in word_list],
-            key=lambda y: y[1],
-            reverse=True,
-        )
-    ]
-
-
-def score_word(word, lfreq):
-    return word, sum(lfreq.get(letter, 0) for letter in word) * (
-        1 + 0.20 * (len(set(word)) == 5)
-    )
-
-
-def score_word2(word, lfreq, wfreq):
-    return word, sum(lfreq.get(letter, 0) for letter in word) * (
-        1 + 0.20 * (len(set(word)) == 5)
-    ) + 1e2 * wfreq.get(word, 0)
+    return _store().sort(word_list, frequency_store.COMBINED)
+
+
+def _store():
+    # the same scoring tables as advanced_solver, built for the 6-letter english3 words
+    return frequency_store.get_store("english3.txt", 6)
 
 
 def filter_words(word_list, length=5):
@@ -72,8 +36,7 @@ def found_letters(w):
 
 if __name__ == "__main__":
     # Example usage
-    with open("english3.txt", "r") as f:
-        words = f.read().splitlines()
+    words = wordlist.words_of_length(6)
     filtered_words = filter_words(words, 6)
     # print("Filtered words:", filtered_words)
     sorted_words = sort_words(filtered_words)
@@ -1,6 +1,7 @@
 """This program uses the advanced_solver to simulate all possible Wordle games, taking the top 1 guess from the advanced_solver each turn."""
 
 import advanced_solver as aws
+import wordlist
 
 
 def color_word(guess, answer):
@@ -31,11 +32,9 @@ def color_word(guess, answer):
 if __name__ == "__main__":
     unsolved_words = []
     scores = []
-    with open("fives.txt", "r") as f:
-        global_words = f.read().splitlines()
+    global_words = wordlist.load_words("fives.txt")
     for answer in global_words:
-        with open("fives.txt", "r") as f:
-            words = f.read().splitlines()
+        words = global_words  # filtering builds new lists, so one copy serves every game
         positions_list = []
         not_removed_letters = ""
         letters = ""
@@ -60,22 +59,19 @@ if __name__ == "__main__":
                 scores.append(i + 1)
                 # print("Congratulations! You've guessed the word!")
                 break
-            filtered_words = aws.filter_words(
-                words, not_removed_letters=not_removed_letters
+            # filter -> sort -> solvable in one pass; only the best word is needed
+            solvable, n_solvable = aws.best_words(
+                words,
+                not_removed_letters=not_removed_letters,
+                letters=letters,
+                positions=positions_list,
+                k=1,
             )
-            # print("Filtered words:", filtered_words)
-            sorted_words = aws.sort_words(filtered_words)
-            # print(sorted_words[:5])  # Get top 5 words based on frequency scores.
-            solvable = aws.solvable_words(
-                sorted_words, letters=letters, positions=positions_list
-            )
-            # print(
-            #     "Solvable words:", solvable[: min(len(solvable), 5)]
-            # )  # Get top 5 solvable words.
-            if len(solvable) == 0 or i == 5:
+            # print("Solvable words:", n_solvable, solvable)
+            if n_solvable == 0 or i == 5:
                 print("Adding to unsolved words:", answer)
                 unsolved_words.append(answer)
-                scores.append(6 + len(solvable))
+                scores.append(6 + n_solvable)
                 break
             user_input = solvable[0]
     print("Unsolved words:", unsolved_words, len(unsolved_words))
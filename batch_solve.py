@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Streaming JSONL batch solver.
+- Reads one game per line: a JSON string (the answer) or an object with "answer" and/or
+  "history" (["arose:01002", ...] or [["arose", "01002"], ...]); an "id" is echoed back.
+- With an answer, the game is played to the end with the hard or normal strategy
+  (continuing after the history, if any) and one line reports its guesses, patterns,
+  score and per-turn timings. With only a history, the line reports the next guess.
+- Everything is a generator from input line to output line, and the per-process caches
+  are bounded, so memory use does not grow with the input length.
+- Bad lines produce {"line": N, "error": ...} and the stream carries on.
+
+Usage:
+  python batch_solve.py [--mode hard|normal] [--guess-cache PATH] [-o OUT] [INPUT|-]
+  e.g. printf '"crane"\\n{"history": ["arose:01002"]}\\n' | python batch_solve.py
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import new_advanced_solver as solver
+import pattern_matrix
+import wordlist
+from game_state import GameState
+from guess_cache import GuessCache
+from strategy_tree import UNSOLVED
+
+MAX_GUESSES = 6
+
+Strategy = Tuple[str, Callable[[int, List[str]], str]]
+
+
+def load_strategy(mode: str, words: List[str]) -> Strategy:
+    """(first guess, choose_guess(turn, candidates)) of the hard or normal runner."""
+    if mode == "hard":
+        import naws_arose as runner
+
+        return runner.first_guess(words), runner.choose_guess
+    import normal_mode_runner as runner
+
+    def choose(turn: int, cands: List[str]) -> str:
+        return runner.choose_guess(turn, cands, words)
+
+    return runner.first_guess(words), choose
+
+
+def _word(value, what: str) -> str:
+    if not isinstance(value, str) or not value.isalpha():
+        raise ValueError(f"bad {what}: {value!r}")
+    return value.lower()
+
+
+def parse_request(line: str) -> Dict:
+    """One input line -> {"id", "answer", "history": [(guess, code), ...]}."""
+    obj = json.loads(line)
+    if isinstance(obj, str):
+        obj = {"answer": obj}
+    if not isinstance(obj, dict):
+        raise ValueError("expected a JSON string or object")
+    answer = obj.get("answer")
+    history = []
+    for item in obj.get("history") or []:
+        if isinstance(item, str):
+            guess, _, pattern = item.partition(":")
+        else:
+            guess, pattern = item
+        guess = _word(guess, "guess")
+        if len(pattern) != len(guess) or set(pattern) - set("012"):
+            raise ValueError(f"bad pattern for {guess!r}: {pattern!r}")
+        history.append((guess, solver.encode_pattern(pattern)))
+    if answer is None and not history and "history" not in obj:
+        raise ValueError("need an answer or a history")
+    return {
+        "id": obj.get("id"),
+        "answer": None if answer is None else _word(answer, "answer"),
+        "history": history,
+    }
+
+
+def read_requests(lines: Iterable[str]) -> Iterator[Tuple[int, Optional[Dict], str]]:
+    """(line number, request or None, error message) for every non-blank line."""
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield lineno, parse_request(line), ""
+        except (ValueError, TypeError) as e:
+            yield lineno, None, str(e)
+
+
+# The word set of the list solve_game checked last (one list per stream in practice).
+_KNOWN: Tuple[Optional[List[str]], frozenset] = (None, frozenset())
+
+
+def check_request(req: Dict, words: List[str]) -> None:
+    """Raise ValueError unless the request fits the word list: lengths and a known answer."""
+    global _KNOWN
+    length = len(words[0]) if words else 0
+    answer = req["answer"]
+    if answer is not None:
+        if len(answer) != length:
+            raise ValueError(f"answer {answer!r} is not {length} letters")
+        if _KNOWN[0] is not words:
+            _KNOWN = (words, frozenset(words))
+        if answer not in _KNOWN[1]:
+            raise ValueError(f"answer {answer!r} is not in the word list")
+    for guess, _ in req["history"]:
+        if len(guess) != length:
+            raise ValueError(f"guess {guess!r} is not {length} letters")
+
+
+def solve_game(req: Dict, words: List[str], strategy: Strategy) -> Dict:
+    check_request(req, words)
+    first, choose = strategy
+    answer = req["answer"]
+    answer_codes = solver.word_codes(answer) if answer is not None else None
+    state = GameState(words)
+    guesses: List[str] = []
+    patterns: List[str] = []
+    turn_ms: List[float] = []
+    solved = False
+
+    for guess, code in req["history"]:
+        if answer_codes is not None and code != solver.feedback_code(
+            solver.word_codes(guess), answer_codes
+        ):
+            raise ValueError(f"pattern for {guess!r} does not match the answer")
+        guesses.append(guess)
+        patterns.append(solver.decode_pattern(code, len(guess)))
+        state.apply(guess, code)
+        if code == solver.all_green_code(len(guess)):
+            solved = True
+            break
+
+    out: Dict = {} if req["id"] is None else {"id": req["id"]}
+    if answer is None:
+        start = time.perf_counter()
+        cands = state.candidates()
+        if solved:
+            nxt = ""
+        elif not guesses:
+            nxt = first
+        else:
+            nxt = choose(len(guesses) - 1, cands) if cands else ""
+        out.update(
+            history=[f"{g}:{p}" for g, p in zip(guesses, patterns)],
+            candidates=len(cands),
+            next=nxt,
+            turn_ms=[round(1000 * (time.perf_counter() - start), 3)],
+        )
+        return out
+
+    while not solved and len(guesses) < MAX_GUESSES:
+        start = time.perf_counter()
+        if not guesses:
+            guess = first
+        else:
+            cands = state.candidates()
+            guess = choose(len(guesses) - 1, cands) if cands else ""
+        if not guess:
+            break
+        code = solver.feedback_code(solver.word_codes(guess), answer_codes)
+        guesses.append(guess)
+        patterns.append(solver.decode_pattern(code, len(guess)))
+        if code == solver.all_green_code(len(guess)):
+            solved = True
+        else:
+            state.apply(guess, code)
+        turn_ms.append(round(1000 * (time.perf_counter() - start), 3))
+
+    out.update(
+        answer=answer,
+        guesses=guesses,
+        patterns=patterns,
+        solved=solved,
+        score=len(guesses) if solved else UNSOLVED,
+        turn_ms=turn_ms,
+    )
+    return out
+
+
+def solve_stream(lines: Iterable[str], words: List[str], strategy: Strategy) -> Iterator[Dict]:
+    for lineno, req, error in read_requests(lines):
+        if req is not None:
+            try:
+                yield solve_game(req, words, strategy)
+                continue
+            except ValueError as e:
+                error = str(e)
+        yield {"line": lineno, "error": error}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Solve games streamed as JSON lines; writes one JSON line per game."
+    )
+    parser.add_argument("input", nargs="?", default="-", help="JSONL file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--mode", choices=("hard", "normal"), default="hard")
+    parser.add_argument(
+        "--guess-cache",
+        metavar="PATH",
+        help="load memoized best-guess picks from PATH and save them back",
+    )
+    args = parser.parse_args(argv)
+
+    words = wordlist.load_words("fives.txt")
+    solver.use_pattern_matrix(
+        pattern_matrix.load_pattern_matrix(words, words, verbose=True)
+    )
+    cache = GuessCache(path=args.guess_cache)
+    solver.use_guess_cache(cache)
+    strategy = load_strategy(args.mode, words)
+
+    src = sys.stdin if args.input == "-" else open(args.input, "r")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for record in solve_stream(src, words, strategy):
+            dst.write(json.dumps(record, separators=(",", ":")) + "\n")
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+        else:
+            dst.flush()
+    if args.guess_cache:
+        cache.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the solver hot paths, with a stored baseline and regression check.
+- Inputs are pinned: fives.txt (checked against the sha256 recorded in the baseline) and
+  a fixed random seed for every sampled word, candidate set and answer.
+- Each benchmark is calibrated to run for at least --min-time per repeat; the best
+  (minimum) per-call time over --repeats is what gets compared.
+- Runs in the runners' configuration: pattern matrix installed, full word list indexed
+  for filtering, guess cache off (so repeated games measure the picks, not cache hits).
+- Startup benchmarks ("import:<module>") import a module in a fresh interpreter and
+  report its cumulative time from `python -X importtime`; an import that prints
+  anything fails the run, since imports must be free of side effects. One interpreter
+  start is much noisier than a calibrated loop, so these are run --startup-repeats times
+  and compared on the median against their own --startup-threshold; a slower startup is
+  reported but does not fail the run.
+
+Usage:
+  python bench.py                      # compare against bench_baseline.json
+  python bench.py --save               # (re)write the baseline from this run
+  python bench.py --threshold 10 --only entropy_of_guess filter_candidates
+Exit status 1 if any benchmark fails or a hot-path benchmark is more than --threshold
+percent slower than its baseline.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import candidate_index
+import naws_arose
+import new_advanced_solver as solver
+import pattern_matrix
+import wordlist
+
+SEED = 1234
+BASELINE = "bench_baseline.json"
+VERSION = 1
+STARTUP_MODULES = [
+    "new_advanced_solver",
+    "game_state",
+    "strategy_tree",
+    "naws_arose",
+    "normal_mode_runner",
+    "advanced_solver",
+    "wordle",
+    "best_word_alg3",
+]
+
+
+def _sample_sorted(rnd: random.Random, words: List[str], k: int) -> List[str]:
+    """k random words, kept in word-list order like real candidate sets."""
+    return [words[i] for i in sorted(rnd.sample(range(len(words)), k))]
+
+
+def make_benchmarks(words: List[str]) -> Dict[str, Callable[[], object]]:
+    """name -> zero-argument callable; all inputs drawn from one seeded generator."""
+    rnd = random.Random(SEED)
+    pairs = [(rnd.choice(words), rnd.choice(words)) for _ in range(1000)]
+    cands_500 = _sample_sorted(rnd, words, 500)
+    cands_200 = _sample_sorted(rnd, words, 200)
+    filter_answer = rnd.choice(words)
+    game_answer = rnd.choice(words)
+    slice_500 = _sample_sorted(rnd, words, 500)
+
+    constraints = solver.turn_constraints(
+        "arose",
+        solver.feedback_code(solver.word_codes("arose"), solver.word_codes(filter_answer)),
+    )
+
+    def feedback_pattern():
+        for g, a in pairs:
+            solver.feedback_pattern(g, a)
+
+    def sweep_slice():
+        for a in slice_500:
+            naws_arose.simulate_one(a, words)
+
+    return {
+        "feedback_pattern_x1000": feedback_pattern,
+        "entropy_of_guess": lambda: solver.entropy_of_guess("arose", cands_500),
+        "coverage_score": lambda: solver.coverage_score("arose", cands_500),
+        "filter_candidates": lambda: solver.filter_candidates(words, *constraints),
+        "pick_best_hard_mode_guess": lambda: solver.pick_best_hard_mode_guess(cands_200),
+        "simulate_one": lambda: naws_arose.simulate_one(game_answer, words),
+        "sweep_500": sweep_slice,
+    }
+
+
+def import_seconds(module: str) -> float:
+    """Cumulative import time of `module` in a fresh interpreter."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {proc.stderr.strip().splitlines()[-1]}")
+    if proc.stdout:
+        raise RuntimeError(f"import {module} printed output (import has side effects)")
+    # lines look like "import time:  self [us] | cumulative | package"
+    for line in reversed(proc.stderr.splitlines()):
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1e6
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def make_startup_benchmarks() -> Dict[str, Callable[[], float]]:
+    """name -> zero-argument callable returning one measurement in seconds."""
+    return {f"import:{m}": (lambda m=m: import_seconds(m)) for m in STARTUP_MODULES}
+
+
+def measure_reported(fn: Callable[[], float], repeats: int) -> Dict[str, float]:
+    """Best and median of `repeats` self-timed measurements."""
+    times = [fn() for _ in range(repeats)]
+    return {"best": min(times), "median": statistics.median(times), "loops": 1}
+
+
+def measure(fn: Callable[[], object], repeats: int, min_time: float) -> Dict[str, float]:
+    """Per-call seconds: best and median over `repeats` calibrated runs."""
+    fn()  # warm caches (word codes, candidate ids, bitset index)
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time / max(elapsed, 1e-9)))
+    times = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        times.append((time.perf_counter() - start) / loops)
+    return {"best": min(times), "median": statistics.median(times), "loops": loops}
+
+
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds * 1e9:8.1f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the solver microbenchmarks.")
+    parser.add_argument("--baseline", default=BASELINE, help=f"baseline file (default: {BASELINE})")
+    parser.add_argument("--save", action="store_true", help="write this run as the baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=25.0,
+        help="percent slowdown vs baseline that counts as a regression (default: 25)",
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--startup-threshold",
+        type=float,
+        default=50.0,
+        help="median slowdown in percent flagged for the import:* benchmarks (default: 50)",
+    )
+    parser.add_argument(
+        "--startup-repeats",
+        type=int,
+        default=15,
+        help="fresh interpreters per import:* benchmark (default: 15)",
+    )
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="run only these benchmarks")
+    args = parser.parse_args(argv)
+
+    words = wordlist.load_words("fives.txt")
+    key = pattern_matrix.word_list_key(words, words)
+    solver.use_pattern_matrix(pattern_matrix.load_pattern_matrix(words, words, verbose=True))
+    solver.use_guess_cache(None)
+    candidate_index.register(words)
+
+    benchmarks = make_benchmarks(words)
+    startup = make_startup_benchmarks()
+    unknown = set(args.only or ()) - set(benchmarks) - set(startup)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    baseline: Dict = {}
+    if not args.save:
+        try:
+            with open(args.baseline, "r") as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            print(f"No baseline at {args.baseline}; run with --save first.", file=sys.stderr)
+        if baseline and (baseline.get("version") != VERSION or baseline.get("words") != key):
+            print(
+                "Baseline was recorded for a different word list or format; not comparing.",
+                file=sys.stderr,
+            )
+            sys.exit(2)
+    base_results = baseline.get("results", {})
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions: List[str] = []
+    slow_startup: List[str] = []
+    print(f"{'benchmark':28} {'best':>11} {'median':>11} {'baseline':>11} {'change':>8}")
+    failures: List[str] = []
+    for name, fn in [*benchmarks.items(), *startup.items()]:
+        if args.only and name not in args.only:
+            continue
+        try:
+            if name in startup:
+                res = measure_reported(fn, args.startup_repeats)
+            else:
+                res = measure(fn, args.repeats, args.min_time)
+        except RuntimeError as e:
+            failures.append(name)
+            print(f"{name:28} FAILED: {e}", flush=True)
+            continue
+        results[name] = res
+        line = f"{name:28} {_fmt(res['best'])} {_fmt(res['median'])}"
+        base = base_results.get(name)
+        if base:
+            # startup: compare medians, a single best interpreter start is mostly luck
+            stat, threshold = (
+                ("median", args.startup_threshold) if name in startup else ("best", args.threshold)
+            )
+            change = 100.0 * (res[stat] - base[stat]) / base[stat]
+            flag = ""
+            if change > threshold and name in startup:
+                flag = "  SLOWER"
+                slow_startup.append(name)
+            elif change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(name)
+            line += f" {_fmt(base[stat])} {change:+7.1f}%{flag}"
+        print(line, flush=True)
+
+    if args.save:
+        merged: Dict[str, Dict[str, float]] = {}
+        if args.only:  # keep the other benchmarks' baselines
+            try:
+                with open(args.baseline, "r") as f:
+                    merged = json.load(f).get("results", {})
+            except FileNotFoundError:
+                pass
+        merged.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {
+                    "version": VERSION,
+                    "words": key,
+                    "seed": SEED,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": merged,
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+        print(f"Saved baseline -> {args.baseline}")
+    else:
+        if regressions:
+            print(
+                f"{len(regressions)} regression(s) over {args.threshold:g}%: "
+                f"{', '.join(regressions)}",
+                file=sys.stderr,
+            )
+        if slow_startup:
+            print(
+                f"Startup over {args.startup_threshold:g}% (median, not an error): "
+                f"{', '.join(slow_startup)}",
+                file=sys.stderr,
+            )
+    if failures or (regressions and not args.save):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
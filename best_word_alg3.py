@@ -1,3 +1,39 @@
+"""
+Average candidates remaining after each guess, over every answer in fives.txt.
+- A guess splits the answers into buckets by its clue pattern, where each position is
+  green (same letter), yellow (letter somewhere in the answer) or grey. This is the clue
+  Guess.get_solvable filters by: no duplicate-letter accounting. The answers left after
+  a guess are its bucket, so summing over all answers gives sum(bucket size^2), and
+  avg_score is that divided by the number of words.
+- score_guesses computes this for a block of guesses in one vectorized NumPy pass (plain
+  Python without NumPy). The Guess class keeps the original filter-based definition.
+- Progress is appended to a binary checkpoint (header + fixed-size (word id, score)
+  records) after every block, so an interrupted run resumes where it stopped. The
+  checkpoint is tied to the word list by a sha256 digest.
+- output.txt ("word,avg_score,score" per line) is exported at the end, as before.
+
+Usage:
+  python best_word_alg3.py [--checkpoint PATH] [--output output.txt] [--block N] [--restart]
+"""
+
+import os
+import struct
+import sys
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+import wordlist
+
+CHECKPOINT = "best_word_alg3.ckpt"
+OUTPUT = "output.txt"
+MAGIC = b"BWA3"
+VERSION = 1
+# magic, version, reserved, word count, sha256 of the word list
+_HEADER = struct.Struct("<4sHHI32s")
+# word id, score (sum of squared bucket sizes)
+_RECORD = struct.Struct("<IQ")
+
+
 class Guess(object):
     def __init__(self, guess: str):
         self.guess = guess
@@ -63,29 +99,130 @@ class Guess(object):
         return self.avg_score
 
 
-with open("fives.txt", "r") as f:
-    word_list = [line.strip() for line in f.readlines()]
+# --------------------------------
+# Bucket-size scoring
+# --------------------------------
+
+
+def clue_code(guess: str, word: str) -> int:
+    """Base-3 code of the clue Guess.check_guess gives (2 green, 1 yellow, 0 grey)."""
+    code = 0
+    for g, w in zip(guess, word):
+        code = code * 3 + (2 if g == w else (1 if g in word else 0))
+    return code
+
+
+def _score_guesses_py(guesses: Sequence[str], words: Sequence[str]) -> List[int]:
+    return [
+        sum(c * c for c in Counter(clue_code(g, w) for w in words).values()) for g in guesses
+    ]
+
+
+def score_guesses(guesses: Sequence[str], words: Sequence[str]) -> List[int]:
+    """sum(bucket size^2) over the clue buckets of `words`, for each guess."""
+    try:
+        import numpy as np  # imported here so that importing this module stays cheap
+    except ImportError:  # pure-Python fallback
+        np = None
+    if np is None or not guesses:
+        return _score_guesses_py(guesses, words)
+    length = len(words[0])
+    letters = np.frombuffer("".join(words).encode(), dtype=np.uint8).reshape(-1, length) - 97
+    masks = np.bitwise_or.reduce(np.left_shift(1, letters.astype(np.int64)), axis=1)
+    g = np.frombuffer("".join(guesses).encode(), dtype=np.uint8).reshape(-1, length) - 97
+    n_codes = 3**length
+    codes = np.zeros((len(guesses), len(words)), dtype=np.int64)
+    for i in range(length):
+        col = g[:, i, None]
+        present = (masks[None, :] >> col.astype(np.int64)) & 1
+        codes = codes * 3 + np.where(letters[None, :, i] == col, 2, present)
+    codes += (np.arange(len(guesses), dtype=np.int64) * n_codes)[:, None]
+    sizes = np.bincount(codes.ravel(), minlength=len(guesses) * n_codes)
+    return (sizes * sizes).reshape(len(guesses), n_codes).sum(axis=1).tolist()
+
+
+# --------------------------------
+# Checkpoint (append-only) and export
+# --------------------------------
+
+
+def read_checkpoint(path: str, words: Sequence[str]) -> Dict[int, int]:
+    """word id -> score from a checkpoint for this word list ({} if none or stale)."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}
+    if len(data) < _HEADER.size:
+        return {}
+    magic, version, _, n, digest = _HEADER.unpack_from(data)
+    if (magic, version, n) != (MAGIC, VERSION, len(words)):
+        return {}
+    if digest != wordlist.list_digest(words):
+        return {}
+    end = _HEADER.size + (len(data) - _HEADER.size) // _RECORD.size * _RECORD.size
+    # a torn final record (interrupted write) is ignored and recomputed
+    return {i: score for i, score in _RECORD.iter_unpack(data[_HEADER.size : end]) if i < n}
+
+
+def open_checkpoint(path: str, words: Sequence[str], fresh: bool):
+    """Append handle to the checkpoint; a fresh one starts with the header."""
+    if fresh:
+        f = open(path, "wb")
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(words), wordlist.list_digest(words)))
+        return f
+    f = open(path, "r+b")
+    size = os.fstat(f.fileno()).st_size
+    f.truncate(_HEADER.size + (size - _HEADER.size) // _RECORD.size * _RECORD.size)
+    f.seek(0, os.SEEK_END)
+    return f
+
+
+def export_output(path: str, guess_list: List[Guess]) -> None:
+    """The old output.txt layout: word,avg_score,score per line, no trailing newline."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write("\n".join(f"{a.guess},{a.avg_score},{a.score}" for a in guess_list))
+    os.replace(tmp, path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Average candidates remaining after each guess (fives.txt)."
+    )
+    parser.add_argument("--checkpoint", default=CHECKPOINT, help=f"default: {CHECKPOINT}")
+    parser.add_argument("--output", default=OUTPUT, help=f"export file (default: {OUTPUT})")
+    parser.add_argument("--block", type=int, default=64, help="guesses per vectorized pass")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint")
+    args = parser.parse_args(argv)
+
+    word_list = wordlist.load_words("fives.txt")
     guess_list = [Guess(word) for word in word_list]
-    # in between:
-    with open("output.txt", "r") as file_1:
-        lines = file_1.read().splitlines()
-        for idx, line in enumerate(lines):
-            word, avg_score, score = line.split(",")
-            guess_list[idx].guess = word
-            guess_list[idx].avg_score = float(avg_score)
-            guess_list[idx].score = int(score)
-        file_1.close()
-    for word in guess_list:
-        if word.avg_score == 0.0 or word.score == 0:
-            print(word.guess, word.doit(word_list), word.score)
-        else:
-            print(word.guess, word.avg_score, word.score)
-        open("output.txt", "w").write(
-            "\n".join(f"{a.guess},{a.avg_score},{a.score}" for a in guess_list)
-        )
+    done = {} if args.restart else read_checkpoint(args.checkpoint, word_list)
+    if done:
+        print(f"Resuming: {len(done)}/{len(word_list)} guesses from {args.checkpoint}")
+    pending = [i for i in range(len(word_list)) if i not in done]
+    with open_checkpoint(args.checkpoint, word_list, fresh=not done) as ckpt:
+        for start in range(0, len(pending), args.block):
+            ids = pending[start : start + args.block]
+            scores = score_guesses([word_list[i] for i in ids], word_list)
+            ckpt.write(b"".join(_RECORD.pack(i, s) for i, s in zip(ids, scores)))
+            ckpt.flush()
+            done.update(zip(ids, scores))
+            print(f"{len(done)}/{len(word_list)}", end="\r", file=sys.stderr, flush=True)
+    for i, guess in enumerate(guess_list):
+        guess.score = done[i]
+        guess.avg_score = guess.score / len(word_list) if word_list else 0
+    export_output(args.output, guess_list)
 
     sorted_guesses = sorted(guess_list, key=lambda x: x.score, reverse=False)
     for guess in sorted_guesses[:5]:  # Print top 5 guesses
         print(
             f"Guess: {guess.guess}, Score: {guess.score}, Avg Score: {guess.avg_score}"
         )
+
+
+if __name__ == "__main__":
+    main()
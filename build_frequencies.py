@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Streaming builder for word_frequencies.csv (replaces blah.py).
+- Count files ("word,count" lines, header optional) are read in chunks, one pass each.
+- Each word is stripped and lower-cased and looked up in a dict from word to ID over the
+  word list. Counts go into an array indexed by word ID, so case variants ("Abaca",
+  "abaca") merge into one total. Words not in the list are dropped.
+- Normalization (count / max count) happens once over the totals. The output is written
+  atomically, one row per word with a non-zero count, in word-list order.
+- Incremental: the per-source totals are kept in a state file next to the output. A later
+  run covers the sources it is given plus the ones recorded earlier, and only reads those
+  that are new or changed (by size/mtime). A recorded source that no longer exists is
+  dropped from the totals. A different word list means a full rebuild.
+
+Usage:
+  python build_frequencies.py [COUNTS.csv ...] [--words fives.txt] [-o word_frequencies.csv]
+                              [--state PATH] [--rebuild]
+  e.g. python build_frequencies.py combined_counts.csv      # first build
+       python build_frequencies.py new_counts.csv           # adds to the existing totals
+       python build_frequencies.py                          # refreshes changed/removed ones
+"""
+
+import argparse
+import json
+import os
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+import wordlist
+
+DEFAULT_SOURCES = ["combined_counts.csv"]
+OUTPUT = "word_frequencies.csv"
+STATE_VERSION = 1
+CHUNK_BYTES = 1 << 20
+
+
+def state_path(output: str) -> str:
+    return os.path.splitext(output)[0] + ".state.json"
+
+
+def _chunks(f) -> Iterable[List[str]]:
+    while True:
+        lines = f.readlines(CHUNK_BYTES)
+        if not lines:
+            return
+        yield lines
+
+
+def count_file(path: str, ids: Dict[str, int], n_words: int) -> array:
+    """Summed counts by word ID of one count file (case variants merged)."""
+    totals = array("q", bytes(8 * n_words))
+    with open(path, "r") as f:
+        for lines in _chunks(f):
+            for line in lines:
+                word, sep, count = line.rpartition(",")
+                if not sep:
+                    continue
+                i = ids.get(word.strip().lower())
+                if i is None:
+                    continue
+                try:
+                    totals[i] += int(count)
+                except ValueError:  # header or malformed row
+                    continue
+    return totals
+
+
+def _source_stamp(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _empty_state(digest: str) -> Dict:
+    return {"version": STATE_VERSION, "words": digest, "sources": {}}
+
+
+def load_state(path: str, digest: str) -> Dict:
+    """Saved per-source totals, or an empty state if missing or for another word list."""
+    try:
+        with open(path, "r") as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return _empty_state(digest)
+    if state.get("version") != STATE_VERSION or state.get("words") != digest:
+        return _empty_state(digest)
+    return state
+
+
+def build(
+    sources: List[str],
+    words: List[str],
+    output: str = OUTPUT,
+    state_file: Optional[str] = None,
+    rebuild: bool = False,
+    verbose: bool = False,
+) -> int:
+    """
+    Update `output` from the counts in `sources` plus the sources recorded in the state;
+    returns rows written.
+    """
+    ids: Dict[str, int] = {}
+    for i, w in enumerate(words):
+        ids.setdefault(w, i)
+    digest = wordlist.list_digest(words).hex()
+    state_file = state_file or state_path(output)
+    state = _empty_state(digest) if rebuild else load_state(state_file, digest)
+
+    given = {os.path.abspath(path) for path in sources}
+    recorded = []
+    for key in list(state["sources"]):
+        if key in given:
+            continue
+        if os.path.exists(key):
+            recorded.append(key)
+        else:  # a removed source must not keep counting
+            del state["sources"][key]
+            if verbose:
+                print(f"{key}: gone, dropped from the totals", file=sys.stderr)
+
+    for path in list(sources) + recorded:
+        key = os.path.abspath(path)
+        stamp = _source_stamp(path)
+        entry = state["sources"].get(key)
+        if entry is not None and entry["stamp"] == stamp:
+            if verbose:
+                print(f"{path}: unchanged, skipped", file=sys.stderr)
+            continue
+        counts = count_file(path, ids, len(words))
+        state["sources"][key] = {
+            "stamp": stamp,
+            "counts": {words[i]: c for i, c in enumerate(counts) if c},
+        }
+        if verbose:
+            print(f"{path}: {sum(1 for c in counts if c)} words counted", file=sys.stderr)
+
+    totals = array("q", bytes(8 * len(words)))
+    for entry in state["sources"].values():
+        for word, c in entry["counts"].items():
+            totals[ids[word]] += c
+    max_val = max(totals, default=0)
+    rows = ["word,frequency\n"]
+    if max_val > 0:
+        rows.extend(
+            f"{w},{totals[i] / max_val:.12f}\n"
+            for i, w in enumerate(words)
+            if totals[i] > 0 and ids[w] == i
+        )
+    _write_atomic(output, "".join(rows))
+    _write_atomic(state_file, json.dumps(state, separators=(",", ":")))
+    return len(rows) - 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build word_frequencies.csv from word count files."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        help="word,count files to add (default: combined_counts.csv on a fresh build)",
+    )
+    parser.add_argument("--words", default="fives.txt", help="word list (default: fives.txt)")
+    parser.add_argument("-o", "--output", default=OUTPUT, help=f"output CSV (default: {OUTPUT})")
+    parser.add_argument("--state", help="state file (default: next to the output)")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="ignore saved totals and rescan the sources"
+    )
+    args = parser.parse_args(argv)
+
+    words = wordlist.load_words(args.words)
+    sources = args.sources
+    if not sources and (args.rebuild or not os.path.exists(args.state or state_path(args.output))):
+        sources = DEFAULT_SOURCES
+    try:
+        n = build(sources, words, args.output, args.state, args.rebuild, verbose=True)
+    except FileNotFoundError as e:
+        print(f"Could not open '{e.filename}'.", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {n} words -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Bitset index over a word list for constraint filtering.
+- Bit i of every mask stands for words[i]; masks are plain Python ints.
+- One mask per (position, letter) and per (letter, at-least-k copies).
+- The constraints from build_constraints become a handful of AND / AND-NOT operations.
+"""
+
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class CandidateIndex:
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.size = len(words)
+        self.all = (1 << self.size) - 1
+        self.at: Dict[Tuple[int, str], int] = {}  # (pos, ch) -> words with ch at pos
+        self.at_least: Dict[Tuple[str, int], int] = {}  # (ch, k) -> words with >= k ch
+        for i, w in enumerate(words):
+            bit = 1 << i
+            for pos, ch in enumerate(w):
+                self.at[(pos, ch)] = self.at.get((pos, ch), 0) | bit
+            for ch, c in Counter(w).items():
+                for k in range(1, c + 1):
+                    self.at_least[(ch, k)] = self.at_least.get((ch, k), 0) | bit
+
+    def mask_for(
+        self,
+        greens: Dict[int, str],
+        yellows_not_here: Dict[str, Set[int]],
+        min_counts: Counter,
+        max_counts: Dict[str, int],
+        globally_excluded: Set[str],
+    ) -> int:
+        """Mask of the words accepted by candidate_ok under these constraints."""
+        at, at_least = self.at, self.at_least
+        mask = self.all
+        for ch in globally_excluded:
+            mask &= ~at_least.get((ch, 1), 0)
+        for pos, ch in greens.items():
+            mask &= at.get((pos, ch), 0)
+        for ch, needed in min_counts.items():
+            if needed > 0:
+                mask &= at_least.get((ch, needed), 0)
+        for ch, ub in max_counts.items():
+            mask &= ~at_least.get((ch, ub + 1), 0)
+        for ch, bad_positions in yellows_not_here.items():
+            for bp in bad_positions:
+                mask &= ~at.get((bp, ch), 0)
+        return mask
+
+    def words_of(self, mask: int) -> List[str]:
+        """Words whose bits are set in `mask`, in word-list order."""
+        words = self.words
+        bits = bin(mask)[:1:-1]  # least significant bit first
+        out = []
+        i = bits.find("1")
+        while i >= 0:
+            out.append(words[i])
+            i = bits.find("1", i + 1)
+        return out
+
+
+# Indexes of the long-lived word lists (the full guess / answer lists), keyed by list
+# identity. A list only gets one through register(): filter_candidates scans any other
+# list directly, so a turn's freshly built candidate list never pays for an index it
+# would use once. The list object is kept alongside so its id cannot be reused while
+# registered; callers are expected not to mutate a registered list.
+_REGISTERED: "OrderedDict[int, Tuple[List[str], int, CandidateIndex]]" = OrderedDict()
+_MAX_REGISTERED = 8
+
+
+def registered(words: List[str]) -> Optional[CandidateIndex]:
+    """The index of `words` if that list was registered (and has not changed), else None."""
+    entry = _REGISTERED.get(id(words))
+    if entry is None or entry[0] is not words or entry[1] != len(words):
+        return None
+    _REGISTERED.move_to_end(id(words))
+    return entry[2]
+
+
+def register(words: List[str]) -> CandidateIndex:
+    """Index `words` for filtering (once per list); the least recently used list is dropped."""
+    index = registered(words)
+    if index is None:
+        index = CandidateIndex(words)
+        _REGISTERED[id(words)] = (words, len(words), index)
+        while len(_REGISTERED) > _MAX_REGISTERED:
+            _REGISTERED.popitem(last=False)
+    return index
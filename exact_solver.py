@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Exact minimum-expected-guesses decision trees.
+- Memoized depth-first branch-and-bound over pattern partitions of the answer set.
+- Admissible lower bound: at most one answer is solved by the current guess and each
+  earlier guess can split into at most 3**L - 2 non-green buckets, so n answers need at
+  least 2n - 1 guesses in total (more once n outgrows a level).
+- Guesses are tried in descending entropy order; guesses that induce the same partition
+  are only expanded once.
+- A node/time budget stops the search: the rest of the tree is completed greedily
+  (max entropy) and the best tree found so far is returned with optimal=False.
+- Feedback semantics are those of new_advanced_solver (via the pattern matrix builder).
+
+Usage:
+  python exact_solver.py [--answers N] [--seed S] [--depth D] [--nodes N] [--seconds T]
+                         [--guess-limit K] [--answers-only] [--out TREE]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import new_advanced_solver as solver
+import pattern_matrix
+import wordlist
+from strategy_tree import StrategyTree, answers_key
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback
+    np = None
+
+INF = math.inf
+
+# (guess index, {pattern code: subtree}); a leaf is (guess index, {}) where the guess is the answer
+Tree = Tuple[int, Dict[int, "Tree"]]
+
+
+class SolveResult(NamedTuple):
+    total_guesses: float  # summed over answers; inf if no tree fits in max_depth
+    expected_guesses: float
+    tree: Optional[Tree]
+    optimal: bool  # False if the budget ran out (tree is then the best found so far)
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ExactSolver:
+    def __init__(
+        self,
+        answers: Sequence[str],
+        guesses: Sequence[str],
+        max_depth: int = 6,
+        node_budget: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        guess_limit: Optional[int] = None,
+    ):
+        # every answer must be guessable; keep the caller's guess order first
+        extra = [a for a in answers if a not in set(guesses)]
+        self.answers = list(answers)
+        self.guesses = list(guesses) + extra
+        gidx = {g: i for i, g in enumerate(self.guesses)}
+        self.answer_guess = [gidx[a] for a in self.answers]
+        self.max_depth = max_depth
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.guess_limit = guess_limit
+        length = len(self.answers[0]) if self.answers else 5
+        self.green = solver.all_green_code(length)
+        self.branching = 3**length - 2  # non-green buckets a guess can produce
+        data = pattern_matrix.build_pattern_matrix(self.guesses, self.answers)
+        n_a = len(self.answers)
+        if np is not None:
+            dtype = pattern_matrix.code_dtype(length)
+            self.rows = np.frombuffer(bytes(data), dtype=dtype).reshape(-1, n_a)
+        else:
+            codes = memoryview(data).cast(pattern_matrix.code_typecode(length))
+            self.rows = [codes[i * n_a : (i + 1) * n_a] for i in range(len(self.guesses))]
+        self._exact: Dict[Tuple[Tuple[int, ...], int], Tuple[float, Tree]] = {}
+        self._lower: Dict[Tuple[Tuple[int, ...], int], float] = {}
+        self.nodes = 0
+        self._deadline = INF
+        self.exhausted = False
+
+    # ---------- bounds ----------
+
+    def lower_bound(self, n: int, depth: int) -> float:
+        """Fewest total guesses that could solve n answers within `depth` guesses."""
+        total, placed, level_cap, level = 0, 0, 1, 1
+        while placed < n:
+            if level > depth:
+                return INF
+            take = min(level_cap, n - placed)
+            total += take * level
+            placed += take
+            level_cap = self.branching if level == 1 else level_cap * self.branching
+            level += 1
+        return total
+
+    # ---------- partitions ----------
+
+    def _order(self, S: Tuple[int, ...], depth: int) -> List[Tuple[int, float]]:
+        """
+        (guess index, lower bound on the total with that guess) for guesses worth trying on
+        answer set S with `depth` guesses left, best entropy first. Bounds come from bucket
+        sizes alone, so hopeless guesses are dropped before any partition is built.
+        """
+        n = len(S)
+        in_set = {self.answer_guess[a] for a in S}
+        bound = [self.lower_bound(c, depth - 1) for c in range(n + 1)]
+        bound[0] = 0
+        if np is not None:
+            # bucket sizes per guess as run lengths of its sorted codes (sparse: O(G*n))
+            sub = np.sort(self.rows[:, list(S)], axis=1)
+            g = sub.shape[0]
+            starts = np.ones(sub.shape, dtype=bool)
+            starts[:, 1:] = sub[:, 1:] != sub[:, :-1]
+            first = np.flatnonzero(starts.ravel())
+            sizes = np.diff(np.append(first, g * n))
+            row = first // n
+            codes = sub.ravel()[first]
+            plogp = sizes * np.log2(sizes)
+            ent = math.log2(n) - np.bincount(row, weights=plogp, minlength=g) / n
+            n_buckets = np.bincount(row, minlength=g)
+            size_lb = np.asarray(bound, dtype=np.float64)[sizes]
+            size_lb[codes == self.green] = 0.0
+            lbs = n + np.bincount(row, weights=size_lb, minlength=g)
+            scored = [
+                (-e, gi not in in_set, gi, lb)
+                for gi, (e, nb, lb) in enumerate(
+                    zip(ent.tolist(), n_buckets.tolist(), lbs.tolist())
+                )
+                if (nb > 1 or gi in in_set) and lb < INF
+            ]
+        else:
+            scored = []
+            for gi, row in enumerate(self.rows):
+                counts: Dict[int, int] = {}
+                for a in S:
+                    counts[row[a]] = counts.get(row[a], 0) + 1
+                if len(counts) > 1 or gi in in_set:
+                    e = -sum(c / n * math.log2(c / n) for c in counts.values())
+                    lb = n + sum(bound[c] for code, c in counts.items() if code != self.green)
+                    if lb < INF:
+                        scored.append((-e, gi not in in_set, gi, lb))
+        scored.sort()
+        order = [(gi, lb) for _, _, gi, lb in scored]
+        if self.guess_limit is not None:
+            order = order[: self.guess_limit]
+        return order
+
+    def _partition(self, gi: int, S: Tuple[int, ...]) -> Dict[int, Tuple[int, ...]]:
+        """Non-green buckets of S under guess gi (each bucket keeps S's order)."""
+        row = self.rows[gi]
+        buckets: Dict[int, List[int]] = {}
+        for a in S:
+            code = int(row[a])
+            if code != self.green:
+                buckets.setdefault(code, []).append(a)
+        return {c: tuple(b) for c, b in buckets.items()}
+
+    # ---------- search ----------
+
+    def _out_of_budget(self) -> bool:
+        if not self.exhausted and (
+            (self.node_budget is not None and self.nodes >= self.node_budget)
+            or time.perf_counter() > self._deadline
+        ):
+            self.exhausted = True
+        return self.exhausted
+
+    def _small(self, S: Tuple[int, ...], depth: int) -> Optional[Tuple[float, Tree]]:
+        """Closed forms for 1- and 2-answer sets."""
+        if len(S) == 1:
+            return 1.0, (self.answer_guess[S[0]], {})
+        if len(S) == 2 and depth >= 2:
+            first, second = S
+            gi = self.answer_guess[first]
+            return 3.0, (gi, {int(self.rows[gi][second]): (self.answer_guess[second], {})})
+        return None
+
+    def _greedy(self, S: Tuple[int, ...], depth: int) -> Tuple[float, Optional[Tree]]:
+        """Max-entropy completion used once the budget is spent."""
+        if depth <= 0:
+            return INF, None
+        small = self._small(S, depth)
+        if small is not None:
+            return small
+        for gi, _ in self._order(S, depth)[:1]:
+            total, children = float(len(S)), {}
+            for code, bucket in self._partition(gi, S).items():
+                cost, sub = self._greedy(bucket, depth - 1)
+                if cost == INF:
+                    return INF, None
+                total += cost
+                children[code] = sub
+            return total, (gi, children)
+        return INF, None
+
+    def _solve(
+        self, S: Tuple[int, ...], depth: int, beta: float
+    ) -> Tuple[float, Optional[Tree]]:
+        """
+        Cheapest tree for S within `depth` guesses. If it costs >= beta the search may stop
+        early and return (a lower bound >= beta, None).
+        """
+        n = len(S)
+        if depth <= 0:
+            return INF, None
+        small = self._small(S, depth)
+        if small is not None:
+            return small
+        key = (S, depth)
+        hit = self._exact.get(key)
+        if hit is not None:
+            return hit
+        lb = max(self.lower_bound(n, depth), self._lower.get(key, 0.0))
+        if lb >= beta or lb == INF:
+            return lb, None
+        if self._out_of_budget():
+            return self._greedy(S, depth)
+        self.nodes += 1
+
+        best, best_tree = INF, None
+        seen_partitions = set()
+        for gi, guess_lb in self._order(S, depth):
+            cap = min(best, beta)
+            if guess_lb >= cap:
+                continue
+            buckets = self._partition(gi, S)
+            signature = frozenset(buckets.values())
+            if signature in seen_partitions:
+                continue
+            seen_partitions.add(signature)
+            bounds = {
+                c: max(
+                    self.lower_bound(len(b), depth - 1),
+                    self._lower.get((b, depth - 1), 0.0),
+                )
+                for c, b in buckets.items()
+            }
+            remaining = sum(bounds.values())
+            if n + remaining >= cap:
+                continue
+            total, children = float(n), {}
+            for code in sorted(buckets, key=lambda c: -len(buckets[c])):
+                remaining -= bounds[code]
+                limit = cap - total - remaining
+                cost, sub = self._solve(buckets[code], depth - 1, limit)
+                if sub is None or cost >= limit:
+                    total = INF
+                    break
+                total += cost
+                children[code] = sub
+            if total < best:
+                best, best_tree = total, (gi, children)
+
+        if not self.exhausted:
+            if best_tree is not None and best < beta:
+                self._exact[key] = (best, best_tree)
+            else:
+                self._lower[key] = max(self._lower.get(key, 0.0), min(beta, INF))
+        return best, best_tree
+
+    def solve(self) -> SolveResult:
+        self.nodes = 0
+        self.exhausted = False
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget if self.time_budget else INF
+        S = tuple(range(len(self.answers)))
+        total, tree = self._solve(S, self.max_depth, INF)
+        elapsed = time.perf_counter() - start
+        n = max(len(self.answers), 1)
+        return SolveResult(
+            total, total / n, tree, not self.exhausted, self.nodes, elapsed
+        )
+
+    def to_strategy_tree(self, tree: Tree) -> StrategyTree:
+        """Convert a solved tree into a StrategyTree for storage and replay."""
+        node_guess: List[int] = []
+        node_edges: List[List[Tuple[int, int]]] = []
+
+        def add(t: Tree) -> int:
+            gi, children = t
+            node = len(node_guess)
+            node_guess.append(gi)
+            edges: List[Tuple[int, int]] = []
+            node_edges.append(edges)
+            for code in sorted(children):
+                edges.append((code, add(children[code])))
+            return node
+
+        add(tree)
+        edge_start, edge_code, edge_child = array("i", [0]), array("H"), array("i")
+        for edges in node_edges:
+            for code, child in edges:
+                edge_code.append(code)
+                edge_child.append(child)
+            edge_start.append(len(edge_code))
+        return StrategyTree(
+            self.guesses,
+            array("i", node_guess),
+            edge_start,
+            edge_code,
+            edge_child,
+            max_guesses=self.max_depth,
+            answers_key=answers_key(self.answers),
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Minimum-expected-guesses decision tree by branch and bound."
+    )
+    parser.add_argument("--answers", type=int, default=100, help="random answers from fives.txt (0 = all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--depth", type=int, default=6, help="max guesses per game")
+    parser.add_argument("--nodes", type=int, default=None, help="node budget")
+    parser.add_argument("--seconds", type=float, default=None, help="time budget")
+    parser.add_argument("--guess-limit", type=int, default=None, help="top-k guesses per node (by entropy)")
+    parser.add_argument("--answers-only", action="store_true", help="only guess possible answers")
+    parser.add_argument("--out", help="save the tree as a strategy_tree file")
+    args = parser.parse_args(argv)
+
+    words = wordlist.load_words("fives.txt")
+    answers = words
+    if args.answers:
+        answers = sorted(random.Random(args.seed).sample(words, args.answers))
+    guesses = answers if args.answers_only else words
+
+    es = ExactSolver(
+        answers,
+        guesses,
+        max_depth=args.depth,
+        node_budget=args.nodes,
+        time_budget=args.seconds,
+        guess_limit=args.guess_limit,
+    )
+    res = es.solve()
+    if res.tree is None:
+        verdict = "proved infeasible" if res.optimal else "none found within budget"
+        print(f"No tree within {args.depth} guesses ({verdict}).")
+    else:
+        status = "optimal" if res.optimal else "best found (budget exhausted)"
+        print(f"First guess: {es.guesses[res.tree[0]]}")
+        print(
+            f"Expected guesses: {res.expected_guesses:.5f}  (total {int(res.total_guesses)}, {status})"
+        )
+        if args.out:
+            es.to_strategy_tree(res.tree).save(args.out)
+            print(f"Saved tree -> {args.out}")
+    print(
+        f"Nodes: {res.nodes}  in {res.elapsed:.2f}s  ({res.nodes_per_second:.0f} nodes/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
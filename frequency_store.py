@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Load-once letter and word frequency tables for the advanced_solver scoring.
+- total.json (overall letter counts) and word_frequencies.csv are read once per process;
+  letter counts are normalized by their maximum, as advanced_solver always did. These are
+  the only copies of the scoring formulas.
+- For one word list the letter score (sort_words) and letter + word-frequency score
+  (sort_words2) of every word are precomputed into arrays indexed by word ID; words
+  outside the list are scored on the fly with the same formulas.
+- top() fuses filter -> score -> top-k: the words that pass a predicate stream straight
+  into heapq.nlargest (counted on the way) in one scan of the list, and come out in exactly
+  the order a full stable sort by descending score would give.
+
+Usage:
+  python frequency_store.py [WORD ...]     # scores of the given words (default: top 10)
+"""
+
+import heapq
+import json
+import sys
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import wordlist
+
+TOTAL_PATH = "total.json"
+WORD_FREQ_PATH = "word_frequencies.csv"
+UNIQUE_BONUS = 0.20  # letter score bonus for words without repeated letters
+WORD_FREQ_WEIGHT = 1e2
+
+LETTERS = "letters"  # sort_words: normalized letter frequencies
+COMBINED = "combined"  # sort_words2: letters + weighted word frequency
+
+
+def _normalized_letters(path: str) -> Dict[str, float]:
+    with open(path, "r") as f:
+        counts = json.load(f)["letters"]
+    max_val = max(counts.values())
+    return {k: v / max_val for k, v in counts.items()}
+
+
+def _read_word_freq(path: str) -> Dict[str, float]:
+    """word -> frequency; a word listed twice keeps its last value."""
+    with open(path, "r") as f:
+        next(f, None)  # header
+        freq = {}
+        for line in f:
+            word, _, value = line.rstrip("\r\n").partition(",")
+            if value:
+                freq[word] = float(value)
+    return freq
+
+
+class FrequencyStore:
+    def __init__(
+        self,
+        words: Sequence[str],
+        letter_freq: Dict[str, float],
+        word_freq: Dict[str, float],
+    ):
+        self.words = list(words)
+        self.letter_freq = letter_freq
+        self.word_freq = word_freq
+        self.ids: Dict[str, int] = {}
+        for i, w in enumerate(self.words):
+            self.ids.setdefault(w, i)
+        self.tables: Dict[str, array] = {
+            LETTERS: array("d", (self.letter_score(w) for w in self.words)),
+            COMBINED: array("d", (self.combined_score(w) for w in self.words)),
+        }
+
+    @classmethod
+    def load(
+        cls,
+        words: Sequence[str],
+        total_path: str = TOTAL_PATH,
+        word_freq_path: str = WORD_FREQ_PATH,
+    ) -> "FrequencyStore":
+        return cls(words, _normalized_letters(total_path), _read_word_freq(word_freq_path))
+
+    # -- formulas (advanced_solver's original score_word / score_word2, bit for bit)
+
+    def letter_score(self, word: str) -> float:
+        lfreq = self.letter_freq
+        return sum(lfreq.get(letter, 0) for letter in word) * (
+            1 + UNIQUE_BONUS * (len(set(word)) == 5)
+        )
+
+    def combined_score(self, word: str) -> float:
+        return self.letter_score(word) + WORD_FREQ_WEIGHT * self.word_freq.get(word, 0)
+
+    # -- lookups by word ID
+
+    def id_of(self, word: str) -> int:
+        return self.ids.get(word, -1)
+
+    def score(self, word: str, table: str = COMBINED) -> float:
+        i = self.ids.get(word)
+        if i is not None:
+            return self.tables[table][i]
+        return self.combined_score(word) if table == COMBINED else self.letter_score(word)
+
+    def key(self, table: str = COMBINED, then: Optional[str] = None) -> Callable:
+        """
+        word -> score, for sorted() / heapq; with `then`, word -> (score, tie-break score),
+        i.e. the order of sorting by `then` first and stably by `table` afterwards.
+        """
+        ids, values = self.ids, self.tables[table]
+        if then is None:
+            def key(word: str) -> float:
+                i = ids.get(word)
+                return values[i] if i is not None else self.score(word, table)
+
+            return key
+        second = self.tables[then]
+
+        def key2(word: str) -> Tuple[float, float]:
+            i = ids.get(word)
+            if i is None:
+                return self.score(word, table), self.score(word, then)
+            return values[i], second[i]
+
+        return key2
+
+    def sort(
+        self, words: Iterable[str], table: str = COMBINED, then: Optional[str] = None
+    ) -> List[str]:
+        """Words by descending score (stable: ties keep their input order)."""
+        return sorted(words, key=self.key(table, then), reverse=True)
+
+    def top(
+        self,
+        words: Iterable[str],
+        k: Optional[int],
+        keep: Optional[Callable[[str], bool]] = None,
+        table: str = COMBINED,
+        then: Optional[str] = None,
+    ) -> Tuple[List[str], int]:
+        """
+        (the k best words that pass `keep`, how many passed), best first; the same words
+        and order as sort(filter(keep, words), table, then)[:k]. k=None keeps them all.
+        """
+        kept = 0
+
+        def passing() -> Iterator[str]:
+            nonlocal kept
+            for w in words:
+                if keep is None or keep(w):
+                    kept += 1
+                    yield w
+
+        if k is None:
+            best = self.sort(passing(), table, then)
+        else:
+            # nlargest keeps the earliest of equal scores, like the stable sort
+            best = heapq.nlargest(k, passing(), key=self.key(table, then))
+        return best, kept
+
+
+_STORES: Dict[Tuple[str, Optional[int]], FrequencyStore] = {}
+
+
+def get_store(text_path: str = "fives.txt", length: Optional[int] = 5) -> FrequencyStore:
+    """The store for a word list, loaded on first use and shared afterwards."""
+    store = _STORES.get((text_path, length))
+    if store is None:
+        words = wordlist.load_words(text_path, length)
+        store = _STORES[(text_path, length)] = FrequencyStore.load(words)
+    return store
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    store = get_store()
+    words = [w.lower() for w in argv] or store.top(store.words, 10)[0]
+    print(f"{'word':8} {'letters':>9} {'combined':>9}")
+    for w in words:
+        print(f"{w:8} {store.score(w, LETTERS):9.4f} {store.score(w):9.4f}")
+
+
+if __name__ == "__main__":
+    main()
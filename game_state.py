@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Compact incremental game state for simulations and tree searches.
+- The candidate set is a single bitmask over a CandidateIndex (see candidate_index.py).
+- Each (guess, feedback code) narrows only the current set by that turn's constraints,
+  which over a real game gives the same candidates as solvable_words on the full history.
+- Per-turn masks and history live in tuples, so copy() and snapshot() are O(1)
+  and undo() just drops the last turn.
+"""
+
+from typing import List, Optional, Tuple
+
+import candidate_index
+import new_advanced_solver as solver
+
+
+class GameState:
+    __slots__ = ("index", "masks", "history", "_cand_mask", "_cands")
+
+    def __init__(self, words: List[str], mask: Optional[int] = None):
+        self.index = candidate_index.register(words)
+        self.masks: Tuple[int, ...] = (self.index.all if mask is None else mask,)
+        self.history: Tuple[Tuple[str, int], ...] = ()
+        self._cand_mask = -1
+        self._cands: List[str] = []
+
+    @property
+    def mask(self) -> int:
+        return self.masks[-1]
+
+    @property
+    def turn(self) -> int:
+        return len(self.history)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def apply(self, guess: str, code: int) -> int:
+        """Record feedback `code` for `guess`; returns the number of candidates left."""
+        narrowed = self.mask & self.index.mask_for(*solver.turn_constraints(guess, code))
+        self.masks += (narrowed,)
+        self.history += ((guess, code),)
+        return narrowed.bit_count()
+
+    def undo(self) -> None:
+        if not self.history:
+            raise IndexError("undo with no turns played")
+        self.masks = self.masks[:-1]
+        self.history = self.history[:-1]
+
+    def snapshot(self) -> Tuple[Tuple[int, ...], Tuple[Tuple[str, int], ...]]:
+        return self.masks, self.history
+
+    def restore(self, snap: Tuple[Tuple[int, ...], Tuple[Tuple[str, int], ...]]) -> None:
+        self.masks, self.history = snap
+
+    def copy(self) -> "GameState":
+        other = GameState.__new__(GameState)
+        other.index = self.index
+        other.masks = self.masks
+        other.history = self.history
+        other._cand_mask = self._cand_mask
+        other._cands = self._cands
+        return other
+
+    def candidates(self) -> List[str]:
+        """Current candidates in word-list order (decoded once per distinct set)."""
+        mask = self.mask
+        if mask != self._cand_mask:
+            self._cands = self.index.words_of(mask)
+            self._cand_mask = mask
+        return self._cands
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Memo cache for best-guess picks.
+- Keyed on a fingerprint of the candidate list plus the strategy parameters
+  (which picker, prefer_entropy, fingerprint of the guess list).
+- Bounded size with LRU eviction; hit/miss counters for reporting.
+- Optionally persisted to a JSON file between runs.
+
+The candidate fingerprint covers the list in the order given: the pickers break ties by
+position, so the same set in another order may legitimately pick another word.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+VERSION = 1
+
+Key = Tuple[str, str, str]
+
+
+def fingerprint(words: List[str]) -> str:
+    return hashlib.blake2b("\n".join(words).encode(), digest_size=16).hexdigest()
+
+
+class GuessCache:
+    def __init__(self, max_size: int = 100_000, path: Optional[str] = None):
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Key, str]" = OrderedDict()
+        # guess lists are usually the same list object on every call: hash it once
+        self._list_fps: Dict[int, Tuple[List[str], int, str]] = {}
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _list_fingerprint(self, words: List[str]) -> str:
+        entry = self._list_fps.get(id(words))
+        if entry is not None and entry[0] is words and entry[1] == len(words):
+            return entry[2]
+        fp = fingerprint(words)
+        if len(self._list_fps) >= 8:
+            self._list_fps.clear()
+        self._list_fps[id(words)] = (words, len(words), fp)
+        return fp
+
+    def key(self, tag: str, guess_list: Optional[List[str]], candidates: List[str]) -> Key:
+        """tag encodes the picker and its parameters; guess_list None means 'the candidates'."""
+        glf = "" if guess_list is None else self._list_fingerprint(guess_list)
+        return tag, glf, fingerprint(candidates)
+
+    def get(self, key: Key) -> Optional[str]:
+        guess = self._entries.get(key)
+        if guess is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return guess
+
+    def put(self, key: Key, guess: str) -> None:
+        self._entries[key] = guess
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(
+        self,
+        tag: str,
+        guess_list: Optional[List[str]],
+        candidates: List[str],
+        compute: Callable[[], str],
+    ) -> str:
+        key = self.key(tag, guess_list, candidates)
+        guess = self.get(key)
+        if guess is None:
+            guess = compute()
+            self.put(key, guess)
+        return guess
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write entries (oldest first, so LRU order survives a reload) atomically."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("no path given for GuessCache.save")
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {"version": VERSION, "entries": [[*k, g] for k, g in self._entries.items()]},
+                f,
+            )
+        os.replace(tmp, path)
+
+    def load(self, path: str) -> None:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != VERSION:
+            return
+        for tag, glf, cfp, guess in data["entries"]:
+            self.put((tag, glf, cfp), guess)
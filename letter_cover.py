@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Bitmask search for k-word sets that cover the alphabet (the octordle opener scripts).
+- Every word is a 26-bit letter mask.
+- Depth-first search in the style of Algorithm X: each node resolves the unresolved
+  letter with the fewest candidate words, either by choosing the set's first word that
+  contains it or, while the miss budget (26 - target) lasts, by leaving it uncovered
+  (which drops every word containing it). Each set is reached exactly once.
+- Pruning: the free slots need enough candidates, and the letters they can still add
+  (all reachable letters, at most slots * the best word's new letters) must make the
+  target. A word that overlaps the set adds fewer letters, so for target = 5k (25 with
+  five words) the bound only admits pairwise-disjoint sets.
+- Fixed words are placed up front; the free slots can be limited to a pool of words.
+- LetterClasses groups words with the same letter set (anagrams). Searching over one
+  representative per class and expanding the results back to every concrete word
+  combination avoids re-exploring identical branches. A set never uses two words of
+  one class: they would add no letters.
+
+Usage:
+  python letter_cover.py [-k 5] [--target 25] [--fixed WORD ...] [--single-vowel]
+                         [--words uniques.txt] [--limit N]
+"""
+
+import argparse
+import heapq
+import json
+from itertools import combinations, product
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import wordlist
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+FULL_MASK = (1 << 26) - 1
+VOWELS = "aeiouy"
+
+
+def letter_mask(word: str) -> int:
+    mask = 0
+    for ch in word:
+        mask |= 1 << (ord(ch) - 97)
+    return mask
+
+
+def mask_letters(mask: int) -> str:
+    return "".join(ch for i, ch in enumerate(ALPHABET) if mask >> i & 1)
+
+
+def missing_letters(words: Iterable[str]) -> List[str]:
+    covered = 0
+    for w in words:
+        covered |= letter_mask(w)
+    return list(mask_letters(FULL_MASK & ~covered))
+
+
+def has_one_vowel(word: str) -> bool:
+    return sum(1 for letter in word if letter in VOWELS) == 1
+
+
+class CoverSearch:
+    def __init__(self, words: Sequence[str]):
+        self.words = list(words)
+        self.masks = [letter_mask(w) for w in self.words]
+        self.letters = [[i for i in range(26) if m >> i & 1] for m in self.masks]
+        self.nodes = 0
+
+    def search(
+        self,
+        k: int,
+        target: int = 25,
+        fixed: Sequence[str] = (),
+        pool: Optional[Iterable[int]] = None,
+    ) -> Iterator[Tuple[str, ...]]:
+        """
+        Every set of k words covering at least `target` letters that contains `fixed`.
+        The other words come from `pool` (word IDs; default: all). Each set is yielded
+        once, as the fixed words followed by the rest in word-list order.
+        """
+        for found in self.search_ids(k, target, fixed, pool):
+            yield tuple(fixed) + tuple(self.words[i] for i in found)
+
+    def search_ids(
+        self,
+        k: int,
+        target: int = 25,
+        fixed: Sequence[str] = (),
+        pool: Optional[Iterable[int]] = None,
+    ) -> Iterator[List[int]]:
+        """As search, but yields the IDs of the non-fixed words, ascending."""
+        covered = 0
+        for w in fixed:
+            covered |= letter_mask(w)
+        free = k - len(fixed)
+        if free < 0:
+            return
+        ids = range(len(self.words)) if pool is None else pool
+        cands = [i for i in ids if self.words[i] not in fixed]
+        chosen: List[int] = []
+        for found in self._dfs(covered, 0, cands, free, target, chosen):
+            yield sorted(found)
+
+    def _dfs(
+        self,
+        covered: int,
+        skipped: int,
+        cands: List[int],
+        free: int,
+        target: int,
+        chosen: List[int],
+    ) -> Iterator[List[int]]:
+        self.nodes += 1
+        n_covered = covered.bit_count()
+        if free == 0:
+            if n_covered >= target:
+                yield list(chosen)
+            return
+        if len(cands) < free:
+            return
+        masks, letters = self.masks, self.letters
+        new = [(masks[i] & ~covered).bit_count() for i in cands]
+        top = heapq.nlargest(free, new)
+        if n_covered + sum(top) < target:
+            return
+        # a word is only usable if, with the best possible words in the other free slots,
+        # it still reaches the target (with target = 5k: only words disjoint from the set)
+        need = target - n_covered - sum(top[: free - 1])
+        if need > 0:
+            cands = [i for i, n in zip(cands, new) if n >= need]
+            if len(cands) < free:
+                return
+        reach = 0
+        counts = [0] * 26
+        for i in cands:
+            reach |= masks[i]
+            for b in letters[i]:
+                counts[b] += 1
+        # the free slots cannot add letters no remaining word has
+        if n_covered + (reach & ~covered).bit_count() < target:
+            return
+        resolved = covered | skipped
+        best, best_count = -1, len(cands) + 1
+        for b in range(26):
+            if not resolved >> b & 1 and counts[b] < best_count:
+                best, best_count = b, counts[b]
+        if best < 0:  # every letter covered or skipped: any free words complete the set
+            for rest in combinations(cands, free):
+                yield chosen + list(rest)
+            return
+        bit = 1 << best
+        with_b = [i for i in cands if masks[i] & bit]
+        others = [i for i in cands if not masks[i] & bit]
+        # branch j: with_b[j] is the set's first word containing the letter, so the
+        # earlier ones are left out of its subtree and no set is reached twice
+        for j, i in enumerate(with_b):
+            chosen.append(i)
+            yield from self._dfs(
+                covered | masks[i], skipped, others + with_b[j + 1 :], free - 1, target, chosen
+            )
+            chosen.pop()
+        # or no word of the set contains the letter
+        if (skipped | bit).bit_count() <= 26 - target:
+            yield from self._dfs(covered, skipped | bit, others, free, target, chosen)
+
+    def max_cover(
+        self, k: int, fixed: Sequence[str] = (), pool: Optional[Sequence[int]] = None
+    ) -> int:
+        """The most letters any such k-word set covers (0 if there is none)."""
+        for target in range(26, 0, -1):
+            if next(self.search(k, target, fixed, pool), None) is not None:
+                return target
+        return 0
+
+
+class LetterClasses:
+    """Words grouped by letter set; class IDs follow the first appearance in the list."""
+
+    def __init__(self, words: Sequence[str]):
+        self.words = list(words)
+        self.masks: List[int] = []  # class id -> letter mask
+        self.members: List[List[int]] = []  # class id -> word ids, ascending
+        self.class_of: List[int] = []  # word id -> class id
+        by_mask: Dict[int, int] = {}
+        for i, w in enumerate(self.words):
+            m = letter_mask(w)
+            c = by_mask.get(m)
+            if c is None:
+                c = by_mask[m] = len(self.masks)
+                self.masks.append(m)
+                self.members.append([])
+            self.members[c].append(i)
+            self.class_of.append(c)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def representatives(self) -> List[str]:
+        """One word per class (its first), indexed by class ID: the words to search over."""
+        return [self.words[m[0]] for m in self.members]
+
+    def expand(self, class_ids: Sequence[int], after: int = -1) -> Iterator[Tuple[str, ...]]:
+        """Every word combination with one member (word id > `after`) of each class."""
+        choices = [[i for i in self.members[c] if i > after] for c in class_ids]
+        for ids in product(*choices):
+            yield tuple(self.words[i] for i in sorted(ids))
+
+    def first_expansion(self, class_ids: Sequence[int], after: int = -1) -> Optional[List[int]]:
+        """
+        The combination expand() would put first in list order (the earliest member after
+        `after` of each class), as ascending word ids; None if some class has none.
+        """
+        ids = []
+        for c in class_ids:
+            i = next((i for i in self.members[c] if i > after), None)
+            if i is None:
+                return None
+            ids.append(i)
+        return sorted(ids)
+
+
+def rank_by_frequency(
+    combos: List[Tuple[str, ...]], total_path: str = "total.json"
+) -> List[Tuple[str, ...]]:
+    """Combinations by the total.json counts of the letters they cover, highest first (stable)."""
+    with open(total_path) as f:
+        counts = json.load(f)["letters"]
+    return sorted(combos, key=lambda x: sum([counts[i] for i in set("".join(x))]), reverse=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Enumerate k-word sets covering the alphabet (all but 26 - target letters)."
+    )
+    parser.add_argument("-k", type=int, default=5, help="words per set (default: 5)")
+    parser.add_argument("--target", type=int, default=25, help="letters covered (default: 25)")
+    parser.add_argument("--fixed", nargs="+", default=[], metavar="WORD", help="words every set uses")
+    parser.add_argument(
+        "--single-vowel",
+        action="store_true",
+        help="fill the free slots with single-vowel words only (as octordle3 does)",
+    )
+    parser.add_argument("--words", default="uniques.txt", help="word list (default: uniques.txt)")
+    parser.add_argument("--limit", type=int, default=0, help="stop after N letter-set classes")
+    args = parser.parse_args(argv)
+
+    classes = LetterClasses(wordlist.load_words(args.words))
+    engine = CoverSearch(classes.representatives())
+    pool = None
+    if args.single_vowel:
+        pool = [c for c, w in enumerate(engine.words) if has_one_vowel(w)]
+    fixed = [w.lower() for w in args.fixed]
+    found = []
+    for class_ids in engine.search_ids(args.k, args.target, fixed, pool):
+        found.append(class_ids)
+        if args.limit and len(found) >= args.limit:
+            break
+    combos = [tuple(fixed) + c for ids in found for c in classes.expand(ids)]
+    for combo in rank_by_frequency(combos):
+        print(f"{combo} Missing: {missing_letters(combo)}")
+    print(
+        f"{len(combos)} set(s) from {len(found)} letter-set combination(s) of {len(classes)} "
+        f"classes ({len(classes.words)} words), {engine.nodes} search nodes"
+    )
+
+
+if __name__ == "__main__":
+    main()
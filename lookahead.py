@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Pruned two-step lookahead guess picker.
+- Step one: score every guess in one batched pass (entropy, or expected remaining) and
+  keep the top k, dropping any that trail the best by more than `margin` (relative).
+- Step two: for each kept guess, every pattern bucket is scored against a pool of
+  follow-up guesses (the top follow_k by one-step score, plus the candidates themselves
+  when there are at most follow_k of them). Bucket statistics come straight from
+  sorted (bucket, code) keys of the pattern matrix, so no candidate lists are built.
+- The pick maximizes entropy after two guesses (or minimizes the expected candidates
+  left after two guesses); ties go to the better one-step score, then list order.
+- Needs NumPy and a pattern matrix covering the words; otherwise pick() returns None and
+  the caller falls back to the one-step picker.
+
+Usage:
+  python lookahead.py [--k K] [--follow-k F] [--margin M] [--expected] [GUESS:PATTERN ...]
+"""
+
+import argparse
+import math
+import time
+from typing import Dict, List, Optional, Sequence
+
+import new_advanced_solver as solver
+import pattern_matrix
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback
+    np = None
+
+
+class Lookahead:
+    def __init__(
+        self,
+        matrix,
+        k: int = 10,
+        follow_k: int = 100,
+        margin: float = 0.1,
+        min_candidates: int = 3,
+        max_candidates: int = 1500,
+    ):
+        self.matrix = matrix
+        self.k = k
+        self.follow_k = follow_k
+        self.margin = margin
+        self.min_candidates = min_candidates
+        self.max_candidates = max_candidates
+        self.calls = 0
+        self.fallbacks = 0
+        self.seconds = 0.0
+
+    @property
+    def tag(self) -> str:
+        """Parameters that change picks, for guess-cache keys."""
+        return f"la:{self.k}:{self.follow_k}:{self.margin}:{self.min_candidates}:{self.max_candidates}"
+
+    def _shortlist(self, score, prefer_entropy: bool, limit: int):
+        """Indices of the `limit` best one-step scores, best first (stable on ties)."""
+        order = np.argsort(-score if prefer_entropy else score, kind="stable")
+        return order[:limit]
+
+    def two_step_scores(self, first_ids, pool_ids, candidate_ids, prefer_entropy: bool):
+        """
+        Two-step score of each guess row in first_ids against candidate_ids, taking the best
+        follow-up from pool_ids in every bucket.
+        """
+        arr = self.matrix.array
+        n = len(candidate_ids)
+        n_codes = 3 ** len(self.matrix.guesses[0])
+        stride = n_codes * n_codes
+        follow = arr[np.ix_(pool_ids, candidate_ids)].astype(np.int64)
+        row_base = (np.arange(len(pool_ids), dtype=np.int64) * stride)[:, None]
+        out = np.empty(len(first_ids), dtype=np.float64)
+        for i, gi in enumerate(first_ids.tolist()):
+            lab = arr[gi, candidate_ids].astype(np.int64)
+            sizes = np.bincount(lab, minlength=n_codes)
+            # one key per (follow-up, bucket, code): its run length is a follow-up bucket size
+            keys = np.sort(lab * n_codes + follow, axis=1) + row_base
+            flat = keys.ravel()
+            starts = np.flatnonzero(np.r_[True, flat[1:] != flat[:-1]])
+            runs = np.diff(np.r_[starts, flat.size]).astype(np.float64)
+            cell = flat[starts] // n_codes  # follow-up row * n_codes + bucket
+            contrib = runs * np.log2(runs) if prefer_entropy else runs * runs
+            acc = np.bincount(
+                cell,
+                weights=contrib,
+                minlength=len(pool_ids) * n_codes,
+            ).reshape(len(pool_ids), n_codes)
+            used = sizes > 0
+            m = sizes[used].astype(np.float64)
+            acc = acc[:, used]
+            if prefer_entropy:
+                # entropy of the first guess plus expected best follow-up entropy per bucket
+                best = (np.log2(m) - acc / m).max(axis=0)
+                ent1 = math.log2(n) - float((m * np.log2(m)).sum()) / n
+                out[i] = ent1 + float((m * best).sum()) / n
+            else:
+                # expected candidates left after the best follow-up in every bucket
+                out[i] = float(acc.min(axis=0).sum()) / n
+        return out
+
+    def pick(
+        self,
+        guess_list: List[str],
+        candidates: List[str],
+        prefer_entropy: bool = True,
+    ) -> Optional[str]:
+        """Best guess by two-step score, or None if lookahead does not apply here."""
+        start = time.perf_counter()
+        self.calls += 1
+        guess = self._pick(guess_list, candidates, prefer_entropy)
+        if guess is None:
+            self.fallbacks += 1
+        self.seconds += time.perf_counter() - start
+        return guess
+
+    def _pick(
+        self, guess_list: List[str], candidates: List[str], prefer_entropy: bool
+    ) -> Optional[str]:
+        n = len(candidates)
+        if self.matrix is None or np is None or self.matrix.array is None:
+            return None
+        if n < self.min_candidates or (self.max_candidates and n > self.max_candidates):
+            return None
+        scores = self.matrix.score_guesses(guess_list, candidates)
+        if scores is None:
+            return None
+        gids = self.matrix.guess_ids(guess_list)
+        cids = self.matrix._candidate_ids(candidates)
+        one_step = scores[0] if prefer_entropy else scores[1]
+
+        top = self._shortlist(one_step, prefer_entropy, self.k)
+        best1 = one_step[top[0]]
+        if prefer_entropy:
+            top = top[one_step[top] >= best1 - self.margin * abs(best1)]
+        else:
+            top = top[one_step[top] <= best1 + self.margin * abs(best1)]
+        if len(top) == 1:
+            return guess_list[int(top[0])]
+
+        pool = self._shortlist(one_step, prefer_entropy, self.follow_k)
+        pool_ids = gids[pool]
+        if n <= self.follow_k:
+            cand_rows = self.matrix.guess_ids(candidates)
+            if cand_rows is not None:
+                pool_ids = np.union1d(pool_ids, cand_rows)
+        two_step = self.two_step_scores(gids[top], pool_ids, cids, prefer_entropy)
+
+        best, best_two, best_one = -1, 0.0, 0.0
+        for i, two in zip(top.tolist(), two_step.tolist()):
+            one = float(one_step[i])
+            if best < 0:
+                better = True
+            elif prefer_entropy:
+                better = two > best_two + 1e-9 or (
+                    math.isclose(two, best_two, abs_tol=1e-9) and one > best_one + 1e-9
+                )
+            else:
+                better = two < best_two - 1e-9 or (
+                    math.isclose(two, best_two, abs_tol=1e-9) and one < best_one - 1e-9
+                )
+            if better:
+                best, best_two, best_one = i, two, one
+        return guess_list[best]
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "fallbacks": self.fallbacks,
+            "seconds": self.seconds,
+            "ms_per_call": 1000 * self.seconds / self.calls if self.calls else 0.0,
+        }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the one-step and two-step picks after a feedback history."
+    )
+    parser.add_argument("history", nargs="*", help="GUESS:PATTERN, e.g. arose:01002")
+    parser.add_argument("--k", type=int, default=10, help="guesses kept after step one")
+    parser.add_argument("--follow-k", type=int, default=100, help="follow-up pool size")
+    parser.add_argument("--margin", type=float, default=0.1, help="relative step-one margin")
+    parser.add_argument("--expected", action="store_true", help="minimize expected remaining")
+    args = parser.parse_args(argv)
+
+    from game_state import GameState
+    import wordlist
+    from strategy_tree import parse_history
+
+    words = wordlist.load_words("fives.txt")
+    matrix = pattern_matrix.load_pattern_matrix(words, words, verbose=True)
+    solver.use_pattern_matrix(matrix)
+    state = GameState(words)
+    for guess, code in parse_history(args.history):
+        state.apply(guess, code)
+    cands = state.candidates()
+    print(f"{len(cands)} candidates")
+    if not cands:
+        return
+    prefer_entropy = not args.expected
+
+    start = time.perf_counter()
+    one = solver.pick_best_from_guess_list(words, cands, prefer_entropy)
+    print(f"one-step: {one}  ({1000 * (time.perf_counter() - start):.1f} ms)")
+
+    picker = Lookahead(matrix, k=args.k, follow_k=args.follow_k, margin=args.margin)
+    picker.max_candidates = 0
+    two = picker.pick(words, cands, prefer_entropy)
+    print(f"two-step: {two or one}  ({picker.stats()['ms_per_call']:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Multi-board (Dordle / Quordle / Octordle / Sedecordle) solver and simulation runner.
+- Every guess is played on all unsolved boards at once; each board keeps its own
+  candidate set, an array of answer IDs narrowed by that board's feedback.
+- Guesses are scored over the full guess list with vectorized bucket counts from the
+  pattern matrix: one bincount per block of guesses covers every board, by offsetting
+  each board's pattern codes into its own range.
+- Score: the summed entropy of all unsolved boards (or, with --mode expected, the summed
+  expected remaining candidates), plus SOLVE_WEIGHT times the expected number of boards
+  the guess solves outright (the sum of 1 / |candidates| over the boards it is a
+  candidate on). A board with a single candidate left is always played first.
+- The runner plays many N-board games (N answers sampled without repetition, seeded
+  per game) through sweep.map_answers, so --workers splits the games across processes.
+  A game scores the guesses it took, or max_guesses + 1 if some board was not solved.
+
+Usage:
+  python multi_board.py [--boards 2 4 8 16] [--games 200] [--workers N] [--seed S]
+                        [--mode entropy|expected] [--openers WORD ...]
+  python multi_board.py --answers WORD WORD ...     # play one game and show it
+"""
+
+import argparse
+import random
+import sys
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pattern_matrix
+import sweep
+import wordlist
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OPENERS: List[str] = ["arose"]
+SOLVE_WEIGHT = 1.0  # score per board expected to be solved by the guess itself
+EXTRA_GUESSES = 5  # N boards get N + 5 guesses (Dordle 7, Quordle 9, Octordle 13, ...)
+DEFAULT_BOARDS = [2, 4, 8, 16]
+
+
+def max_guesses(n_boards: int) -> int:
+    return n_boards + EXTRA_GUESSES
+
+
+class MultiBoardSolver:
+    """Guess picking over one pattern matrix; the per-board candidate sets are passed in."""
+
+    def __init__(
+        self,
+        matrix: "pattern_matrix.PatternMatrix",
+        prefer_entropy: bool = True,
+        solve_weight: float = SOLVE_WEIGHT,
+        block: int = 256,
+    ):
+        if np is None or matrix.array is None:
+            raise RuntimeError("multi-board solving needs NumPy")
+        self.matrix = matrix
+        self.prefer_entropy = prefer_entropy
+        self.solve_weight = solve_weight
+        self.block = block
+        self.n_codes = 3 ** len(matrix.guesses[0])
+        self.all_green = self.n_codes - 1
+        self.all_guesses = np.arange(matrix.n_guesses, dtype=np.intp)
+        # answer id -> guess row of the same word (-1 if it is not a guess)
+        self.answer_rows = np.array(
+            [matrix.guess_index.get(w, -1) for w in matrix.answers], dtype=np.intp
+        )
+        # c * log2(c), looked up by bucket size
+        sizes = np.arange(matrix.n_answers + 1, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._xlogx = np.where(sizes > 0, sizes * np.log2(sizes), 0.0)
+
+    def new_boards(self, n: int) -> List["np.ndarray"]:
+        everything = np.arange(self.matrix.n_answers, dtype=np.intp)
+        return [everything] * n
+
+    def info_scores(self, guess_ids, boards: Sequence["np.ndarray"]):
+        """
+        Per guess: summed entropy (or summed expected remaining candidates) over `boards`.
+        Bucket counts for a block of guesses and all boards come from a single bincount.
+        """
+        n_boards, n_codes = len(boards), self.n_codes
+        sizes = np.array([len(c) for c in boards], dtype=np.float64)
+        ids = np.concatenate(boards)
+        # board k's codes land in [k * n_codes, (k + 1) * n_codes), guess row r's in its own
+        # stride of n_boards * n_codes
+        board_offset = np.repeat(
+            np.arange(n_boards, dtype=np.int64) * n_codes, sizes.astype(np.intp)
+        )
+        stride = n_boards * n_codes
+        out = np.empty(len(guess_ids), dtype=np.float64)
+        for start in range(0, len(guess_ids), self.block):
+            rows = self.matrix.array[np.ix_(guess_ids[start : start + self.block], ids)]
+            b = rows.shape[0]
+            flat = rows + board_offset[None, :] + (np.arange(b, dtype=np.int64) * stride)[:, None]
+            hist = np.bincount(flat.ravel(), minlength=b * stride).reshape(b, n_boards, n_codes)
+            if self.prefer_entropy:
+                clog = self._xlogx[hist].sum(axis=2)
+                out[start : start + b] = (np.log2(sizes) - clog / sizes).sum(axis=1)
+            else:
+                squares = (hist * hist).sum(axis=2)
+                out[start : start + b] = (squares / sizes).sum(axis=1)
+        return out
+
+    def solve_chances(self, boards: Sequence["np.ndarray"]):
+        """Per guess row: the expected number of boards that guess solves outright."""
+        chances = np.zeros(self.matrix.n_guesses, dtype=np.float64)
+        for cands in boards:
+            rows = self.answer_rows[cands]
+            np.add.at(chances, rows[rows >= 0], 1.0 / len(cands))
+        return chances
+
+    def choose(self, boards: Sequence["np.ndarray"]) -> int:
+        """Guess row to play next on the unsolved `boards` (non-empty candidate sets)."""
+        for cands in boards:
+            if len(cands) == 1 and self.answer_rows[cands[0]] >= 0:
+                return int(self.answer_rows[cands[0]])
+        info = self.info_scores(self.all_guesses, boards)
+        bonus = self.solve_weight * self.solve_chances(boards)
+        if self.prefer_entropy:
+            return int(np.argmax(info + bonus))
+        return int(np.argmin(info - bonus))
+
+    def play(
+        self,
+        answer_ids: Sequence[int],
+        openers: Sequence[str] = OPENERS,
+        limit: Optional[int] = None,
+        verbose: bool = False,
+    ) -> Tuple[int, List[int]]:
+        """
+        Play one game against `answer_ids` (one answer per board). Returns (score, the turn
+        each board was solved on, 0 if never): score is the number of guesses if all boards
+        were solved, else limit + 1.
+        """
+        matrix = self.matrix
+        limit = max_guesses(len(answer_ids)) if limit is None else limit
+        boards = self.new_boards(len(answer_ids))
+        solved_on = [0] * len(answer_ids)
+        opener_rows = [matrix.guess_index[w] for w in openers]
+        for turn in range(limit):
+            open_ids = [b for b, t in enumerate(solved_on) if not t]
+            if turn < len(opener_rows):
+                g = opener_rows[turn]
+            else:
+                g = self.choose([boards[b] for b in open_ids])
+            row = matrix.array[g]
+            for b in open_ids:
+                code = row[answer_ids[b]]
+                if code == self.all_green:
+                    solved_on[b] = turn + 1
+                else:
+                    cands = boards[b]
+                    boards[b] = cands[row[cands] == code]
+            if verbose:
+                left = " ".join(
+                    "done" if solved_on[b] else str(len(boards[b])) for b in range(len(boards))
+                )
+                print(f"{turn + 1:2}. {matrix.guesses[g]}  candidates: {left}")
+            if all(solved_on):
+                return turn + 1, solved_on
+        return limit + 1, solved_on
+
+
+def answer_tuple(seed: int, n_boards: int, game: int, n_answers: int) -> List[int]:
+    """The answers of one simulated game: the same for a given (seed, boards, game)."""
+    return random.Random(f"{seed}:{n_boards}:{game}").sample(range(n_answers), n_boards)
+
+
+# --------------------------------
+# Simulation runner
+# --------------------------------
+
+# Set by main() for serial runs, by _init_worker in pool workers.
+_SOLVER: Optional[MultiBoardSolver] = None
+_GAME: Dict = {}
+
+
+def _setup(
+    words: List[str], n_boards: int, seed: int, mode: str, solve_weight: float, openers
+) -> None:
+    global _SOLVER, _GAME
+    if _SOLVER is None or _SOLVER.matrix.guesses != words:
+        matrix = pattern_matrix.load_pattern_matrix(words, words, build=False)
+        _SOLVER = MultiBoardSolver(matrix)
+    _SOLVER.prefer_entropy = mode == "entropy"
+    _SOLVER.solve_weight = solve_weight
+    _GAME = {"boards": n_boards, "seed": seed, "openers": list(openers)}
+
+
+def _init_worker(shm_name: str, size: int, *config) -> None:
+    """Pool initializer: attach to the shared word list and mmap the cached pattern matrix."""
+    _setup(sweep.attach_words(shm_name, size), *config)
+
+
+def _play_game(game: int) -> Tuple[int, List[int]]:
+    n_answers = _SOLVER.matrix.n_answers
+    answer_ids = answer_tuple(_GAME["seed"], _GAME["boards"], game, n_answers)
+    return _SOLVER.play(answer_ids, _GAME["openers"])
+
+
+def report(n_boards: int, results: List[Tuple[int, List[int]]]) -> None:
+    limit = max_guesses(n_boards)
+    scores = [s for s, _ in results]
+    failed = sum(1 for s in scores if s > limit)
+    board_turns = [t for _, turns in results for t in turns if t]
+    print(f"\n=== {n_boards} boards, {len(results)} games, {limit} guesses ===")
+    print(f"Solve rate: {(len(results) - failed) / len(results):.5f}  ({failed} failed)")
+    print(f"Average score: {sum(scores) / len(results):.5f}")
+    if board_turns:
+        print(f"Average board solved on: {sum(board_turns) / len(board_turns):.3f}")
+    dist = Counter(scores)
+    width = max(dist.values())
+    for s in sorted(dist):
+        label = f"{s:>3}" if s <= limit else "  X"
+        bar = "#" * max(1, round(40 * dist[s] / width))
+        print(f"  {label}: {dist[s]:6}  {bar}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulate multi-board Wordle games.")
+    parser.add_argument(
+        "--boards", type=int, nargs="+", default=DEFAULT_BOARDS, help="board counts to play"
+    )
+    parser.add_argument("--games", type=int, default=200, help="games per board count")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the answer tuples")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes to split the games across (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["entropy", "expected"],
+        default="entropy",
+        help="maximize summed entropy or minimize summed expected remaining candidates",
+    )
+    parser.add_argument(
+        "--solve-weight",
+        type=float,
+        default=SOLVE_WEIGHT,
+        help=f"score per board a guess is expected to solve (default: {SOLVE_WEIGHT})",
+    )
+    parser.add_argument(
+        "--openers", nargs="*", default=OPENERS, metavar="WORD", help="fixed first guesses"
+    )
+    parser.add_argument(
+        "--answers", nargs="+", metavar="WORD", help="play one game with these answers, verbosely"
+    )
+    args = parser.parse_args(argv)
+    if any(n < 1 for n in args.boards):
+        parser.error("--boards: every board count must be at least 1")
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if np is None:
+        print("multi_board.py needs NumPy.", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        words = wordlist.load_words("fives.txt")
+    except FileNotFoundError:
+        print("Could not open 'fives.txt'.", file=sys.stderr)
+        sys.exit(1)
+    index = {w: i for i, w in enumerate(words)}
+    openers = [w.lower() for w in args.openers]
+    for w in openers + [w.lower() for w in args.answers or []]:
+        if w not in index:
+            parser.error(f"{w!r} is not in fives.txt")
+    # build the cache once here; workers only memory-map it
+    pattern_matrix.load_pattern_matrix(words, words, verbose=True)
+
+    if args.answers:
+        _setup(words, len(args.answers), args.seed, args.mode, args.solve_weight, openers)
+        answer_ids = [index[w.lower()] for w in args.answers]
+        score, solved_on = _SOLVER.play(answer_ids, openers, verbose=True)
+        print(f"Score: {score}  (boards solved on: {solved_on})")
+        return
+
+    for n_boards in args.boards:
+        config = (n_boards, args.seed, args.mode, args.solve_weight, openers)
+        _setup(words, *config)
+        results = list(
+            sweep.map_answers(
+                _play_game,
+                range(args.games),
+                args.workers,
+                words,
+                _init_worker,
+                extra_initargs=config,
+                chunksize=1,
+            )
+        )
+        report(n_boards, results)
+
+
+if __name__ == "__main__":
+    main()
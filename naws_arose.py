@@ -6,15 +6,23 @@ Simulate all Wordle games against the list in fives.txt using the advanced solve
 - Hard Mode enforced: each next guess is chosen from the current consistent set.
 - Uses entropy-based selection (pick_best_hard_mode_guess).
 - Starts from a fixed opener (default: 'arose'), but you can tweak FIRST_GUESS below.
+  With --length N (4-8 letters, from english3.txt) the opener is the list's best
+  entropy pick instead, worked out once per run.
 - Tracks per-turn present counts to compute correct min-counts across turns.
 - Tracks per-turn upper bounds when extra duplicate letters came back gray.
-- Uses solver's feedback_pattern to generate exact per-position feedback.
+- Keeps the candidate set in a GameState that only narrows the previous turn's set.
+- Uses solver's integer feedback_code to generate exact per-position feedback.
 """
 
+import argparse
 import sys
-from collections import Counter
 
 import new_advanced_solver as naws  # rename if your file/module name differs
+import pattern_matrix
+import sweep
+import wordlist
+from game_state import GameState
+from guess_cache import GuessCache
 
 FIRST_GUESS = "arose"
 SHOW_PROGRESS_EVERY = 100  # print a heartbeat every N answers
@@ -22,12 +30,12 @@ SHOW_PROGRESS_EVERY = 100  # print a heartbeat every N answers
 
 def color_word(guess: str, answer: str) -> str:
     """ANSI-colored representation based on true feedback for debug/pretty printing."""
-    pattern = naws.feedback_pattern(guess, answer)  # '2','1','0'
+    code = naws.feedback_code(naws.word_codes(guess), naws.word_codes(answer))
     pieces = []
-    for ch, p in zip(guess, pattern):
-        if p == "2":
+    for ch, p in zip(guess, naws.pattern_digits(code, len(guess))):
+        if p == 2:
             pieces.append(f"\033[92m{ch.upper()}\033[0m")  # green
-        elif p == "1":
+        elif p == 1:
             pieces.append(f"\033[93m{ch.upper()}\033[0m")  # yellow
         else:
             pieces.append(f"\033[90m{ch.upper()}\033[0m")  # gray
@@ -39,69 +47,28 @@ def simulate_one(answer: str, words: list[str], verbose: bool = False) -> int:
     Play one full game against `answer`.
     Returns number of guesses taken (1..6) if solved, or 7 if unsolved (for scoring).
     """
-    positions_list: list[tuple[str, int, bool]] = []  # (ch, idx, is_green)
-    excluded_letters: str = ""  # 'x' letters not present in that turn
-    present_counts_by_turn: list[
-        Counter
-    ] = []  # per-turn present counts (yellows+greens)
-    upper_bounds_by_turn: list[
-        dict[str, int]
-    ] = []  # per-turn upper bounds {ch: max_count_this_turn}
-
-    guess: str = FIRST_GUESS
+    # Candidate set narrowed turn by turn; each turn's present counts give min-counts and
+    # extra gray copies give upper bounds (see solver.turn_constraints).
+    state = GameState(words)
+
+    answer_codes = naws.word_codes(answer)
+    green = naws.all_green_code(len(answer))
+    guess: str = first_guess(words)
     for turn in range(6):
         # Compute true feedback using solver's logic (handles duplicates)
-        pattern = naws.feedback_pattern(guess, answer)  # string over {'0','1','2'}
+        code = naws.feedback_code(naws.word_codes(guess), answer_codes)
 
         if verbose:
             print(
-                f"Attempt {turn + 1}/6  Guess: {color_word(guess, answer)}  Pattern: {pattern}"
+                f"Attempt {turn + 1}/6  Guess: {color_word(guess, answer)}  Pattern: {naws.decode_pattern(code, len(guess))}"
             )
 
         # If all green, solved
-        if pattern == "22222":
+        if code == green:
             return turn + 1
 
-        # Build this turn's annotations
-        guess_counts = Counter(guess)  # total guessed per letter this turn
-        turn_present_counter = Counter()  # letters with '1' or '2' this turn
-
-        # First pass: collect present letters (positions with 1 or 2)
-        for ch, p in zip(guess, pattern):
-            if p in ("1", "2"):
-                turn_present_counter[ch] += 1
-
-        # Upper bounds this turn: if we guessed a letter more times than it was present,
-        # the answer has at most 'present' copies this turn.
-        ub_this_turn: dict[str, int] = {}
-        for ch, gcount in guess_counts.items():
-            pcnt = turn_present_counter[ch]
-            if gcount > pcnt:
-                ub_this_turn[ch] = pcnt
-        upper_bounds_by_turn.append(ub_this_turn)
-
-        # Second pass: update global constraint stores
-        for idx, (ch, p) in enumerate(zip(guess, pattern)):
-            if p == "2":
-                positions_list.append((ch, idx, True))
-            elif p == "1":
-                positions_list.append((ch, idx, False))
-            else:  # '0' gray
-                # Add to excluded only if this letter wasn't present elsewhere this turn
-                if ch not in turn_present_counter:
-                    excluded_letters += ch
-
-        present_counts_by_turn.append(turn_present_counter)
-
-        # Recompute candidate set under all constraints so far
-        candidates = naws.solvable_words(
-            words,
-            letters="",  # kept for compatibility with the signature
-            positions=positions_list,
-            excluded_letters_string=excluded_letters,
-            present_counts_by_turn=present_counts_by_turn,
-            upper_bounds_by_turn=upper_bounds_by_turn,  # <-- pass UBs
-        )
+        state.apply(guess, code)
+        candidates = state.candidates()
 
         if not candidates:
             # Dead-end under constraints -> mark unsolved (score as 7)
@@ -109,8 +76,7 @@ def simulate_one(answer: str, words: list[str], verbose: bool = False) -> int:
                 print("No candidates remain; marking as unsolved.")
             return 7
 
-        # Pick next guess from candidates by entropy
-        guess = naws.pick_best_hard_mode_guess(candidates, prefer_entropy=True)
+        guess = choose_guess(turn, candidates)
         if guess == "":
             # No valid guess could be picked -> mark unsolved (score as 7)
             if verbose:
@@ -121,29 +87,174 @@ def simulate_one(answer: str, words: list[str], verbose: bool = False) -> int:
     return 7
 
 
-def main():
+# Openers of other word lengths, by length (FIRST_GUESS is the 5-letter one).
+_OPENERS: dict[int, str] = {}
+
+
+def first_guess(words: list[str]) -> str:
+    """FIRST_GUESS for 5 letters; otherwise the best hard-mode pick over the whole list."""
+    length = len(words[0]) if words else len(FIRST_GUESS)
+    if length == len(FIRST_GUESS):
+        return FIRST_GUESS
+    guess = _OPENERS.get(length)
+    if guess is None:
+        guess = _OPENERS[length] = naws.pick_best_hard_mode_guess(words, prefer_entropy=True)
+    return guess
+
+
+def choose_guess(turn: int, candidates: list[str]) -> str:
+    """Next guess after `turn` + 1 turns: hard mode, pick from candidates by entropy."""
+    return naws.pick_best_hard_mode_guess(candidates, prefer_entropy=True)
+
+
+# Word list used by _score_answer: set by main() for serial runs, by _init_worker in pool workers.
+_WORDS: list[str] = []
+
+
+def _init_worker(
+    shm_name: str, size: int, cache_path: str | None = None, opener: str | None = None
+) -> None:
+    """Pool initializer: attach to the shared word list and mmap the cached pattern matrix."""
+    global _WORDS
+    _WORDS = sweep.attach_words(shm_name, size)
+    if opener is not None and _WORDS:
+        _OPENERS[len(_WORDS[0])] = opener
+    naws.use_pattern_matrix(
+        pattern_matrix.load_pattern_matrix(_WORDS, _WORDS, build=False)
+    )
+    naws.use_guess_cache(GuessCache(path=cache_path))
+
+
+def _score_answer(idx: int) -> int:
+    # NOTE: For Hard Mode with answer list == guess list, candidates pool is the same.
+    # If you maintain a separate "valid guesses" list, pass that instead.
+    return simulate_one(_WORDS[idx], _WORDS, verbose=False)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Simulate hard-mode games for every word in fives.txt (or the --length list)."
+    )
+    parser.add_argument(
+        "--length",
+        type=int,
+        choices=wordlist.SOLVER_LENGTHS,
+        default=5,
+        help="word length: 5 uses fives.txt, 4-8 the words of english3.txt (default: 5)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes to split the answers across (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--guess-cache",
+        metavar="PATH",
+        help="load memoized best-guess picks from PATH and save them back (serial runs)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PREFIX",
+        help="instrument and cProfile the run; writes PREFIX.json and PREFIX.folded",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="PREFIX",
+        help="count calls and time the solver without cProfile; writes PREFIX.json",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="append every scored answer to PATH (JSON lines) as the sweep goes",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the sweep in --checkpoint PATH, skipping answers already scored",
+    )
+    args = parser.parse_args(argv)
+    if args.profile and args.workers > 1:
+        parser.error("--profile only covers this process: use --workers 1")
+    if args.stats and args.workers > 1:
+        parser.error("--stats only covers this process: use --workers 1")
+    if args.profile and args.stats:
+        parser.error("--profile already writes the --stats counters")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint PATH")
+
     # Load the master word list
+    source = wordlist.source_for_length(args.length)
     try:
-        with open("fives.txt", "r") as f:
-            all_words = [w.strip().lower() for w in f if len(w.strip()) == 5]
+        all_words = wordlist.words_of_length(args.length)
     except FileNotFoundError:
         print(
-            "Could not open 'fives.txt'. Please place a 5-letter word list in this folder.",
+            f"Could not open '{source}'. Please place a word list in this folder.",
             file=sys.stderr,
         )
         sys.exit(1)
+    if not all_words:
+        print(f"No {args.length}-letter words in '{source}'.", file=sys.stderr)
+        sys.exit(1)
+
+    # Precomputed feedback codes for every (guess, answer) pair; cached on disk.
+    naws.use_pattern_matrix(
+        pattern_matrix.load_pattern_matrix(all_words, all_words, verbose=True)
+    )
+    # Answers that reach the same candidate set share one pick.
+    cache = GuessCache(path=args.guess_cache)
+    naws.use_guess_cache(cache)
+
+    global _WORDS
+    _WORDS = all_words
+    opener = first_guess(all_words)
 
     scores: list[int] = []
     unsolved: list[str] = []
 
+    session = None
+    if args.profile or args.stats:
+        import profiling
+
+        session = profiling.start(
+            args.profile or args.stats,
+            naws,
+            sys.modules[__name__],
+            cprofile=bool(args.profile),
+        )
+
     total = len(all_words)
-    for idx, answer in enumerate(all_words, start=1):
-        # NOTE: For Hard Mode with answer list == guess list, candidates pool is the same.
-        # If you maintain a separate "valid guesses" list, pass that instead.
-        result = simulate_one(answer, all_words, verbose=False)
+    checkpoint, done = None, {}
+    if args.checkpoint:
+        words_key = pattern_matrix.word_list_key(all_words, all_words)
+        fingerprint = {"runner": "naws_arose", "first_guess": opener, "words": words_key}
+        try:
+            checkpoint, done = sweep.start_checkpoint(
+                args.checkpoint, fingerprint, args.resume, every=SHOW_PROGRESS_EVERY
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        if args.resume:
+            print(f"Resuming: {len(done)}/{total} answers already scored", file=sys.stderr)
+
+    results = sweep.resume_answers(
+        done,
+        total,
+        lambda pending: sweep.map_answers(
+            _score_answer,
+            pending,
+            args.workers,
+            all_words,
+            _init_worker,
+            extra_initargs=(args.guess_cache, opener),
+        ),
+    )
+    for idx, (answer, result) in enumerate(zip(all_words, results), start=1):
         scores.append(result)
         if result == 7:
             unsolved.append(answer)
+        if checkpoint is not None:
+            checkpoint.record(idx - 1, answer, result, result == 7)
 
         if idx % SHOW_PROGRESS_EVERY == 0 or idx == total:
             solved = idx - len(unsolved)
@@ -160,6 +271,9 @@ def main():
     hardest_idx = scores.index(max_score) if scores else -1
     hardest_word = all_words[hardest_idx] if hardest_idx >= 0 else ""
 
+    if checkpoint is not None:
+        checkpoint.close()
+
     print("\n=== Final Results ===")
     print("Unsolved words:", len(unsolved))
     if unsolved:
@@ -168,6 +282,23 @@ def main():
     print(f"Average score: {avg_score:.5f}")
     print(f"Max score: {max_score}  ({hardest_word})")
 
+    if args.workers <= 1:
+        st = cache.stats()
+        print(
+            f"Guess cache: {st['hits']} hits, {st['misses']} misses ({st['hit_rate']:.1%})",
+            file=sys.stderr,
+        )
+        if args.guess_cache:
+            cache.save()
+    if session is not None:
+        session.finish()
+        if args.profile:
+            print(
+                f"Profile: {args.profile}.json, {args.profile}.folded", file=sys.stderr
+            )
+        else:
+            print(f"Stats: {args.stats}.json", file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()
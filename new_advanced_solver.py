@@ -6,13 +6,18 @@ Hard-Mode Wordle Assistant with Entropy-Based Guess Picker
 - min_counts per letter = MAX across turns (not sum)
 - NEW: upper_bounds_by_turn gives max allowed counts for letters when extra copies are gray.
 - Picks next guess by maximizing entropy.
+- Scoring reads precomputed pattern codes when a pattern matrix is installed (use_pattern_matrix),
+  one per word length, so lengths 4-8 (english3.txt) use the same fast path as 5.
 """
 
+import heapq
 import math
 import sys
 from collections import Counter, defaultdict
 from typing import Dict, List, Set, Tuple
 
+import candidate_index
+
 # ----------------------------
 # Feedback / Information theory
 # ----------------------------
@@ -36,28 +41,122 @@ def feedback_pattern(guess: str, answer: str) -> str:
     return "".join(res)
 
 
+# Integer pattern codes: base-3 value of the feedback_pattern string ('22222' -> 242).
+ALL_GREEN: int = 242  # for 5 letters; all_green_code(n) in general
+_WORD_CODES: Dict[str, Tuple[int, ...]] = {}
+
+
+def word_codes(word: str) -> Tuple[int, ...]:
+    """Per-position letter codes of `word`, computed once per word and reused."""
+    codes = _WORD_CODES.get(word)
+    if codes is None:
+        codes = _WORD_CODES[word] = tuple(ord(ch) - 97 for ch in word)
+    return codes
+
+
+def feedback_code(guess_codes: Tuple[int, ...], answer_codes: Tuple[int, ...]) -> int:
+    """
+    Same result as encode_pattern(feedback_pattern(guess, answer)) but from letter-code tuples,
+    with answer positions tracked in an int bitmask instead of a list/Counter/string per call.
+    """
+    n = len(guess_codes)
+    green = 0
+    for i in range(n):
+        if guess_codes[i] == answer_codes[i]:
+            green |= 1 << i
+    used = green  # answer positions already matched (greens, then yellows)
+    code = 0
+    for i in range(n):
+        code *= 3
+        if (green >> i) & 1:
+            code += 2
+            continue
+        g = guess_codes[i]
+        for j in range(n):
+            if answer_codes[j] == g and not (used >> j) & 1:
+                used |= 1 << j
+                code += 1
+                break
+    return code
+
+
+def all_green_code(n: int = 5) -> int:
+    return 3**n - 1
+
+
+def encode_pattern(pattern: str) -> int:
+    return int(pattern, 3)
+
+
+def decode_pattern(code: int, n: int = 5) -> str:
+    return "".join("012"[d] for d in pattern_digits(code, n))
+
+
+def pattern_digits(code: int, n: int = 5) -> Tuple[int, ...]:
+    """Per-position feedback (2 green, 1 yellow, 0 gray) of a pattern code."""
+    digits = [0] * n
+    for i in range(n - 1, -1, -1):
+        code, digits[i] = divmod(code, 3)
+    return tuple(digits)
+
+
+# Optional precomputed guess x answer pattern matrices (see pattern_matrix.py), by word length.
+_PATTERN_MATRICES: Dict[int, object] = {}
+
+
+def use_pattern_matrix(matrix) -> None:
+    """
+    Make the scoring functions read pattern codes from `matrix` for words of its length
+    (replacing any earlier matrix for that length); None disables every matrix.
+    """
+    if matrix is None:
+        _PATTERN_MATRICES.clear()
+    elif matrix.guesses:
+        _PATTERN_MATRICES[len(matrix.guesses[0])] = matrix
+
+
 def pattern_counts_for_guess(guess: str, candidates: List[str]) -> Dict[str, int]:
+    matrix = _PATTERN_MATRICES.get(len(guess))
+    if matrix is not None:
+        counts = matrix.pattern_counts(guess, candidates)
+        if counts is not None:
+            return counts
     counts = defaultdict(int)
     for ans in candidates:
         counts[feedback_pattern(guess, ans)] += 1
     return counts
 
 
-def entropy_of_guess(guess: str, candidates: List[str]) -> float:
-    counts = pattern_counts_for_guess(guess, candidates)
-    n = max(len(candidates), 1)
+def _bucket_sizes(guess: str, candidates: List[str]):
+    matrix = _PATTERN_MATRICES.get(len(guess))
+    if matrix is not None:
+        sizes = matrix.bucket_sizes(guess, candidates)
+        if sizes is not None:
+            return sizes
+    gc = word_codes(guess)
+    return Counter([feedback_code(gc, word_codes(ans)) for ans in candidates]).values()
+
+
+def _entropy_of_sizes(sizes, n: int) -> float:
+    n = max(n, 1)
     ent = 0.0
-    for c in counts.values():
+    for c in sizes:
         p = c / n
         if p > 0:
             ent -= p * math.log2(p)
     return ent
 
 
+def _expected_of_sizes(sizes, n: int) -> float:
+    return sum(c * c for c in sizes) / max(n, 1)
+
+
+def entropy_of_guess(guess: str, candidates: List[str]) -> float:
+    return _entropy_of_sizes(_bucket_sizes(guess, candidates), len(candidates))
+
+
 def expected_remaining_of_guess(guess: str, candidates: List[str]) -> float:
-    counts = pattern_counts_for_guess(guess, candidates)
-    n = max(len(candidates), 1)
-    return sum(c * c for c in counts.values()) / n
+    return _expected_of_sizes(_bucket_sizes(guess, candidates), len(candidates))
 
 
 def coverage_score(guess: str, candidates: List[str]) -> float:
@@ -66,78 +165,214 @@ def coverage_score(guess: str, candidates: List[str]) -> float:
     return sum(freqs[ch] for ch in set(guess))
 
 
-def pick_best_hard_mode_guess(cands: List[str], prefer_entropy: bool = True) -> str:
-    if not cands:
-        return ""
-    best = ""
+# Optional memo of best-guess picks keyed by candidate set (see guess_cache.py).
+_GUESS_CACHE = None
+
+
+def use_guess_cache(cache) -> None:
+    """Memoize pick_best_* results in `cache` (a guess_cache.GuessCache; None disables it)."""
+    global _GUESS_CACHE
+    _GUESS_CACHE = cache
+
+
+# Optional two-step picker for pick_best_from_guess_list (see lookahead.py).
+_LOOKAHEAD = None
+
+
+def use_lookahead(picker) -> None:
+    """Pick from guess lists with `picker` (a lookahead.Lookahead; None restores one-step)."""
+    global _LOOKAHEAD
+    _LOOKAHEAD = picker
+
+
+# Batched scores within this margin of the best are re-scored with the scalar functions,
+# so picks made through the matrix match the plain per-guess loop exactly.
+_BATCH_MARGIN = 1e-6
+
+
+def _batch_scores(guess_list: List[str], candidates: List[str]):
+    matrix = _PATTERN_MATRICES.get(len(guess_list[0])) if guess_list else None
+    if matrix is None:
+        return None
+    return matrix.score_guesses(guess_list, candidates)
+
+
+def _batch_contenders(
+    guess_list: List[str], candidates: List[str], prefer_entropy: bool
+) -> List[str]:
+    """Guesses that can still win the pick, found with one batched pass (or guess_list itself)."""
+    scores = _batch_scores(guess_list, candidates)
+    if scores is None:
+        return guess_list
+    ent, er, _ = scores
     if prefer_entropy:
-        best_ent, best_cov = -1.0, -1.0
-        for w in cands:
-            ent = entropy_of_guess(w, cands)
-            cov = coverage_score(w, cands)
-            if ent > best_ent or (math.isclose(ent, best_ent) and cov > best_cov):
-                best, best_ent, best_cov = w, ent, cov
+        keep = ent >= ent.max() - _BATCH_MARGIN
     else:
-        best_er, best_ent = float("inf"), -1.0
-        for w in cands:
-            er = expected_remaining_of_guess(w, cands)
-            ent = entropy_of_guess(w, cands)
-            if er < best_er or (math.isclose(er, best_er) and ent > best_ent):
-                best, best_er, best_ent = w, er, ent
-    return best
+        keep = er <= er.min() + _BATCH_MARGIN
+    return [guess_list[i] for i in keep.nonzero()[0].tolist()]
 
 
-def rank_candidates_by_entropy(cands: List[str]) -> List[Tuple[str, float, float]]:
-    scored = [(w, entropy_of_guess(w, cands), coverage_score(w, cands)) for w in cands]
-    return sorted(scored, key=lambda t: (-t[1], -t[2], t[0]))
+def _coverage_scores(guess_list: List[str], candidates: List[str]) -> List[float]:
+    freqs = Counter("".join(candidates))
+    return [sum(freqs[ch] for ch in set(w)) for w in guess_list]
 
 
-def pick_best_from_guess_list(
-    guess_list: List[str], candidates: List[str], prefer_entropy: bool = True
+def _pick_best(
+    guess_list: List[str], candidates: List[str], prefer_entropy: bool
 ) -> str:
     """
-    NORMAL MODE: pick the best next guess from an arbitrary guess_list (can include non-answers),
-    scoring by how well it partitions the *current candidates*.
+    Scan guess_list for the best guess. Scores are only computed where they can matter:
+    - a guess with nb buckets has entropy <= log2(nb) and expected remaining >= n / nb,
+      so guesses whose bucket count already loses are rejected before exact scoring;
+    - no guess beats a split into singletons (the log2(min(n, 3**L)) entropy ceiling), so
+      after one the expected-remaining scan stops and the entropy scan only looks at
+      guesses with better coverage, stopping once no remaining guess can have more.
     """
-    if not guess_list or not candidates:
-        return ""
     best = ""
+    guess_list = _batch_contenders(guess_list, candidates, prefer_entropy)
+    n = len(candidates)
     if prefer_entropy:
+        freqs = Counter("".join(candidates))
+        cov_cap = sum(sorted(freqs.values(), reverse=True)[: len(guess_list[0])])
         best_ent, best_cov = -1.0, -1.0
+        singletons = False
         for w in guess_list:
-            ent = entropy_of_guess(w, candidates)
-            cov = coverage_score(
-                w, candidates
-            )  # tie-breaker favors unique, high-coverage letters
+            # tie-breaker favors unique, high-coverage letters (same value as coverage_score)
+            cov = sum(freqs[ch] for ch in set(w))
+            if singletons:
+                if cov > best_cov and len(_bucket_sizes(w, candidates)) == n:
+                    best, best_cov = w, cov
+                if best_cov >= cov_cap:
+                    break
+                continue
+            sizes = _bucket_sizes(w, candidates)
+            bound = math.log2(len(sizes))
+            if bound < best_ent and not math.isclose(bound, best_ent):
+                continue
+            ent = _entropy_of_sizes(sizes, n)
             if ent > best_ent or (math.isclose(ent, best_ent) and cov > best_cov):
                 best, best_ent, best_cov = w, ent, cov
+                singletons = len(sizes) == n
         return best
     else:
         # minimize expected remaining (good when candidates are already fairly small)
         best_er, best_ent = float("inf"), -1.0
         for w in guess_list:
-            er = expected_remaining_of_guess(w, candidates)
-            ent = entropy_of_guess(w, candidates)
-            if er < best_er or (math.isclose(er, best_er) and ent > best_ent):
-                best, best_er, best_ent = w, er, ent
+            sizes = _bucket_sizes(w, candidates)
+            bound = n / len(sizes)
+            if bound > best_er and not math.isclose(bound, best_er):
+                continue
+            er = _expected_of_sizes(sizes, n)
+            if er < best_er or math.isclose(er, best_er):
+                ent = _entropy_of_sizes(sizes, n)
+                if er < best_er or ent > best_ent:
+                    best, best_er, best_ent = w, er, ent
+                    if len(sizes) == n:
+                        break
         return best
 
 
+def pick_best_hard_mode_guess(cands: List[str], prefer_entropy: bool = True) -> str:
+    if not cands:
+        return ""
+    if _GUESS_CACHE is not None:
+        return _GUESS_CACHE.get_or_compute(
+            f"hard:{int(prefer_entropy)}",
+            None,
+            cands,
+            lambda: _pick_best(cands, cands, prefer_entropy),
+        )
+    return _pick_best(cands, cands, prefer_entropy)
+
+
+def rank_candidates_by_entropy(cands: List[str]) -> List[Tuple[str, float, float]]:
+    return rank_from_guess_list(cands, cands)
+
+
+def top_candidates_by_entropy(cands: List[str], k: int = 5) -> List[Tuple[str, float, float]]:
+    return top_from_guess_list(cands, cands, k)
+
+
+def pick_best_from_guess_list(
+    guess_list: List[str], candidates: List[str], prefer_entropy: bool = True
+) -> str:
+    """
+    NORMAL MODE: pick the best next guess from an arbitrary guess_list (can include non-answers),
+    scoring by how well it partitions the *current candidates*.
+    With a lookahead installed (use_lookahead) guesses are ranked by their two-step score.
+    """
+    if not guess_list or not candidates:
+        return ""
+
+    def pick() -> str:
+        if _LOOKAHEAD is not None:
+            guess = _LOOKAHEAD.pick(guess_list, candidates, prefer_entropy)
+            if guess is not None:
+                return guess
+        return _pick_best(guess_list, candidates, prefer_entropy)
+
+    tag = f"list:{int(prefer_entropy)}"
+    if _LOOKAHEAD is not None:
+        tag += ":" + _LOOKAHEAD.tag
+    if _GUESS_CACHE is not None:
+        return _GUESS_CACHE.get_or_compute(tag, guess_list, candidates, pick)
+    return pick()
+
+
 def rank_from_guess_list(
     guess_list: List[str], candidates: List[str]
 ) -> List[Tuple[str, float, float]]:
     """
     NORMAL MODE: (word, entropy, coverage) ranked over an arbitrary guess_list against the same candidates.
     """
-    scored = []
-    for w in guess_list:
-        ent = entropy_of_guess(w, candidates)
-        cov = coverage_score(w, candidates)
-        scored.append((w, ent, cov))
-    scored.sort(key=lambda t: (-t[1], -t[2], t[0]))
+    scores = _batch_scores(guess_list, candidates)
+    if scores is not None:
+        ents = scores[0].tolist()
+    else:
+        ents = [entropy_of_guess(w, candidates) for w in guess_list]
+    scored = list(zip(guess_list, ents, _coverage_scores(guess_list, candidates)))
+    scored.sort(key=_rank_key)
     return scored
 
 
+def _rank_key(t: Tuple[str, float, float]):
+    return -t[1], -t[2], t[0]
+
+
+def top_from_guess_list(
+    guess_list: List[str], candidates: List[str], k: int = 5
+) -> List[Tuple[str, float, float]]:
+    """
+    rank_from_guess_list(guess_list, candidates)[:k] without sorting the whole list:
+    only guesses that can still reach the top k (by entropy, or by the bucket-count bound
+    log2(buckets) in the scalar scan) are kept, then a size-k heap picks the winners.
+    """
+    if k <= 0 or not guess_list:
+        return []
+    scores = _batch_scores(guess_list, candidates)
+    if scores is not None:
+        ents = scores[0].tolist()
+        kth = heapq.nlargest(k, ents)[-1]
+        kept = [(w, e) for w, e in zip(guess_list, ents) if e >= kth]
+    else:
+        n = len(candidates)
+        floor: List[float] = []  # min-heap of the k best entropies so far
+        kept = []
+        for w in guess_list:
+            sizes = _bucket_sizes(w, candidates)
+            if len(floor) == k and math.log2(max(len(sizes), 1)) + 1e-12 < floor[0]:
+                continue
+            ent = _entropy_of_sizes(sizes, n)
+            kept.append((w, ent))
+            if len(floor) < k:
+                heapq.heappush(floor, ent)
+            elif ent > floor[0]:
+                heapq.heapreplace(floor, ent)
+    words = [w for w, _ in kept]
+    scored = zip(words, (e for _, e in kept), _coverage_scores(words, candidates))
+    return heapq.nsmallest(k, scored, key=_rank_key)
+
+
 # ----------------------------
 # Constraint building & filtering
 # ----------------------------
@@ -179,6 +414,24 @@ def build_constraints(
     return greens, yellows_not_here, min_counts, max_counts, globally_excluded
 
 
+def turn_constraints(
+    guess: str, code: int
+) -> Tuple[Dict[int, str], Dict[str, Set[int]], Counter, Dict[str, int], Set[str]]:
+    """build_constraints for a single turn: what one (guess, feedback code) says about the answer."""
+    digits = pattern_digits(code, len(guess))
+    turn_present = Counter(ch for ch, p in zip(guess, digits) if p)
+    ub_this_turn = {
+        ch: turn_present[ch]
+        for ch, gcount in Counter(guess).items()
+        if gcount > turn_present[ch]
+    }
+    positions = [(ch, idx, p == 2) for idx, (ch, p) in enumerate(zip(guess, digits)) if p]
+    excluded = "".join(
+        ch for ch, p in zip(guess, digits) if not p and ch not in turn_present
+    )
+    return build_constraints(positions, excluded, [turn_present], [ub_this_turn])
+
+
 def candidate_ok(
     word: str,
     greens: Dict[int, str],
@@ -214,6 +467,14 @@ def filter_candidates(
     max_counts: Dict[str, int],
     globally_excluded: Set[str],
 ) -> List[str]:
+    # registered lists (the full word lists) go through their bitset index
+    index = candidate_index.registered(words)
+    if index is not None:
+        return index.words_of(
+            index.mask_for(
+                greens, yellows_not_here, min_counts, max_counts, globally_excluded
+            )
+        )
     return [
         w
         for w in words
@@ -226,14 +487,15 @@ def filter_candidates(
 def sort_words(words: List[str]) -> List[str]:
     if not words:
         return []
-    pos_freq = [Counter(w[i] for w in words) for i in range(5)]
+    length = len(words[0])
+    pos_freq = [Counter(w[i] for w in words) for i in range(length)]
     global_freq = Counter("".join(words))
 
     def score_word(w: str) -> float:
         uniq = len(set(w))
         pos_score = sum(pos_freq[i][ch] for i, ch in enumerate(w))
         letter_score = sum(global_freq[ch] for ch in set(w))
-        repeat_penalty = 0.15 * (5 - uniq)
+        repeat_penalty = 0.15 * (length - uniq)
         return pos_score + letter_score - repeat_penalty
 
     return sorted(words, key=score_word, reverse=True)
@@ -268,15 +530,39 @@ def solvable_words(
 # Interactive loop
 # --------------------------------
 
+_MARK_DIGITS = {"y": 2, "n": 1, "x": 0}
+
+
+def main(argv: List[str] | None = None):
+    import argparse
 
-def main():
+    import wordlist
+
+    parser = argparse.ArgumentParser(description="Hard-mode Wordle assistant.")
+    parser.add_argument(
+        "--length",
+        type=int,
+        choices=wordlist.SOLVER_LENGTHS,
+        default=5,
+        help="word length: 5 uses fives.txt, 4-8 the words of english3.txt (default: 5)",
+    )
+    args = parser.parse_args(argv)
+    length = args.length
+    source = wordlist.source_for_length(length)
     try:
-        with open("fives.txt", "r") as f:
-            words = [w.strip().lower() for w in f if len(w.strip()) == 5]
+        words = wordlist.words_of_length(length)
     except FileNotFoundError:
-        print("Could not open 'fives.txt'.", file=sys.stderr)
+        print(f"Could not open '{source}'.", file=sys.stderr)
+        sys.exit(1)
+    if not words:
+        print(f"No {length}-letter words in '{source}'.", file=sys.stderr)
         sys.exit(1)
 
+    import pattern_matrix  # imports this module; kept local to avoid a cycle
+
+    use_pattern_matrix(pattern_matrix.load_pattern_matrix(words, words, verbose=True))
+    candidate_index.register(words)  # every turn filters the full list again
+
     positions_list: List[Tuple[str, int, bool]] = []
     excluded_letters = ""
     present_counts_by_turn: List[Counter] = []
@@ -292,15 +578,15 @@ def main():
     for attempt in range(6):
         print(f"\nAttempt {attempt + 1}/6")
         while True:
-            guess = input("Enter your 5-letter word: ").strip().lower()
-            if len(guess) == 5 and guess.isalpha():
+            guess = input(f"Enter your {length}-letter word: ").strip().lower()
+            if len(guess) == length and guess.isalpha():
                 break
-            print("Please enter exactly 5 letters.")
+            print(f"Please enter exactly {length} letters.")
 
         per_letter_marks = []
+        code = 0
         guess_counts = Counter(guess)
         turn_present = Counter()
-        greens_this_turn = 0
 
         # PRETTY INPUT PROMPTS
         for j, ch in enumerate(guess):
@@ -316,10 +602,9 @@ def main():
                     break
                 print("Please respond with 'y', 'n', or 'x'.")
             per_letter_marks.append((ch, j, status))
+            code = code * 3 + _MARK_DIGITS[status]
             if status in {"y", "n"}:
                 turn_present[ch] += 1
-            if status == "y":
-                greens_this_turn += 1
 
         present_counts_by_turn.append(turn_present)
         ub_this_turn = {
@@ -340,7 +625,7 @@ def main():
                 if ch not in turn_present_letters:
                     excluded_letters += ch
 
-        if greens_this_turn == 5:
+        if code == all_green_code(length):
             print("Congratulations! You've guessed the word!")
             return
 
@@ -363,7 +648,7 @@ def main():
         freq_top = sort_words(candidates)[:5]
         print("\nTop 5 by frequency:", freq_top)
         best = pick_best_hard_mode_guess(candidates, prefer_entropy=True)
-        ranked = rank_candidates_by_entropy(candidates)[:5]
+        ranked = top_candidates_by_entropy(candidates, 5)
         pretty_ranked = [f"{w} (H={ent:.3f})" for w, ent, _ in ranked]
 
         print("\nBest next guess:", best)
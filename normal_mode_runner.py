@@ -9,13 +9,20 @@ Heuristics:
 - Optionally force 2 info-rich openers (AROSE, TULIP) for 10 unique letters.
 - Otherwise, pick max-entropy from the full guess list.
 - Switch to answer-only when |candidates| <= FINISH_SWITCH (default 12).
+- --length N plays N-letter words from english3.txt; the forced opener is then the
+  list's best entropy pick (worked out once per run) instead of OPENERS.
 """
 
+import argparse
 import sys
-from collections import Counter
-from typing import List
+from typing import Dict, List
 
 import new_advanced_solver as solver  # adjust import name if needed
+import pattern_matrix
+import sweep
+import wordlist
+from game_state import GameState
+from guess_cache import GuessCache
 
 # --- Config ---
 FORCE_OPENERS: bool = True
@@ -25,12 +32,12 @@ SHOW_PROGRESS_EVERY: int = 100
 
 
 def color_word(guess: str, answer: str) -> str:
-    pattern = solver.feedback_pattern(guess, answer)  # '2','1','0'
+    code = solver.feedback_code(solver.word_codes(guess), solver.word_codes(answer))
     pieces = []
-    for ch, p in zip(guess, pattern):
-        if p == "2":
+    for ch, p in zip(guess, solver.pattern_digits(code, len(guess))):
+        if p == 2:
             pieces.append(f"\033[92m{ch.upper()}\033[0m")  # green
-        elif p == "1":
+        elif p == 1:
             pieces.append(f"\033[93m{ch.upper()}\033[0m")  # yellow
         else:
             pieces.append(f"\033[90m{ch.upper()}\033[0m")  # gray
@@ -45,56 +52,26 @@ def simulate_one(
     `answers` is the candidate answer set; `guesses` is the full allowed guess list.
     They can be the same list if you only have one file.
     """
-    positions_list: list[tuple[str, int, bool]] = []
-    excluded_letters: str = ""
-    present_counts_by_turn: list[Counter] = []
-    upper_bounds_by_turn: list[dict[str, int]] = []
+    state = GameState(answers)  # candidate answers, narrowed each turn
 
-    guess = OPENERS[0] if FORCE_OPENERS and OPENERS else guesses[0]
+    answer_codes = solver.word_codes(answer)
+    green = solver.all_green_code(len(answer))
+    guess = first_guess(guesses)
 
     for turn in range(6):
-        pattern = solver.feedback_pattern(guess, answer)
+        code = solver.feedback_code(solver.word_codes(guess), answer_codes)
 
         if verbose:
             print(
-                f"Attempt {turn + 1}/6  Guess: {color_word(guess, answer)}  Pattern: {pattern}"
+                f"Attempt {turn + 1}/6  Guess: {color_word(guess, answer)}  Pattern: {solver.decode_pattern(code, len(guess))}"
             )
 
-        if pattern == "22222":
+        if code == green:
             return turn + 1
 
-        # Build per-turn counts
-        guess_counts = Counter(guess)
-        turn_present = Counter(ch for ch, p in zip(guess, pattern) if p in ("1", "2"))
-        present_counts_by_turn.append(Counter(turn_present))
-
-        # Upper bounds this turn (duplicates probe)
-        ub_this_turn = {}
-        for ch, gcount in guess_counts.items():
-            pcnt = turn_present[ch]
-            if gcount > pcnt:
-                ub_this_turn[ch] = pcnt
-        upper_bounds_by_turn.append(ub_this_turn)
-
-        # Update constraints
-        for idx, (ch, p) in enumerate(zip(guess, pattern)):
-            if p == "2":
-                positions_list.append((ch, idx, True))
-            elif p == "1":
-                positions_list.append((ch, idx, False))
-            else:
-                if ch not in turn_present:
-                    excluded_letters += ch
-
-        # Compute current candidate answers given constraints
-        candidates = solver.solvable_words(
-            answers,
-            letters="",  # legacy arg
-            positions=positions_list,
-            excluded_letters_string=excluded_letters,
-            present_counts_by_turn=present_counts_by_turn,
-            upper_bounds_by_turn=upper_bounds_by_turn,
-        )
+        # Narrow the current candidate answers by this turn's feedback
+        state.apply(guess, code)
+        candidates = state.candidates()
 
         if not candidates:
             # No answers consistent with feedback -> mark unsolved (defensive)
@@ -102,56 +79,241 @@ def simulate_one(
                 print("No candidates remain under constraints.")
             return 7
 
-        # Pick next guess:
-        # 1) If forcing openers, use them for the first few turns unless we are already in finishing range
-        if (
-            FORCE_OPENERS
-            and turn + 1 < len(OPENERS)
-            and len(candidates) > FINISH_SWITCH
-        ):
-            guess = OPENERS[turn + 1]
-            continue
-
-        # 2) If many candidates remain, pick the *best information* from the full guesses list
-        if len(candidates) > FINISH_SWITCH:
-            guess = solver.pick_best_from_guess_list(
-                guesses, candidates, prefer_entropy=True
-            )
-        else:
-            # 3) Finish: restrict to candidate answers and choose a strong finisher
-            guess = solver.pick_best_hard_mode_guess(candidates, prefer_entropy=True)
-
+        guess = choose_guess(turn, candidates, guesses)
         if not guess:
             return 7
 
     return 7
 
 
-def main():
+# Forced openers of other word lengths, by length (OPENERS are the 5-letter ones).
+_OPENERS: Dict[int, List[str]] = {}
+
+
+def openers_for(guesses: List[str]) -> List[str]:
+    """OPENERS for 5-letter lists; otherwise the best entropy pick over the whole list."""
+    length = len(guesses[0]) if guesses else 5
+    if length == 5:
+        return OPENERS
+    openers = _OPENERS.get(length)
+    if openers is None:
+        best = solver.pick_best_from_guess_list(guesses, guesses, prefer_entropy=True)
+        openers = _OPENERS[length] = [best] if best else []
+    return openers
+
+
+def first_guess(guesses: List[str]) -> str:
+    openers = openers_for(guesses) if FORCE_OPENERS else []
+    return openers[0] if openers else guesses[0]
+
+
+def choose_guess(turn: int, candidates: List[str], guesses: List[str]) -> str:
+    """
+    Next guess once turns 0..`turn` have been played and left `candidates`.
+    Depends only on (turn, candidates), so answers sharing a feedback history share it.
+    """
+    # 1) If forcing openers, use them for the first few turns unless we are already in finishing range
+    if FORCE_OPENERS and len(candidates) > FINISH_SWITCH:
+        openers = openers_for(guesses)
+        if turn + 1 < len(openers):
+            return openers[turn + 1]
+
+    # 2) If many candidates remain, pick the *best information* from the full guesses list
+    if len(candidates) > FINISH_SWITCH:
+        return solver.pick_best_from_guess_list(guesses, candidates, prefer_entropy=True)
+
+    # 3) Finish: restrict to candidate answers and choose a strong finisher
+    return solver.pick_best_hard_mode_guess(candidates, prefer_entropy=True)
+
+
+# Lists used by _score_answer: set by main() for serial runs, by _init_worker in pool workers.
+_ANSWERS: List[str] = []
+_GUESSES: List[str] = []
+
+
+def _init_worker(
+    shm_name: str,
+    size: int,
+    cache_path: str | None = None,
+    lookahead: tuple | None = None,
+    openers: List[str] | None = None,
+) -> None:
+    """Pool initializer: attach to the shared word list and mmap the cached pattern matrix."""
+    global _ANSWERS, _GUESSES
+    _ANSWERS = _GUESSES = sweep.attach_words(shm_name, size)
+    if openers is not None and _GUESSES and len(_GUESSES[0]) != 5:
+        _OPENERS[len(_GUESSES[0])] = openers
+    matrix = pattern_matrix.load_pattern_matrix(_GUESSES, _ANSWERS, build=False)
+    solver.use_pattern_matrix(matrix)
+    solver.use_guess_cache(GuessCache(path=cache_path))
+    if lookahead is not None:
+        from lookahead import Lookahead
+
+        solver.use_lookahead(Lookahead(matrix, *lookahead))
+
+
+def _score_answer(idx: int) -> int:
+    return simulate_one(_ANSWERS[idx], _ANSWERS, _GUESSES, verbose=False)
+
+
+def main(argv: List[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="Simulate normal-mode games for every word in fives.txt (or the --length list)."
+    )
+    parser.add_argument(
+        "--length",
+        type=int,
+        choices=wordlist.SOLVER_LENGTHS,
+        default=5,
+        help="word length: 5 uses fives.txt, 4-8 the words of english3.txt (default: 5)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes to split the answers across (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--guess-cache",
+        metavar="PATH",
+        help="load memoized best-guess picks from PATH and save them back (serial runs)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PREFIX",
+        help="instrument and cProfile the run; writes PREFIX.json and PREFIX.folded",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="PREFIX",
+        help="count calls and time the solver without cProfile; writes PREFIX.json",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="append every scored answer to PATH (JSON lines) as the sweep goes",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the sweep in --checkpoint PATH, skipping answers already scored",
+    )
+    parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=0,
+        metavar="K",
+        help="two-step lookahead over the top K one-step guesses (default: 0, off)",
+    )
+    parser.add_argument(
+        "--follow-k",
+        type=int,
+        default=100,
+        help="follow-up guesses scored per lookahead bucket (default: 100)",
+    )
+    parser.add_argument(
+        "--margin",
+        type=float,
+        default=0.1,
+        help="drop lookahead guesses this far (relative) behind the best one-step score",
+    )
+    args = parser.parse_args(argv)
+    if args.profile and args.workers > 1:
+        parser.error("--profile only covers this process: use --workers 1")
+    if args.stats and args.workers > 1:
+        parser.error("--stats only covers this process: use --workers 1")
+    if args.profile and args.stats:
+        parser.error("--profile already writes the --stats counters")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint PATH")
+
     # Load lists. If you have separate files (answers.txt vs guesses.txt), load them separately.
+    source = wordlist.source_for_length(args.length)
     try:
-        with open("fives.txt", "r") as f:
-            all_words = [w.strip().lower() for w in f if len(w.strip()) == 5]
+        all_words = wordlist.words_of_length(args.length)
     except FileNotFoundError:
         print(
-            "Could not open 'fives.txt'. Please place it in this folder.",
+            f"Could not open '{source}'. Please place it in this folder.",
             file=sys.stderr,
         )
         sys.exit(1)
+    if not all_words:
+        print(f"No {args.length}-letter words in '{source}'.", file=sys.stderr)
+        sys.exit(1)
 
     # Using the same list for answers and guesses by default.
     answers = all_words
     guesses = all_words
+    matrix = pattern_matrix.load_pattern_matrix(guesses, answers, verbose=True)
+    solver.use_pattern_matrix(matrix)
+    lookahead = None
+    if args.lookahead > 0:
+        from lookahead import Lookahead
+
+        lookahead = (args.lookahead, args.follow_k, args.margin)
+        picker = Lookahead(matrix, *lookahead)
+        solver.use_lookahead(picker)
+    # Answers that reach the same candidate set share one pick.
+    cache = GuessCache(path=args.guess_cache)
+    solver.use_guess_cache(cache)
+
+    global _ANSWERS, _GUESSES
+    _ANSWERS, _GUESSES = answers, guesses
+    openers = openers_for(guesses) if FORCE_OPENERS else []
 
     scores: list[int] = []
     unsolved: list[str] = []
 
+    session = None
+    if args.profile or args.stats:
+        import profiling
+
+        session = profiling.start(
+            args.profile or args.stats,
+            solver,
+            sys.modules[__name__],
+            cprofile=bool(args.profile),
+        )
+
     total = len(answers)
-    for idx, answer in enumerate(answers, start=1):
-        res = simulate_one(answer, answers, guesses, verbose=False)
+    checkpoint, done = None, {}
+    if args.checkpoint:
+        words_key = pattern_matrix.word_list_key(guesses, answers)
+        fingerprint = {
+            "runner": "normal_mode_runner",
+            "openers": openers,
+            "finish_switch": FINISH_SWITCH,
+            "lookahead": list(lookahead) if lookahead else None,
+            "words": words_key,
+        }
+        try:
+            checkpoint, done = sweep.start_checkpoint(
+                args.checkpoint, fingerprint, args.resume, every=SHOW_PROGRESS_EVERY
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        if args.resume:
+            print(f"Resuming: {len(done)}/{total} answers already scored", file=sys.stderr)
+
+    # Workers only receive one shared list, so answers and guesses must be the same here.
+    results = sweep.resume_answers(
+        done,
+        total,
+        lambda pending: sweep.map_answers(
+            _score_answer,
+            pending,
+            args.workers,
+            answers,
+            _init_worker,
+            extra_initargs=(args.guess_cache, lookahead, openers),
+        ),
+    )
+    for idx, (answer, res) in enumerate(zip(answers, results), start=1):
         scores.append(res)
         if res == 7:
             unsolved.append(answer)
+        if checkpoint is not None:
+            checkpoint.record(idx - 1, answer, res, res == 7)
 
         if idx % SHOW_PROGRESS_EVERY == 0 or idx == total:
             solved = idx - len(unsolved)
@@ -168,6 +330,9 @@ def main():
     hardest_idx = scores.index(max_score) if scores else -1
     hardest_word = answers[hardest_idx] if hardest_idx >= 0 else ""
 
+    if checkpoint is not None:
+        checkpoint.close()
+
     print("\n=== Final Results ===")
     print("Unsolved words:", len(unsolved))
     if unsolved:
@@ -176,6 +341,30 @@ def main():
     print(f"Average score: {avg_score:.5f}")
     print(f"Max score: {max_score}  ({hardest_word})")
 
+    if args.workers <= 1:
+        st = cache.stats()
+        print(
+            f"Guess cache: {st['hits']} hits, {st['misses']} misses ({st['hit_rate']:.1%})",
+            file=sys.stderr,
+        )
+        if args.guess_cache:
+            cache.save()
+        if lookahead is not None:
+            st = picker.stats()
+            print(
+                f"Lookahead: {st['calls']} picks ({st['fallbacks']} one-step), "
+                f"{st['seconds']:.2f}s, {st['ms_per_call']:.1f} ms/pick",
+                file=sys.stderr,
+            )
+    if session is not None:
+        session.finish()
+        if args.profile:
+            print(
+                f"Profile: {args.profile}.json, {args.profile}.folded", file=sys.stderr
+            )
+        else:
+            print(f"Stats: {args.stats}.json", file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()
@@ -1,35 +1,57 @@
-from itertools import combinations
-
-def load_words(file_path):
-    with open(file_path, "r") as f:
-        return f.read().split('\n')
-
-def word_letter_sets(words):
-    return {word: set(word) for word in words}
-
-def find_combination(words):
-    word_sets = word_letter_sets(words)
-    best_combo = None
-    first_word = 'crane'
-    second_word = 'blyth'
-    remaining_words = [w for w in words if not word_sets[w] & (word_sets[first_word] | word_sets[second_word])]
-    for combo in combinations(remaining_words, 3):
-        if best_combo == None or len(set(''.join((first_word, second_word,*combo)))) > len(set(''.join(best_combo))):
-            best_combo = (first_word, second_word, *combo)
-            alpha = [i for i in list('abcdefghijklmnopqrstuvwxyz') if i not in list(set(''.join((first_word, second_word,*combo))))]
-            alpha.sort()
-            print((first_word, second_word, *combo), len(set(''.join((first_word, second_word,*combo)))),'Missing:',alpha)
-        combined_set = word_sets[first_word].union(*[word_sets[w] for w in combo])
-        if len(combined_set) == 25:
-            return (first_word, second_word, *combo)
-    return None
-
-# Load words from file
-words = load_words("uniques.txt")
-
-# Find the combination
-combo = find_combination(words)
-if combo:
-    print("Found combination:", combo)
-else:
-    print("No combination found.")
+"""
+Octordle openers starting with crane and blyth: the three words that, added to them,
+cover the most letters (letter_cover.CoverSearch; every best set is listed).
+Like before, the added words share no letter with crane or blyth.
+The search runs over letter-set classes (letter_cover.LetterClasses) and expands each
+result to every concrete word combination; the sets are printed by the total.json
+frequency of the letters they cover, as octordle3 ranks its ties.
+"""
+
+from typing import List, Tuple
+
+import wordlist
+from letter_cover import (
+    CoverSearch,
+    LetterClasses,
+    letter_mask,
+    missing_letters,
+    rank_by_frequency,
+)
+
+FIXED = ("crane", "blyth")
+
+
+def find_combinations(
+    words: List[str], fixed=FIXED, k: int = 5
+) -> Tuple[int, List[Tuple[str, ...]]]:
+    """(best coverage, every k-word set with it that extends `fixed`, in list order)."""
+    classes = LetterClasses(words)
+    engine = CoverSearch(classes.representatives())
+    used = 0
+    for w in fixed:
+        used |= letter_mask(w)
+    pool = [c for c, m in enumerate(classes.masks) if not m & used]
+    for target in range(min(26, 5 * k), 0, -1):
+        found = list(engine.search_ids(k, target, list(fixed), pool))
+        if found:
+            combos = [tuple(fixed) + c for ids in found for c in classes.expand(ids)]
+            index = {w: i for i, w in enumerate(words)}
+            combos.sort(key=lambda c: [index[w] for w in c[len(fixed) :]])
+            return target, combos
+    return 0, []
+
+
+def main() -> None:
+    words = wordlist.load_words("uniques.txt")
+    count, combos = find_combinations(words)
+    combos = rank_by_frequency(combos)
+    for combo in combos:
+        print(combo, count, "Missing:", missing_letters(combo))
+    if combos:
+        print("Found combination:", combos[0])
+    else:
+        print("No combination found.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,70 +1,69 @@
-from itertools import combinations
+"""
+Five-word octordle openers: any first word plus four single-vowel words that share no
+letter with it, covering as many letters as possible.
+- For every first word (in list order) the partner words come from the words after it,
+  and the first combination in list order with the best coverage is that word's entry;
+  the entries that reach the overall best coverage are the ties.
+- Ties are ranked by the total.json frequency of the letters they cover.
+The search runs on letter masks (letter_cover.CoverSearch) instead of trying every
+combination of four words, so the whole list takes seconds instead of hours. It runs
+over letter-set classes (letter_cover.LetterClasses): one search per class of first
+words, whose results are expanded back to each concrete first word and its partners.
+"""
 
-def load_words(file_path):
-    with open(file_path, "r") as f:
-        return f.read().split('\n')
+from typing import List, Tuple
 
-def has_one_vowel(word):
-    vowels = set("aeiouy")
-    return sum(1 for letter in word if letter in vowels) == 1
+import wordlist
+from letter_cover import (
+    CoverSearch,
+    LetterClasses,
+    has_one_vowel,
+    missing_letters,
+    rank_by_frequency,
+)
 
-def find_combination(words, first_word):
-    words_with_one_vowel = [word for word in words if has_one_vowel(word)]
-    best_combo = None
-    best_count = 0
 
-    used_letters = set(first_word)
-    remaining_words = [w for w in words_with_one_vowel if not set(w).intersection(used_letters)]
+def find_ties(words: List[str], k: int = 5) -> Tuple[int, List[Tuple[str, ...]]]:
+    """(best coverage, one combination per first word that reaches it)."""
+    classes = LetterClasses(words)
+    engine = CoverSearch(classes.representatives())
+    single_vowel = [c for c, w in enumerate(engine.words) if has_one_vowel(w)]
+    for target in range(min(26, 5 * k), 0, -1):
+        ties = []
+        for c, first in enumerate(engine.words):
+            members = classes.members[c]
+            # partners must come after some member of the class
+            pool = [
+                p
+                for p in single_vowel
+                if classes.members[p][-1] > members[0] and not classes.masks[p] & classes.masks[c]
+            ]
+            found = list(engine.search_ids(k, target, [first], pool))
+            if not found:
+                continue
+            for i in members:
+                expansions = (classes.first_expansion(ids, after=i) for ids in found)
+                best = min((e for e in expansions if e is not None), default=None)
+                if best is not None:
+                    ties.append((i, best))
+        if ties:
+            ties.sort()
+            return target, [(words[i],) + tuple(words[j] for j in best) for i, best in ties]
+    return 0, []
 
-    for combo in combinations(remaining_words, 4):
-        full_combo = (first_word, *combo)
-        combined_set = set(''.join(full_combo))
-        unique_count = len(combined_set)
 
-        if unique_count > best_count:
-            best_combo = full_combo
-            best_count = unique_count
-            missing_letters = sorted(set("abcdefghijklmnopqrstuvwxyz") - combined_set)
-            print(f"{best_combo} {unique_count}; Missing: {missing_letters}")
+def main() -> None:
+    words = wordlist.load_words("uniques.txt")
+    count, ties = find_ties(words)
+    print("TIES:")
+    for combo in ties:
+        print(f"{combo} {count}; Missing: {missing_letters(combo)}")
 
-        if unique_count == 25:
-            return best_combo
-
-    return best_combo
-
-# Load words from file
-original_words = load_words("uniques.txt")
-words = list(original_words)[34:]
-the_best_combo = ('abysm', 'flick', 'phlox', 'veldt', 'wrung')
-ties = [('abysm', 'flick', 'phlox', 'veldt', 'wrung'), ('admix', 'bergs', 'flown', 'klutz', 'psych'), ('adoze', 'blyth', 'flick', 'jumps', 'wring')]
-ties.reverse()
-# Find the combination with 'slate' as the first word
-for w in range(original_words.index('adoze')+1,len(original_words)):
-    i = original_words[w]
-    words.remove(i)
-    print(i)
-    combo = find_combination(words, i)
-    # if combo's letters > best_combo's letters
-    if the_best_combo == None or (combo != None and len(set(''.join(combo))) > len(set(''.join(the_best_combo)))):
-        the_best_combo = combo
-        ties = [the_best_combo]
-        print('NEW',end=' ')
-    elif combo != None and len(set(''.join(combo))) == len(set(''.join(the_best_combo))):
-        ties.append(combo)
-        print('TIE',end=' ')
-    print('best combo:')
-    print(f"{the_best_combo} {len(set(''.join(the_best_combo)))}; Missing: {sorted(set('abcdefghijklmnopqrstuvwxyz') - set(''.join(the_best_combo)))}")
-    print('TIES:')
+    # rank the ties by the frequency of the letters they cover
+    ties = rank_by_frequency(ties)
     print(ties)
+    print("BEST COMBO:", ties[0] if ties else None)
 
-# load from total.json the frequencies
-import json
-with open('total.json') as f:
-    data = json.load(f)
-    # rank the ties by frequency
-    print(data['letters']['a'])
-    ties.sort(key=lambda x: sum([data['letters'][i] for i in set(''.join(x))]),reverse=True)
-    print(ties)
-    f.close()
 
-print('BEST COMBO:', ties[0])
\ No newline at end of file
+if __name__ == "__main__":
+    main()
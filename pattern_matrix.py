@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Precomputed guess x answer feedback-pattern matrix.
+- Pattern codes are the base-3 value of feedback_pattern strings ('00000' -> 0, '22222' -> 242).
+- Stored on disk as a raw matrix behind a small header, memory-mapped on load: uint8
+  codes up to 5 letters, little-endian uint16 from 6 letters (3**6 > 256) up to 10.
+- The cache file is keyed by a hash of the guess/answer lists, so it is rebuilt only when they change.
+- NumPy is optional: without it the mmap is read as plain bytes.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+import new_advanced_solver as solver
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python fallback
+    np = None
+
+CACHE_DIR = "pattern_cache"
+MAGIC = b"WPAT"
+VERSION = 1
+# magic, version, word length, sha256 of the word lists, n_guesses, n_answers
+_HEADER = struct.Struct("<4sHH32sII")
+
+
+def word_list_key(guesses: Sequence[str], answers: Sequence[str]) -> str:
+    """Hex digest identifying a (guesses, answers) pair; any change to either list changes it."""
+    h = hashlib.sha256()
+    h.update("\n".join(guesses).encode())
+    h.update(b"\0")
+    h.update("\n".join(answers).encode())
+    return h.hexdigest()
+
+
+def pattern_code(guess: str, answer: str) -> int:
+    return int(solver.feedback_pattern(guess, answer), 3)
+
+
+def code_itemsize(length: int) -> int:
+    """Bytes per stored pattern code for words of `length` letters (at most 10)."""
+    if 3**length > 65536:
+        raise ValueError(f"{length}-letter pattern codes do not fit in uint16")
+    return 1 if 3**length <= 256 else 2
+
+
+def code_typecode(length: int) -> str:
+    """array / memoryview type code of the stored pattern codes."""
+    return "B" if code_itemsize(length) == 1 else "H"
+
+
+def code_dtype(length: int):
+    """NumPy dtype of the stored pattern codes."""
+    return np.uint8 if code_itemsize(length) == 1 else np.dtype("<u2")
+
+
+def build_pattern_matrix_scalar(
+    guesses: Sequence[str], answers: Sequence[str]
+) -> bytearray:
+    """Reference builder: one feedback_pattern call per (guess, answer) pair."""
+    length = len(guesses[0]) if guesses else 0
+    if code_itemsize(length) == 1:
+        data = bytearray(len(guesses) * len(answers))
+        pos = 0
+        for g in guesses:
+            for a in answers:
+                data[pos] = pattern_code(g, a)
+                pos += 1
+        return data
+    wide = array("H", (pattern_code(g, a) for g in guesses for a in answers))
+    if sys.byteorder != "little":
+        wide.byteswap()
+    return bytearray(wide.tobytes())
+
+
+def letter_codes(words: Sequence[str]):
+    """(len(words), word_length) uint8 array of per-position letter codes."""
+    length = len(words[0]) if words else 0
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return raw.reshape(len(words), length)
+
+
+def build_pattern_block(g_codes, a_codes, a_counts):
+    """
+    Pattern codes for a block of guesses against all answers, shape (len(g_codes), len(a_codes)).
+    `a_counts` is the (len(a_codes), 256) letter-count table of the answers.
+    Same duplicate-letter rules as feedback_pattern: greens first, then yellows left to right,
+    each limited by the copies of that letter left over in the answer's non-green positions.
+    """
+    length = g_codes.shape[1]
+    green = g_codes[:, None, :] == a_codes[None, :, :]  # (b, a, L)
+    # dup[b, k, i]: guess positions k and i hold the same letter
+    dup = g_codes[:, :, None] == g_codes[:, None, :]
+    codes = np.zeros(green.shape[:2], dtype=np.int64)
+    for i in range(length):
+        # copies of guess letter i in the answer that are not already used by a green
+        left = a_counts[:, g_codes[:, i]].T.astype(np.int8)  # (b, a)
+        # earlier non-green copies of the same letter in the guess claim yellows first
+        prior = np.zeros_like(left)
+        for j in range(length):
+            same = dup[:, j, i][:, None]
+            left -= green[:, :, j] & same
+            if j < i:
+                prior += ~green[:, :, j] & same
+        yellow = ~green[:, :, i] & (left > prior)
+        codes = codes * 3 + (2 * green[:, :, i] + yellow)
+    return codes
+
+
+def build_pattern_matrix(
+    guesses: Sequence[str], answers: Sequence[str], block: int = 64
+) -> bytearray:
+    """
+    Row-major code matrix (raw bytes, see code_itemsize): entry [g * len(answers) + a] is the
+    code of guesses[g] vs answers[a]. Built a block of guess rows at a time with NumPy; falls
+    back to the scalar builder without it.
+    """
+    if np is None or not guesses or not answers:
+        return build_pattern_matrix_scalar(guesses, answers)
+    g_codes = letter_codes(guesses)
+    a_codes = letter_codes(answers)
+    a_counts = np.zeros((len(answers), 256), dtype=np.int8)
+    for j in range(a_codes.shape[1]):
+        np.add.at(a_counts, (np.arange(len(answers)), a_codes[:, j]), 1)
+    out = np.empty((len(guesses), len(answers)), dtype=code_dtype(g_codes.shape[1]))
+    for start in range(0, len(guesses), block):
+        out[start : start + block] = build_pattern_block(
+            g_codes[start : start + block], a_codes, a_counts
+        )
+    return bytearray(out.tobytes())
+
+
+def verify_pattern_matrix(
+    matrix: "PatternMatrix", guesses: Sequence[str], answers: Sequence[str]
+) -> int:
+    """Check every (guess, answer) entry against the scalar feedback_pattern; returns mismatches."""
+    bad = 0
+    for g in guesses:
+        row = matrix.row(g)
+        for ai, a in enumerate(answers):
+            if row[ai] != pattern_code(g, a):
+                bad += 1
+    return bad
+
+
+def score_histograms(hist, n: int):
+    """(entropy, expected_remaining, n_buckets) per row of a bucket-count histogram."""
+    counts = hist.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clog = np.where(hist > 0, counts * np.log2(counts), 0.0)
+    n = max(n, 1)
+    entropy = math.log2(n) - clog.sum(axis=1) / n
+    expected = (counts * counts).sum(axis=1) / n
+    return entropy, expected, (hist > 0).sum(axis=1)
+
+
+def score_sorted_codes(rows, n: int):
+    """
+    Same as score_histograms(histograms of rows, n), from a (b, n) block of codes instead:
+    each row is sorted and its runs are the buckets. Cheaper when 3**length is much larger
+    than the number of candidates (long words).
+    """
+    b = rows.shape[0]
+    rows = np.sort(rows, axis=1)
+    starts_mask = np.ones(rows.shape, dtype=bool)
+    starts_mask[:, 1:] = rows[:, 1:] != rows[:, :-1]
+    starts = np.flatnonzero(starts_mask.ravel())
+    runs = np.diff(np.r_[starts, b * n]).astype(np.float64)
+    row_of = starts // n
+    clog = np.bincount(row_of, weights=runs * np.log2(runs), minlength=b)
+    squares = np.bincount(row_of, weights=runs * runs, minlength=b)
+    n = max(n, 1)
+    entropy = math.log2(n) - clog / n
+    return entropy, squares / n, np.bincount(row_of, minlength=b)
+
+
+class PatternMatrix:
+    """Read-only view of a (possibly memory-mapped) pattern matrix with word -> index lookups."""
+
+    def __init__(
+        self, guesses: Sequence[str], answers: Sequence[str], buf, offset: int = 0
+    ):
+        self.guesses: List[str] = list(guesses)
+        self.answers: List[str] = list(answers)
+        self.guess_index: Dict[str, int] = {w: i for i, w in enumerate(self.guesses)}
+        self.answer_index: Dict[str, int] = {w: i for i, w in enumerate(self.answers)}
+        self.n_guesses = len(self.guesses)
+        self.n_answers = len(self.answers)
+        self.length = len(self.guesses[0]) if self.guesses else 0
+        self.n_codes = 3**self.length
+        self._buf = buf
+        self._last_candidates: Optional[Sequence[str]] = None
+        self._last_ids = None
+        self._last_guesses: Optional[Sequence[str]] = None
+        self._last_guess_ids = None
+        itemsize = code_itemsize(self.length)
+        self._raw = memoryview(buf)[offset : offset + self.n_guesses * self.n_answers * itemsize]
+        if itemsize == 1:
+            self._view = self._raw
+        elif sys.byteorder == "little":
+            self._view = self._raw.cast("H")
+        else:
+            wide = array("H", self._raw)
+            wide.byteswap()
+            self._view = memoryview(wide)
+        self.array = None
+        if np is not None:
+            self.array = np.frombuffer(self._raw, dtype=code_dtype(self.length)).reshape(
+                self.n_guesses, self.n_answers
+            )
+
+    def code(self, guess: str, answer: str) -> int:
+        gi = self.guess_index[guess]
+        return self._view[gi * self.n_answers + self.answer_index[answer]]
+
+    def row(self, guess: str) -> Optional[memoryview]:
+        """Codes of `guess` against every answer, or None if `guess` is not in the matrix."""
+        gi = self.guess_index.get(guess)
+        if gi is None:
+            return None
+        start = gi * self.n_answers
+        return self._view[start : start + self.n_answers]
+
+    def answer_ids(self, words: Sequence[str]) -> Optional[List[int]]:
+        """Answer indices for `words`, or None if any of them is not a matrix column."""
+        idx = self.answer_index
+        try:
+            return [idx[w] for w in words]
+        except KeyError:
+            return None
+
+    def _candidate_ids(self, candidates: Sequence[str]):
+        # A scan scores many guesses against one candidate list: convert it only once.
+        if self._last_candidates is not candidates:
+            ids = self.answer_ids(candidates)
+            if ids is not None and self.array is not None:
+                ids = np.asarray(ids, dtype=np.intp)
+            self._last_candidates, self._last_ids = candidates, ids
+        return self._last_ids
+
+    def codes(self, guess: str, candidates: Sequence[str]) -> Optional[List[int]]:
+        """Codes of `guess` against each candidate, or None if either is not covered."""
+        gi = self.guess_index.get(guess)
+        if gi is None:
+            return None
+        ids = self._candidate_ids(candidates)
+        if ids is None:
+            return None
+        if self.array is not None:
+            return self.array[gi, ids].tolist()
+        start = gi * self.n_answers
+        row = self._view[start : start + self.n_answers]
+        return [row[i] for i in ids]
+
+    def bucket_sizes(self, guess: str, candidates: Sequence[str]) -> Optional[List[int]]:
+        """
+        Pattern bucket sizes in first-seen order, i.e. the same order as
+        solver.pattern_counts_for_guess, so entropies come out bit-identical.
+        """
+        codes = self.codes(guess, candidates)
+        if codes is None:
+            return None
+        return list(Counter(codes).values())
+
+    def pattern_counts(
+        self, guess: str, candidates: Sequence[str]
+    ) -> Optional[Dict[str, int]]:
+        codes = self.codes(guess, candidates)
+        if codes is None:
+            return None
+        n = len(guess)
+        return {solver.decode_pattern(c, n): k for c, k in Counter(codes).items()}
+
+    def guess_ids(self, words: Sequence[str]):
+        """Guess-row indices for `words` (NumPy array), or None if any is not a matrix row."""
+        if self._last_guesses is not words:
+            idx = self.guess_index
+            try:
+                ids = np.asarray([idx[w] for w in words], dtype=np.intp)
+            except KeyError:
+                ids = None
+            self._last_guesses, self._last_guess_ids = words, ids
+        return self._last_guess_ids
+
+    def score_guesses(self, guess_list: Sequence[str], candidates: Sequence[str]):
+        """
+        Batched scoring of every guess in `guess_list` against `candidates` in one NumPy pass.
+        Returns (entropy, expected_remaining, n_buckets) arrays aligned with guess_list,
+        or None when NumPy is missing or a word is not covered by the matrix.
+        """
+        if self.array is None or not candidates:
+            return None
+        gids = self.guess_ids(guess_list)
+        cids = self._candidate_ids(candidates)
+        if gids is None or cids is None:
+            return None
+        n = len(cids)
+        if self.n_codes <= 256:
+            return score_histograms(self.bucket_histograms(gids, cids), n)
+        # long words: a full histogram row per guess would be mostly zeros, so score a block
+        # at a time, by sorting when there are far fewer candidates than codes
+        step = max(1, (1 << 22) // max(n, self.n_codes))
+        parts = []
+        for start in range(0, len(gids), step):
+            block = gids[start : start + step]
+            if 4 * n < self.n_codes:
+                parts.append(score_sorted_codes(self.array[np.ix_(block, cids)], n))
+            else:
+                parts.append(score_histograms(self.bucket_histograms(block, cids), n))
+        return tuple(np.concatenate(p) for p in zip(*parts))
+
+    def bucket_histograms(self, guess_ids, candidate_ids, block: int = 1024):
+        """(len(guess_ids), 3**length) array: row g counts candidates per code for guess g."""
+        n_codes = max(self.n_codes, 1) if self.guesses else 1
+        block = max(1, min(block, (1 << 18) // n_codes))
+        out = np.empty((len(guess_ids), n_codes), dtype=np.int64)
+        for start in range(0, len(guess_ids), block):
+            rows = self.array[np.ix_(guess_ids[start : start + block], candidate_ids)]
+            b = rows.shape[0]
+            # shift each row into its own range of codes so one bincount does the whole block
+            flat = rows + (np.arange(b, dtype=np.int64) * n_codes)[:, None]
+            out[start : start + b] = np.bincount(
+                flat.ravel(), minlength=b * n_codes
+            ).reshape(b, n_codes)
+        return out
+
+    def close(self) -> None:
+        self.array = None
+        self._view.release()
+        self._raw.release()
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+
+def cache_path(key: str, cache_dir: str = CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f"patterns_{key[:16]}.bin")
+
+
+def save_pattern_matrix(
+    path: str, guesses: Sequence[str], answers: Sequence[str], data
+) -> None:
+    """Write header + matrix to `path` atomically (temp file, then rename)."""
+    key = word_list_key(guesses, answers)
+    length = len(guesses[0]) if guesses else 0
+    header = _HEADER.pack(
+        MAGIC, VERSION, length, bytes.fromhex(key), len(guesses), len(answers)
+    )
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def open_pattern_matrix(
+    path: str, guesses: Sequence[str], answers: Sequence[str]
+) -> Optional[PatternMatrix]:
+    """Memory-map `path` if its header matches the word lists; None if missing or stale."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        head = f.read(_HEADER.size)
+        if len(head) != _HEADER.size:
+            return None
+        magic, version, length, digest, n_g, n_a = _HEADER.unpack(head)
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or digest.hex() != word_list_key(guesses, answers)
+            or (n_g, n_a) != (len(guesses), len(answers))
+        ):
+            return None
+        if os.fstat(f.fileno()).st_size != _HEADER.size + n_g * n_a * code_itemsize(length):
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return PatternMatrix(guesses, answers, mm, offset=_HEADER.size)
+
+
+def load_pattern_matrix(
+    guesses: Sequence[str],
+    answers: Sequence[str],
+    cache_dir: str = CACHE_DIR,
+    build: bool = True,
+    verbose: bool = False,
+) -> Optional[PatternMatrix]:
+    """
+    Return the cached matrix for (guesses, answers), building and saving it first if needed.
+    With build=False a missing/stale cache returns None instead.
+    """
+    path = cache_path(word_list_key(guesses, answers), cache_dir)
+    matrix = open_pattern_matrix(path, guesses, answers)
+    if matrix is not None or not build:
+        return matrix
+    if verbose:
+        print(
+            f"Building {len(guesses)}x{len(answers)} pattern matrix -> {path}",
+            file=sys.stderr,
+        )
+    save_pattern_matrix(path, guesses, answers, build_pattern_matrix(guesses, answers))
+    return open_pattern_matrix(path, guesses, answers)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import wordlist
+
+    parser = argparse.ArgumentParser(description="Build (or check) the cached pattern matrix.")
+    parser.add_argument(
+        "--length",
+        type=int,
+        choices=wordlist.SOLVER_LENGTHS,
+        default=5,
+        help="word length (default: 5)",
+    )
+    parser.add_argument(
+        "--verify", action="store_true", help="check every entry against feedback_pattern"
+    )
+    args = parser.parse_args()
+    words = wordlist.words_of_length(args.length)
+    m = load_pattern_matrix(words, words, verbose=True)
+    print(f"{m.n_guesses}x{m.n_answers} matrix ready in {CACHE_DIR}/")
+    if args.verify:
+        mismatches = verify_pattern_matrix(m, words, words)
+        print(f"Verified against feedback_pattern: {mismatches} mismatches")
+        sys.exit(1 if mismatches else 0)
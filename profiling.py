@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation and profiling for the solver and the sweep runners.
+- Instrumentation.install swaps a module's (or class's) public functions for wrappers that
+  count calls and cumulative (inclusive) time. Nothing is wrapped unless a run asks for
+  it, so a normal run executes the original functions with no overhead at all.
+- Wrapping a runner's choose_guess records, per turn, how many decisions were made, the
+  candidate-set sizes they saw and their latency.
+- start(prefix, ...) also runs cProfile; finish() writes PREFIX.json (counters, per-turn
+  stats, top cProfile entries) and PREFIX.folded (collapsed stacks for flamegraph.pl /
+  speedscope, reconstructed from the cProfile call graph, so multi-caller splits are
+  proportional estimates).
+- start(prefix, ..., cprofile=False) keeps only the counters (the runners' --stats): the
+  wrappers cost one clock read per call, while cProfile slows every Python call down.
+"""
+
+import cProfile
+import inspect
+import json
+import pstats
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+FuncKey = Tuple[str, int, str]
+
+_WRAPPER_TAG = "timed:"
+
+
+class Instrumentation:
+    def __init__(self):
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.seconds: Dict[str, float] = defaultdict(float)
+        # turn -> [decisions, candidates summed, max candidates, seconds summed, max seconds]
+        self.turns: Dict[int, List[float]] = {}
+        self._originals: List[Tuple[object, str, Callable]] = []
+
+    def _timed(self, name: str, fn: Callable) -> Callable:
+        calls, seconds = self.calls, self.seconds
+        clock = time.perf_counter
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                calls[name] += 1
+                seconds[name] += clock() - start
+
+        # cProfile keys functions by code object: give every wrapper its own, so the call
+        # graph does not merge all instrumented functions into one node
+        wrapper.__code__ = wrapper.__code__.replace(co_name=_WRAPPER_TAG + name)
+        return wrapper
+
+    def install(self, owner, names: Optional[List[str]] = None, prefix: str = "") -> None:
+        """Wrap `names` (default: every public function defined in `owner`) in place."""
+        if names is None:
+            home = getattr(owner, "__name__", "")
+            module = owner.__module__ if inspect.isclass(owner) else home
+            names = [
+                name
+                for name, fn in vars(owner).items()
+                if inspect.isfunction(fn)
+                and not name.startswith("_")
+                and name != "main"
+                and fn.__module__ == module
+            ]
+        for name in names:
+            fn = getattr(owner, name)
+            self._originals.append((owner, name, fn))
+            setattr(owner, name, self._timed(prefix + name, fn))
+
+    def install_decisions(self, runner, name: str = "choose_guess") -> None:
+        """Record (turn, len(candidates), latency) for every runner.choose_guess call."""
+        fn = getattr(runner, name)
+        turns = self.turns
+        clock = time.perf_counter
+
+        @wraps(fn)
+        def wrapper(turn, candidates, *args, **kwargs):
+            start = clock()
+            try:
+                return fn(turn, candidates, *args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                n = len(candidates)
+                row = turns.get(turn)
+                if row is None:
+                    row = turns[turn] = [0, 0, 0, 0.0, 0.0]
+                row[0] += 1
+                row[1] += n
+                row[2] = max(row[2], n)
+                row[3] += elapsed
+                row[4] = max(row[4], elapsed)
+
+        wrapper.__code__ = wrapper.__code__.replace(co_name=_WRAPPER_TAG + name)
+        self._originals.append((runner, name, fn))
+        setattr(runner, name, wrapper)
+
+    def uninstall(self) -> None:
+        for owner, name, fn in reversed(self._originals):
+            setattr(owner, name, fn)
+        self._originals.clear()
+
+    def report(self) -> Dict:
+        functions = {
+            name: {
+                "calls": self.calls[name],
+                "seconds": round(self.seconds[name], 6),
+                "mean_us": round(1e6 * self.seconds[name] / self.calls[name], 3),
+            }
+            for name in sorted(self.calls, key=lambda k: -self.seconds[k])
+        }
+        turns = [
+            {
+                # choose_guess(turn, ...) picks the guess for turn + 2 (1-based)
+                "guess_number": turn + 2,
+                "decisions": row[0],
+                "mean_candidates": round(row[1] / row[0], 2),
+                "max_candidates": row[2],
+                "mean_ms": round(1000 * row[3] / row[0], 4),
+                "max_ms": round(1000 * row[4], 4),
+            }
+            for turn, row in sorted(self.turns.items())
+        ]
+        return {"functions": functions, "turns": turns}
+
+
+def _label(func: FuncKey) -> str:
+    filename, line, name = func
+    if filename == "~":  # built-in
+        return name.strip("<>").replace(" ", "_")
+    module = filename.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+    return f"{module}.{name}:{line}"
+
+
+def collapsed_stacks(stats: pstats.Stats, min_share: float = 1e-4) -> Dict[str, float]:
+    """
+    Approximate collapsed stacks (seconds of own time per call path) from a cProfile
+    call graph: a function's time under a caller is split in proportion to that edge's
+    cumulative time.
+    """
+    raw = stats.stats  # func -> (cc, nc, tt, ct, callers{func: (cc, nc, tt, ct)})
+    children: Dict[FuncKey, List[Tuple[FuncKey, float]]] = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children[caller].append((func, edge[3]))
+    roots = [f for f, v in raw.items() if not v[4]]
+    total = sum(v[2] for v in raw.values()) or 1.0
+    out: Dict[str, float] = defaultdict(float)
+
+    def walk(func: FuncKey, share: float, path: Tuple[str, ...], on_path: frozenset) -> None:
+        tt, ct = raw[func][2], raw[func][3]
+        if not func[2].startswith(_WRAPPER_TAG):  # leave instrumentation out of the stacks
+            path = path + (_label(func),)
+        if share * tt > 0:
+            out[";".join(path)] += share * tt
+        for child, edge_ct in children.get(func, ()):
+            child_ct = raw[child][3]
+            if child in on_path or child_ct <= 0:
+                continue
+            sub = share * edge_ct / child_ct
+            if sub * child_ct >= min_share * total:
+                walk(child, sub, path, on_path | {child})
+
+    for root in roots:
+        walk(root, 1.0, (), frozenset([root]))
+    return out
+
+
+class Session:
+    """One profiled run: instrumentation (+ cProfile), written out by finish()."""
+
+    def __init__(self, prefix: str, instrumentation: Instrumentation, cprofile: bool = True):
+        self.prefix = prefix
+        self.instrumentation = instrumentation
+        self.profiler = cProfile.Profile() if cprofile else None
+        self.start = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def finish(self, top: int = 40) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+        wall = time.perf_counter() - self.start
+        self.instrumentation.uninstall()
+        report = {"wall_seconds": round(wall, 3), **self.instrumentation.report()}
+        if self.profiler is None:
+            self._write_json(report)
+            return
+        stats = pstats.Stats(self.profiler)
+        entries = sorted(
+            (kv for kv in stats.stats.items() if not kv[0][2].startswith(_WRAPPER_TAG)),
+            key=lambda kv: -kv[1][3],
+        )[:top]
+        report["cprofile"] = [
+            {
+                "function": _label(func),
+                "calls": nc,
+                "tottime": round(tt, 6),
+                "cumtime": round(ct, 6),
+            }
+            for func, (_, nc, tt, ct, _) in entries
+        ]
+        self._write_json(report)
+        with open(self.prefix + ".folded", "w") as f:
+            for stack, seconds in sorted(collapsed_stacks(stats).items()):
+                us = int(seconds * 1e6)
+                if us:
+                    f.write(f"{stack} {us}\n")
+
+    def _write_json(self, report: Dict) -> None:
+        with open(self.prefix + ".json", "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+def start(prefix: str, solver, runner, cprofile: bool = True) -> Session:
+    """Instrument `solver`, GameState and `runner`'s decisions, and start cProfile if asked."""
+    from game_state import GameState
+
+    instr = Instrumentation()
+    instr.install(solver)
+    # the scoring internals behind the pickers, so scoring and tie-breaking show up too
+    instr.install(solver, ["_pick_best", "_batch_scores", "_bucket_sizes", "_coverage_scores"])
+    instr.install(GameState, ["apply", "candidates"], prefix="GameState.")
+    instr.install_decisions(runner)
+    return Session(prefix, instr, cprofile)
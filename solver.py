@@ -1,5 +1,6 @@
-f = open("fives.txt", "r")
-g = f.read().split("\n")
+import wordlist
+
+g = wordlist.load_words("fives.txt")
 for i in g:
     if (
         "e" not in i
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Strategy-tree compiler and replay.
+- A fixed strategy (opener, then choose_guess(turn, candidates)) is a deterministic decision
+  tree: answers that give the same feedback history get the same next guess.
+- compile_tree builds that tree once by splitting the answers reaching each node on the
+  pattern codes of its guess, so a full evaluation costs one guess computation per node
+  instead of one per answer per turn.
+- Trees are stored in a compact binary file (header, guess words, CSR node/edge arrays),
+  little-endian on every host like the pattern-matrix and word-list files.
+- Replay scores every answer, or answers an interactive query, by walking the tree.
+
+Usage:
+  python strategy_tree.py compile hard|normal OUT   # naws_arose / normal_mode_runner strategy
+  python strategy_tree.py score TREE                # same summary as the runners
+  python strategy_tree.py query TREE [GUESS:PATTERN ...]   # e.g. arose:01002
+"""
+
+import hashlib
+import struct
+import sys
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import new_advanced_solver as solver
+import wordlist
+from game_state import GameState
+
+UNSOLVED = 7
+MAGIC = b"WTRE"
+VERSION = 1
+# magic, version, max_guesses, sha256 of the answer list, n_words, n_nodes, n_edges, words blob size
+_HEADER = struct.Struct("<4sHH32sIIII")
+
+
+class StrategyTree:
+    """
+    Node i plays words[guess[i]]; its children are edges edge_start[i]:edge_start[i + 1],
+    sorted by pattern code. A missing edge for a non-green code means the strategy gives up
+    there (no candidates left, no guess, or out of turns).
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        guess: array,
+        edge_start: array,
+        edge_code: array,
+        edge_child: array,
+        max_guesses: int = 6,
+        answers_key: bytes = b"\0" * 32,
+    ):
+        self.words = words
+        self.guess = guess
+        self.edge_start = edge_start
+        self.edge_code = edge_code
+        self.edge_child = edge_child
+        self.max_guesses = max_guesses
+        self.answers_key = answers_key
+
+    def __len__(self) -> int:
+        return len(self.guess)
+
+    def guess_at(self, node: int) -> str:
+        return self.words[self.guess[node]]
+
+    def child(self, node: int, code: int) -> int:
+        """Child reached by feedback `code` at `node`, or -1."""
+        lo, hi = self.edge_start[node], self.edge_start[node + 1]
+        codes = self.edge_code
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if codes[mid] < code:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.edge_start[node + 1] and codes[lo] == code:
+            return self.edge_child[lo]
+        return -1
+
+    def score(self, answer: str) -> int:
+        """Guesses the strategy needs for `answer` (1..max_guesses), or 7 if unsolved."""
+        ac = solver.word_codes(answer)
+        node = 0
+        for turn in range(self.max_guesses):
+            guess = self.guess_at(node)
+            code = solver.feedback_code(solver.word_codes(guess), ac)
+            if code == solver.all_green_code(len(guess)):
+                return turn + 1
+            node = self.child(node, code)
+            if node < 0:
+                return UNSOLVED
+        return UNSOLVED
+
+    def score_all(self, answers: Sequence[str]) -> List[int]:
+        return [self.score(a) for a in answers]
+
+    def next_guess(self, history: Sequence[Tuple[str, int]]) -> str:
+        """
+        Guess to play after `history` [(guess, code), ...]; "" if the strategy has none.
+        Raises ValueError if the history did not follow the tree's own guesses.
+        """
+        node = 0
+        for guess, code in history:
+            if guess != self.guess_at(node):
+                raise ValueError(
+                    f"strategy plays {self.guess_at(node)!r} here, not {guess!r}"
+                )
+            node = self.child(node, code)
+            if node < 0:
+                return ""
+        return self.guess_at(node)
+
+    def save(self, path: str) -> None:
+        blob = "\n".join(self.words).encode("ascii")
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    self.max_guesses,
+                    self.answers_key,
+                    len(self.words),
+                    len(self.guess),
+                    len(self.edge_code),
+                    len(blob),
+                )
+            )
+            f.write(blob)
+            for arr in (self.guess, self.edge_start, self.edge_code, self.edge_child):
+                if sys.byteorder != "little":
+                    arr = array(arr.typecode, arr)
+                    arr.byteswap()
+                arr.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "StrategyTree":
+        with open(path, "rb") as f:
+            magic, version, max_guesses, key, n_words, n_nodes, n_edges, size = (
+                _HEADER.unpack(f.read(_HEADER.size))
+            )
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a strategy tree file")
+            words = f.read(size).decode("ascii").split("\n") if n_words else []
+            arrays = []
+            for typecode, count in (
+                ("i", n_nodes),
+                ("i", n_nodes + 1),
+                ("H", n_edges),
+                ("i", n_edges),
+            ):
+                arr = array(typecode)
+                arr.fromfile(f, count)
+                if sys.byteorder != "little":
+                    arr.byteswap()
+                arrays.append(arr)
+        return cls(words, *arrays, max_guesses=max_guesses, answers_key=key)
+
+
+def answers_key(answers: Sequence[str]) -> bytes:
+    return hashlib.sha256("\n".join(answers).encode()).digest()
+
+
+def compile_tree(
+    answers: List[str],
+    first_guess: str,
+    choose_guess: Callable[[int, List[str]], str],
+    max_guesses: int = 6,
+) -> StrategyTree:
+    """
+    Build the decision tree of a strategy over `answers`.
+    choose_guess(turn, candidates) must depend only on its arguments; candidates are
+    narrowed exactly as the runners' simulate_one does (GameState over `answers`).
+    """
+    words: List[str] = []
+    word_id: Dict[str, int] = {}
+    node_guess: List[int] = []
+    node_edges: List[List[Tuple[int, int]]] = []
+
+    def build(state: GameState, guess: str, ids: List[int], turn: int) -> int:
+        if guess not in word_id:
+            word_id[guess] = len(words)
+            words.append(guess)
+        node = len(node_guess)
+        node_guess.append(word_id[guess])
+        edges: List[Tuple[int, int]] = []
+        node_edges.append(edges)
+        if turn + 1 >= max_guesses:
+            return node
+        gc = solver.word_codes(guess)
+        green = solver.all_green_code(len(guess))
+        buckets: Dict[int, List[int]] = {}
+        for i in ids:
+            code = solver.feedback_code(gc, solver.word_codes(answers[i]))
+            if code != green:
+                buckets.setdefault(code, []).append(i)
+        for code in sorted(buckets):
+            branch = state.copy()
+            branch.apply(guess, code)
+            cands = branch.candidates()
+            nxt = choose_guess(turn, cands) if cands else ""
+            if nxt:
+                edges.append((code, build(branch, nxt, buckets[code], turn + 1)))
+        return node
+
+    build(GameState(answers), first_guess, list(range(len(answers))), 0)
+
+    edge_start = array("i", [0])
+    edge_code = array("H")
+    edge_child = array("i")
+    for edges in node_edges:
+        for code, child in edges:
+            edge_code.append(code)
+            edge_child.append(child)
+        edge_start.append(len(edge_code))
+    return StrategyTree(
+        words,
+        array("i", node_guess),
+        edge_start,
+        edge_code,
+        edge_child,
+        max_guesses=max_guesses,
+        answers_key=answers_key(answers),
+    )
+
+
+def parse_history(items: Sequence[str]) -> List[Tuple[str, int]]:
+    """['arose:01002', ...] -> [('arose', code), ...]"""
+    history = []
+    for item in items:
+        guess, _, pattern = item.partition(":")
+        history.append((guess.lower(), solver.encode_pattern(pattern)))
+    return history
+
+
+def print_summary(answers: List[str], scores: List[int]) -> None:
+    total = len(answers)
+    unsolved = [a for a, s in zip(answers, scores) if s == UNSOLVED]
+    solve_rate = (total - len(unsolved)) / total if total else 0.0
+    avg_score = sum(scores) / total if total else 0.0
+    max_score = max(scores) if scores else 0
+    hardest_word = answers[scores.index(max_score)] if scores else ""
+    print("\n=== Final Results ===")
+    print("Unsolved words:", len(unsolved))
+    if unsolved:
+        print(", ".join(unsolved))
+    print(f"Solve rate: {solve_rate:.5f}")
+    print(f"Average score: {avg_score:.5f}")
+    print(f"Max score: {max_score}  ({hardest_word})")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) >= 3 and argv[0] == "compile" and argv[1] in ("hard", "normal"):
+        import pattern_matrix
+
+        words = wordlist.load_words("fives.txt")
+        solver.use_pattern_matrix(
+            pattern_matrix.load_pattern_matrix(words, words, verbose=True)
+        )
+        if argv[1] == "hard":
+            import naws_arose as runner
+
+            first, choose = runner.first_guess(words), runner.choose_guess
+        else:
+            import normal_mode_runner as runner
+
+            first = runner.first_guess(words)
+
+            def choose(turn: int, cands: List[str]) -> str:
+                return runner.choose_guess(turn, cands, words)
+
+        start = time.perf_counter()
+        tree = compile_tree(words, first, choose)
+        elapsed = time.perf_counter() - start
+        tree.save(argv[2])
+        print(f"Compiled {len(tree)} nodes in {elapsed:.2f}s -> {argv[2]}")
+    elif len(argv) == 2 and argv[0] == "score":
+        tree = StrategyTree.load(argv[1])
+        words = wordlist.load_words("fives.txt")
+        if answers_key(words) != tree.answers_key:
+            print("warning: tree was compiled for a different answer list", file=sys.stderr)
+        print_summary(words, tree.score_all(words))
+    elif len(argv) >= 2 and argv[0] == "query":
+        tree = StrategyTree.load(argv[1])
+        try:
+            guess = tree.next_guess(parse_history(argv[2:]))
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        print(guess or "(no guess: history leaves the strategy without candidates)")
+    else:
+        print(__doc__.split("Usage:")[1].rstrip(), file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
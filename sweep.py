@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Process-pool helpers for full-list simulation sweeps (normal_mode_runner / naws_arose).
+- The word list is published once in a shared-memory block; workers attach to it
+  instead of each receiving a pickled copy.
+- The pattern matrix is shared the same way for free: every worker memory-maps the
+  same cache file (pattern_matrix.load_pattern_matrix with build=False).
+- Results come back in answer order (Pool.imap), so running aggregates, heartbeats
+  and final statistics are identical to a serial run.
+- multiprocessing is only imported once a pool is actually used.
+- Checkpoint appends every scored answer (plus periodic running aggregates) to a JSONL
+  file headed by a config fingerprint; a resumed sweep replays those scores and only
+  plays the rest, so its output matches an uninterrupted run.
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+
+def share_words(words: List[str]) -> Tuple["shared_memory.SharedMemory", int]:
+    """
+    Copy `words` into a new shared-memory block; returns (block, payload size).
+    The caller closes and unlinks the block once the pool is done.
+    """
+    from multiprocessing import shared_memory
+
+    data = "\n".join(words).encode("ascii")
+    shm = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[: len(data)] = data
+    return shm, len(data)
+
+
+def attach_words(name: str, size: int) -> List[str]:
+    """Read the word list published by share_words from another process."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[:size]).decode("ascii").split("\n") if size else []
+    finally:
+        shm.close()
+
+
+def map_answers(
+    fn: Callable[[int], int],
+    items: Iterable[int],
+    workers: int,
+    words: List[str],
+    initializer: Callable[..., None],
+    extra_initargs: tuple = (),
+    chunksize: int = 8,
+) -> Iterator[int]:
+    """
+    fn over items (answer indices), yielding results in input order.
+    workers <= 1 runs in-process: the caller sets up fn's globals itself.
+    Otherwise `words` is published in shared memory and a pool of `workers` processes
+    runs initializer(shm_name, size, *extra_initargs) (which should call attach_words)
+    before any fn call.
+    """
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+    import multiprocessing as mp
+
+    shm, size = share_words(words)
+    try:
+        with mp.Pool(
+            workers, initializer=initializer, initargs=(shm.name, size, *extra_initargs)
+        ) as pool:
+            yield from pool.imap(fn, items, chunksize=chunksize)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# --------------------------------
+# Resumable sweeps
+# --------------------------------
+
+CHECKPOINT_VERSION = 1
+
+
+class Checkpoint:
+    """
+    Append-only JSONL log of a sweep:
+      {"version": 1, "fingerprint": {...}}         header: the config the scores belong to
+      {"i": 17, "answer": "abide", "score": 4}     one line per scored answer
+      {"done": 100, "sum": 402, "unsolved": 3}     running aggregates every `every` answers
+    A torn last line (interrupted write, or no newline yet) is dropped on load.
+    """
+
+    def __init__(self, path: str, fingerprint: Dict, every: int = 100):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.every = every
+        self.done: Dict[int, int] = {}
+        self._file = None
+        self._valid_end = 0  # bytes of the file that load() could parse
+        self._fresh = 0
+        self._sum = 0
+        self._unsolved = 0
+
+    def load(self) -> Dict[int, int]:
+        """
+        Scores already in the file (answer index -> score). Raises ValueError if the file
+        was written for a different configuration.
+        """
+        valid_end = 0
+        done: Dict[int, int] = {}
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return done
+        with f:
+            for n, raw in enumerate(f):
+                # a record counts once its newline is written: a complete object without
+                # one is torn too, or the next record would be appended onto its line
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    rec = json.loads(raw)
+                except ValueError:
+                    break  # torn tail
+                if n == 0:
+                    if rec.get("version") != CHECKPOINT_VERSION:
+                        raise ValueError(f"{self.path}: unknown checkpoint version")
+                    if rec.get("fingerprint") != self.fingerprint:
+                        raise ValueError(
+                            f"{self.path} was written by a different configuration:\n"
+                            f"  file: {json.dumps(rec.get('fingerprint'), sort_keys=True)}\n"
+                            f"  now:  {json.dumps(self.fingerprint, sort_keys=True)}"
+                        )
+                elif "i" in rec:
+                    done[rec["i"]] = rec["score"]
+                valid_end += len(raw)
+        self._valid_end = valid_end
+        self.done = done
+        return done
+
+    def open(self, resume: bool) -> None:
+        """Start appending: after the loaded records if resuming, else a new file."""
+        if resume and os.path.exists(self.path):
+            self._file = open(self.path, "r+")
+            self._file.truncate(self._valid_end)
+            self._file.seek(0, os.SEEK_END)
+            if self._file.tell() > 0:
+                return
+        else:
+            self.done = {}
+            self._file = open(self.path, "w")
+        self._write({"version": CHECKPOINT_VERSION, "fingerprint": self.fingerprint})
+
+    def _write(self, rec: Dict) -> None:
+        self._file.write(json.dumps(rec, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def record(self, idx: int, answer: str, score: int, unsolved: bool) -> None:
+        """Log one answer's score (answers replayed from the file are not logged again)."""
+        self._sum += score
+        self._unsolved += unsolved
+        if idx in self.done:
+            return
+        self._write({"i": idx, "answer": answer, "score": score})
+        self._fresh += 1
+        if self._fresh % self.every == 0:
+            self._write(
+                {"done": len(self.done) + self._fresh, "sum": self._sum, "unsolved": self._unsolved}
+            )
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def resume_answers(
+    done: Dict[int, int],
+    total: int,
+    compute: Callable[[List[int]], Iterable[int]],
+) -> Iterator[int]:
+    """
+    Scores of answers 0..total-1 in order: replayed from `done` where present, otherwise
+    taken in turn from compute(pending indices) (e.g. a map_answers call).
+    """
+    pending = [i for i in range(total) if i not in done]
+    fresh = iter(compute(pending)) if pending else iter(())
+    for i in range(total):
+        if i in done:
+            yield done[i]
+        else:
+            yield next(fresh)
+
+
+def start_checkpoint(
+    path: str, fingerprint: Dict, resume: bool, every: int = 100
+) -> Tuple[Checkpoint, Dict[int, int]]:
+    """
+    Open the checkpoint for a sweep; returns it with the scores to replay ({} unless
+    resuming). Raises ValueError if resuming a file from another configuration.
+    """
+    checkpoint = Checkpoint(path, fingerprint, every=every)
+    done = checkpoint.load() if resume else {}
+    checkpoint.open(resume)
+    return checkpoint, done
@@ -0,0 +1,50 @@
+import json
+
+import batch_solve
+import wordlist
+
+# a cheap stand-in for the hard/normal runners: open with "arose", then the first candidate
+STRATEGY = ("arose", lambda turn, cands: cands[0])
+
+
+def solve(*lines):
+    words = wordlist.load_words("fives.txt")
+    return list(batch_solve.solve_stream([json.dumps(x) for x in lines], words, STRATEGY))
+
+
+def test_full_games():
+    crane, rest = solve("crane", {"id": 7, "answer": "CRANE", "history": ["slate:00202"]})
+    assert crane["answer"] == "crane" and crane["solved"]
+    assert crane["guesses"][0] == "arose" and crane["guesses"][-1] == "crane"
+    assert crane["patterns"][0] == "12002" and crane["patterns"][-1] == "22222"
+    assert crane["score"] == len(crane["guesses"]) == len(crane["turn_ms"])
+    assert rest["id"] == 7 and rest["guesses"][0] == "slate" and rest["solved"]
+
+
+def test_next_guess_from_history():
+    (fresh,) = solve({"history": []})
+    assert fresh["next"] == "arose" and fresh["history"] == []
+    (step,) = solve({"history": [["arose", "01102"]]})
+    assert step["history"] == ["arose:01102"]
+    assert step["candidates"] > 0 and step["next"]
+    (done,) = solve({"history": ["crane:22222"]})
+    assert done["next"] == ""
+
+
+def test_bad_lines_become_error_records():
+    bad = [
+        7,
+        {},
+        "cr4ne",
+        "cranes",
+        "zzzzz",
+        {"history": ["arose:0110"]},
+        {"history": ["aroses:011020"]},
+        {"answer": "crane", "history": ["arose:22222"]},
+    ]
+    out = solve(*bad, "crane")
+    assert [r.get("line") for r in out[:-1]] == list(range(1, len(bad) + 1))
+    assert all("error" in r for r in out[:-1])
+    assert "not 5 letters" in out[3]["error"]
+    assert "not in the word list" in out[4]["error"]
+    assert out[-1]["solved"]  # the stream carries on
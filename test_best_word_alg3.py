@@ -0,0 +1,62 @@
+import os
+import random
+
+import pytest
+
+import best_word_alg3
+import wordlist
+
+
+def sample(k, seed=0):
+    return random.Random(seed).sample(wordlist.load_words("fives.txt"), k)
+
+
+def test_vectorized_scores_match_guess_doit():
+    words = sample(120) + ["eerie", "geese", "speed", "erase", "llama"]
+    guesses = words[:15] + words[-5:]
+    expected = []
+    for g in guesses:
+        guess = best_word_alg3.Guess(g)
+        guess.doit(words)
+        expected.append(guess.score)
+    assert best_word_alg3.score_guesses(guesses, words) == expected
+    assert best_word_alg3._score_guesses_py(guesses, words) == expected
+
+
+def test_clue_code():
+    c, _, _ = best_word_alg3.Guess("arose").check_guess("crane")
+    assert best_word_alg3.clue_code("arose", "crane") == int("".join(map(str, c)), 3)
+
+
+def run(tmp_path, monkeypatch, words, *args):
+    monkeypatch.setattr(best_word_alg3.wordlist, "load_words", lambda *a, **k: words)
+    out = tmp_path / "output.txt"
+    best_word_alg3.main(
+        ["--checkpoint", str(tmp_path / "run.ckpt"), "--output", str(out), "--block", "7", *args]
+    )
+    return out.read_text()
+
+
+def test_resume_from_torn_checkpoint(tmp_path, monkeypatch, capsys):
+    words = sample(60, seed=1)
+    full = run(tmp_path, monkeypatch, words)
+    ckpt = tmp_path / "run.ckpt"
+    header, record = best_word_alg3._HEADER.size, best_word_alg3._RECORD.size
+    assert os.path.getsize(ckpt) == header + len(words) * record
+
+    # interrupted in the middle of the 20th record
+    with open(ckpt, "r+b") as f:
+        f.truncate(header + 19 * record + record // 2)
+    assert len(best_word_alg3.read_checkpoint(str(ckpt), words)) == 19
+    assert run(tmp_path, monkeypatch, words) == full
+    assert os.path.getsize(ckpt) == header + len(words) * record
+    assert "Resuming: 19/60" in capsys.readouterr().out
+
+
+def test_checkpoint_of_another_list_is_ignored(tmp_path, monkeypatch):
+    words = sample(30, seed=2)
+    run(tmp_path, monkeypatch, words)
+    other = words[:-1] + ["crane" if words[-1] != "crane" else "slate"]
+    assert best_word_alg3.read_checkpoint(str(tmp_path / "run.ckpt"), other) == {}
+    expected = run(tmp_path, monkeypatch, other, "--restart")
+    assert run(tmp_path, monkeypatch, other) == expected
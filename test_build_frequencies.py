@@ -0,0 +1,74 @@
+import os
+
+import build_frequencies
+
+WORDS = ["abaca", "crane", "slate", "eerie", "zebra", "quiet"]
+
+
+def write(path, text, mtime_ns=None):
+    path.write_text(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def scratch(tmp_path, sources, name="scratch.csv"):
+    out = str(tmp_path / name)
+    build_frequencies.build(sources, WORDS, out, rebuild=True)
+    with open(out) as f:
+        return f.read()
+
+
+def test_counts_merge_case_variants(tmp_path):
+    src = write(tmp_path / "a.csv", "word,count\nAbaca,3\nabaca,1\n crane ,8\nother,99\nslate,x\n")
+    out = str(tmp_path / "freq.csv")
+    assert build_frequencies.build([src], WORDS, out) == 2
+    with open(out) as f:
+        assert f.read() == "word,frequency\nabaca,0.500000000000\ncrane,1.000000000000\n"
+
+
+def test_incremental_equals_scratch(tmp_path):
+    a = write(tmp_path / "a.csv", "word,count\ncrane,10\nslate,4\n")
+    b = write(tmp_path / "b.csv", "eerie,7\nCrane,5\n")
+    out = str(tmp_path / "freq.csv")
+    build_frequencies.build([a], WORDS, out)
+
+    # a new source is read; the unchanged one comes from the state
+    build_frequencies.build([b], WORDS, out)
+    with open(out) as f:
+        assert f.read() == scratch(tmp_path, [a, b])
+
+    # a changed source replaces its old totals instead of adding to them
+    write(tmp_path / "b.csv", "eerie,1\nzebra,30\n", mtime_ns=10**9)
+    build_frequencies.build([b], WORDS, out)
+    with open(out) as f:
+        assert f.read() == scratch(tmp_path, [a, b])
+
+
+def test_recorded_sources_are_refreshed_or_dropped(tmp_path):
+    a = write(tmp_path / "a.csv", "crane,10\nslate,4\n")
+    b = write(tmp_path / "b.csv", "eerie,7\n")
+    out = str(tmp_path / "freq.csv")
+    build_frequencies.build([a, b], WORDS, out)
+
+    # a recorded source that changed is re-read even when not passed again
+    write(tmp_path / "a.csv", "crane,1\nzebra,3\n", mtime_ns=10**9)
+    build_frequencies.build([], WORDS, out)
+    with open(out) as f:
+        assert f.read() == scratch(tmp_path, [a, b])
+
+    # a removed source no longer counts
+    os.remove(b)
+    build_frequencies.build([], WORDS, out)
+    with open(out) as f:
+        assert f.read() == scratch(tmp_path, [a])
+
+
+def test_state_of_another_word_list_is_ignored(tmp_path):
+    a = write(tmp_path / "a.csv", "crane,10\n")
+    b = write(tmp_path / "b.csv", "slate,5\n")
+    out = str(tmp_path / "freq.csv")
+    build_frequencies.build([a], WORDS, out)
+    build_frequencies.build([b], WORDS[::-1], out)
+    with open(out) as f:
+        assert f.read() == "word,frequency\nslate,1.000000000000\n"
@@ -0,0 +1,54 @@
+import random
+
+import candidate_index
+import new_advanced_solver as solver
+import wordlist
+
+
+def test_mask_matches_candidate_ok():
+    words = wordlist.load_words("fives.txt")
+    index = candidate_index.CandidateIndex(words)
+    r = random.Random(0)
+    turns = [(r.choice(words), r.choice(words)) for _ in range(200)]
+    for guess, answer in turns + [("speed", "erase"), ("geese", "eerie"), ("llama", "alarm")]:
+        code = solver.encode_pattern(solver.feedback_pattern(guess, answer))
+        constraints = solver.turn_constraints(guess, code)
+        expected = [w for w in words if solver.candidate_ok(w, *constraints)]
+        assert index.words_of(index.mask_for(*constraints)) == expected
+
+
+def test_words_of():
+    words = ["crane", "slate", "eerie", "abbey"]
+    index = candidate_index.CandidateIndex(words)
+    assert index.words_of(0b1010) == ["slate", "abbey"]
+    assert index.words_of(index.all) == words
+    assert index.words_of(0) == []
+
+
+def test_only_registered_lists_are_indexed():
+    words = wordlist.load_words("fives.txt")
+    index = candidate_index.register(words)
+    assert candidate_index.register(words) is index
+    assert candidate_index.registered(words) is index
+    assert candidate_index.registered(list(words)) is None  # same words, another list
+
+    code = solver.encode_pattern(solver.feedback_pattern("arose", "crane"))
+    constraints = solver.turn_constraints("arose", code)
+    transient = solver.filter_candidates(words[:500], *constraints)
+    assert candidate_index.registered(words[:500]) is None  # scanned, not indexed
+    assert transient == [w for w in words[:500] if solver.candidate_ok(w, *constraints)]
+    assert solver.filter_candidates(words, *constraints) == index.words_of(
+        index.mask_for(*constraints)
+    )
+
+
+def test_registry_drops_the_least_recently_used_list():
+    lists = [["crane", "slate", str(i)] for i in range(candidate_index._MAX_REGISTERED)]
+    for words in lists:
+        candidate_index.register(words)
+    candidate_index.registered(lists[0])  # now the most recently used
+    extra = ["eerie", "abbey"]
+    candidate_index.register(extra)
+    assert candidate_index.registered(lists[1]) is None
+    assert candidate_index.registered(lists[0]) is not None
+    assert candidate_index.registered(extra) is not None
@@ -0,0 +1,87 @@
+import math
+from functools import lru_cache
+
+import pytest
+
+import new_advanced_solver as solver
+from exact_solver import ExactSolver
+
+# clusters that differ in one or two letters, plus repeated letters in guess and answer
+SETS = [
+    ["eerie", "geese", "speed", "erase", "sassy", "abbey", "llama", "level"],
+    ["eater", "tease", "terse", "reset", "steer", "ester", "crate", "trace", "react"],
+    ["batch", "catch", "hatch", "latch", "match", "patch", "watch"],
+    ["crane", "slate", "eerie", "abbey", "speed"],
+]
+EXTRA_GUESSES = ["arose", "chimp", "wombs", "tulip"]
+
+
+def brute_force(answers, guesses, max_depth):
+    """Fewest total guesses over every decision tree, by plain exhaustive recursion."""
+    green = solver.all_green_code(len(answers[0]))
+
+    def code(g, a):
+        return solver.encode_pattern(solver.feedback_pattern(g, a))
+
+    @lru_cache(maxsize=None)
+    def cost(S, depth):
+        if depth == 0:
+            return math.inf
+        best = math.inf
+        for g in guesses:
+            buckets = {}
+            for a in S:
+                c = code(g, a)
+                if c != green:
+                    buckets.setdefault(c, []).append(a)
+            if len(buckets) == 1 and len(next(iter(buckets.values()))) == len(S):
+                continue  # learns nothing
+            total = len(S) + sum(cost(tuple(b), depth - 1) for b in buckets.values())
+            best = min(best, total)
+        return best
+
+    return cost(tuple(answers), max_depth)
+
+
+@pytest.mark.parametrize("answers", SETS)
+@pytest.mark.parametrize("max_depth", [2, 3, 6])
+def test_solve_matches_brute_force(answers, max_depth):
+    guesses = answers + EXTRA_GUESSES
+    es = ExactSolver(answers, guesses, max_depth=max_depth)
+    res = es.solve()
+    expected = brute_force(answers, guesses, max_depth)
+    assert res.optimal
+    assert res.total_guesses == expected
+    if expected == math.inf:
+        assert res.tree is None
+        return
+    assert res.expected_guesses == pytest.approx(expected / len(answers))
+    scores = es.to_strategy_tree(res.tree).score_all(answers)
+    assert sum(scores) == res.total_guesses
+    assert max(scores) <= max_depth
+
+
+def test_answers_only_guesses():
+    answers = SETS[1]
+    res = ExactSolver(answers, answers).solve()
+    assert res.total_guesses == brute_force(answers, answers, 6)
+
+
+def test_lower_bound_and_small_sets():
+    es = ExactSolver(SETS[0], SETS[0])
+    assert es.lower_bound(1, 1) == 1
+    assert es.lower_bound(2, 1) == math.inf
+    assert es.lower_bound(3, 2) == 5  # one solved by the first guess, two on the second
+    assert es._small((0,), 1) == (1.0, (es.answer_guess[0], {}))
+    assert es._small((0, 1), 1) is None
+    assert es._small((0, 1), 2)[0] == 3.0
+
+
+def test_budget_completes_the_tree_greedily():
+    answers = SETS[0] + SETS[1]
+    guesses = answers + EXTRA_GUESSES
+    es = ExactSolver(answers, guesses, node_budget=0)
+    res = es.solve()
+    assert not res.optimal
+    assert sum(es.to_strategy_tree(res.tree).score_all(answers)) == res.total_guesses
+    assert res.total_guesses >= ExactSolver(answers, guesses).solve().total_guesses
@@ -0,0 +1,30 @@
+import random
+
+import new_advanced_solver as solver
+import wordlist
+
+
+def pairs(words, n, seed=0):
+    r = random.Random(seed)
+    return [(r.choice(words), r.choice(words)) for _ in range(n)]
+
+
+def test_feedback_code_matches_feedback_pattern():
+    words = wordlist.load_words("fives.txt") + ["speed", "erase", "eerie", "geese", "llama"]
+    for guess, answer in pairs(words, 3000) + [("speed", "erase"), ("geese", "eerie")]:
+        code = solver.feedback_code(solver.word_codes(guess), solver.word_codes(answer))
+        assert code == solver.encode_pattern(solver.feedback_pattern(guess, answer))
+
+
+def test_feedback_code_other_lengths():
+    for length in (4, 6, 8):
+        for guess, answer in pairs(wordlist.words_of_length(length), 500, seed=length):
+            code = solver.feedback_code(solver.word_codes(guess), solver.word_codes(answer))
+            assert solver.decode_pattern(code, length) == solver.feedback_pattern(guess, answer)
+
+
+def test_all_green_and_digits():
+    assert solver.all_green_code(5) == solver.ALL_GREEN
+    code = solver.encode_pattern("21002")
+    assert solver.pattern_digits(code, 5) == (2, 1, 0, 0, 2)
+    assert solver.decode_pattern(code, 5) == "21002"
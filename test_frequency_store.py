@@ -0,0 +1,40 @@
+import frequency_store
+
+WORDS = ["crane", "slate", "eerie", "abbey", "crane", "llama", "zebra", "quiz"]
+LETTER_FREQ = {"a": 1.0, "e": 1.0, "r": 0.5, "l": 0.5, "c": 0.25, "n": 0.25, "s": 0.5, "t": 0.5}
+WORD_FREQ = {"llama": 0.002, "quiz": 0.01}
+
+
+def store():
+    return frequency_store.FrequencyStore(WORDS, LETTER_FREQ, WORD_FREQ)
+
+
+def test_formulas():
+    s = store()
+    assert s.letter_score("crane") == (0.25 + 0.5 + 1.0 + 0.25 + 1.0) * 1.2
+    assert s.letter_score("eerie") == 3 * 1.0 + 0.5  # no unique-letter bonus
+    assert s.combined_score("llama") == s.letter_score("llama") + 100 * 0.002
+    assert s.score("zebra", frequency_store.LETTERS) == s.letter_score("zebra")
+    assert s.score("other") == s.combined_score("other")  # not in the list
+    assert s.id_of("crane") == 0 and s.id_of("other") == -1
+
+
+def test_top_matches_sort_then_slice():
+    s = store()
+    words = WORDS + ["other", "slate"]
+    keep = lambda w: "z" not in w
+    for table, then in [(frequency_store.COMBINED, None),
+                        (frequency_store.LETTERS, None),
+                        (frequency_store.COMBINED, frequency_store.LETTERS)]:
+        expected = s.sort(filter(keep, words), table, then)
+        for k in (1, 3, len(words), None):
+            best, kept = s.top(iter(words), k, keep, table, then)
+            assert best == (expected if k is None else expected[:k])
+            assert kept == len(expected)
+
+
+def test_sort_is_stable_on_ties():
+    s = store()
+    assert s.sort(["slate", "least", "crane", "steal"], frequency_store.LETTERS)[:3] == [
+        "slate", "least", "steal"
+    ]
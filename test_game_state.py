@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+import game_state
+import new_advanced_solver as solver
+import wordlist
+
+
+def code_for(guess, answer):
+    return solver.encode_pattern(solver.feedback_pattern(guess, answer))
+
+
+def test_apply_matches_filtering_every_turn():
+    words = wordlist.load_words("fives.txt")
+    r = random.Random(0)
+    for _ in range(40):
+        answer = r.choice(words)
+        state = game_state.GameState(words)
+        expected = words
+        for _ in range(3):
+            guess = r.choice(words)
+            constraints = solver.turn_constraints(guess, code_for(guess, answer))
+            expected = [w for w in expected if solver.candidate_ok(w, *constraints)]
+            assert state.apply(guess, code_for(guess, answer)) == len(expected)
+            assert state.candidates() == expected
+            assert answer in expected
+
+
+def test_undo_copy_and_snapshot():
+    words = wordlist.load_words("fives.txt")
+    state = game_state.GameState(words)
+    state.apply("arose", code_for("arose", "crane"))
+    after_one = state.candidates()
+    snap = state.snapshot()
+    branch = state.copy()
+    branch.apply("unlit", code_for("unlit", "crane"))
+    assert branch.turn == 2 and len(branch) < len(after_one)
+    assert state.turn == 1 and state.candidates() == after_one
+
+    state.apply("unlit", code_for("unlit", "crane"))
+    assert state.candidates() == branch.candidates()
+    state.undo()
+    assert state.candidates() == after_one
+    state.apply("crane", solver.ALL_GREEN)
+    state.restore(snap)
+    assert state.history == (("arose", code_for("arose", "crane")),)
+    state.undo()
+    assert len(state) == len(words)
+    with pytest.raises(IndexError):
+        state.undo()
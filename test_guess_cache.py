@@ -0,0 +1,79 @@
+import json
+
+import guess_cache
+from guess_cache import GuessCache
+
+GUESSES = ["arose", "crane", "slate", "unlit"]
+OTHER_GUESSES = ["arose", "crane", "slate", "tulip"]
+CANDS = ["crane", "crate", "grace"]
+
+
+def test_lru_eviction_order():
+    cache = GuessCache(max_size=3)
+    keys = [cache.key("hard:1", None, [w]) for w in ["a", "b", "c", "d"]]
+    for k, guess in zip(keys[:3], "abc"):
+        cache.put(k, guess)
+    assert cache.get(keys[0]) == "a"  # now the most recently used
+    cache.put(keys[3], "d")  # evicts b, the least recently used
+    assert cache.get(keys[1]) is None
+    assert [cache.get(k) for k in (keys[0], keys[2], keys[3])] == ["a", "c", "d"]
+    assert len(cache) == 3
+    assert cache.stats() == {
+        "size": 3, "hits": 4, "misses": 1, "evictions": 1, "hit_rate": 0.8
+    }
+
+
+def test_key_covers_tag_guess_list_and_candidate_order():
+    cache = GuessCache()
+    base = cache.key("list:1", GUESSES, CANDS)
+    assert cache.key("list:1", list(GUESSES), list(CANDS)) == base
+    assert cache.key("list:0", GUESSES, CANDS) != base
+    assert cache.key("list:1", OTHER_GUESSES, CANDS) != base
+    assert cache.key("list:1", GUESSES, CANDS[::-1]) != base  # ties break by position
+    assert cache.key("list:1", None, CANDS) != base
+    assert base[2] == guess_cache.fingerprint(CANDS)
+
+
+def test_get_or_compute_calls_once():
+    cache = GuessCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "crane"
+
+    for _ in range(3):
+        assert cache.get_or_compute("list:1", GUESSES, CANDS, compute) == "crane"
+    assert len(calls) == 1
+
+
+def test_save_load_round_trip_keeps_lru_order(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = GuessCache(max_size=3, path=path)
+    keys = [cache.key("list:1", GUESSES, [w]) for w in ["a", "b", "c"]]
+    for k, guess in zip(keys, "abc"):
+        cache.put(k, guess)
+    cache.get(keys[0])
+    cache.save()
+
+    loaded = GuessCache(max_size=3, path=path)
+    assert len(loaded) == 3
+    loaded.put(loaded.key("list:1", GUESSES, ["d"]), "d")  # evicts b, as before the save
+    assert loaded.get(keys[1]) is None
+    assert loaded.get(keys[0]) == "a" and loaded.get(keys[2]) == "c"
+
+
+def test_entries_from_another_word_list_never_hit(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = GuessCache(path=path)
+    cache.put(cache.key("list:1", GUESSES, CANDS), "crane")
+    cache.save()
+    loaded = GuessCache(path=path)
+    assert loaded.get(loaded.key("list:1", OTHER_GUESSES, CANDS)) is None
+    assert loaded.get(loaded.key("list:1", GUESSES, CANDS)) == "crane"
+
+
+def test_file_of_another_version_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps({"version": 0, "entries": [["list:1", "", "x", "crane"]]}))
+    assert len(GuessCache(path=str(path))) == 0
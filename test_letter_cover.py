@@ -0,0 +1,53 @@
+import random
+from itertools import combinations
+
+import letter_cover
+import wordlist
+
+
+def brute_force(words, k, target, fixed=()):
+    covered = letter_cover.letter_mask("".join(fixed))
+    rest = [w for w in words if w not in fixed]
+    found = set()
+    for combo in combinations(rest, k - len(fixed)):
+        mask = covered | letter_cover.letter_mask("".join(combo))
+        if bin(mask).count("1") >= target:
+            found.add(tuple(fixed) + combo)
+    return found
+
+
+def small_list(n=70, seed=0):
+    return random.Random(seed).sample(wordlist.load_words("uniques.txt"), n)
+
+
+def test_search_matches_brute_force():
+    words = small_list()
+    engine = letter_cover.CoverSearch(words)
+    for k, target in [(2, 10), (3, 14), (3, 15)]:
+        found = list(engine.search(k, target))
+        assert len(found) == len(set(found))  # each set reached once
+        assert set(found) == brute_force(words, k, target)
+
+
+def test_search_with_fixed_word():
+    words = small_list(seed=1)
+    engine = letter_cover.CoverSearch(words)
+    fixed = (words[0],)
+    assert set(engine.search(3, 13, fixed)) == brute_force(words, 3, 13, fixed)
+
+
+def test_missing_letters():
+    assert letter_cover.missing_letters(["abcde", "fghij"]) == list("klmnopqrstuvwxyz")
+    assert letter_cover.mask_letters(letter_cover.letter_mask("crane")) == "acenr"
+
+
+def test_letter_classes_expand_to_every_combination():
+    words = ["least", "slate", "steal", "crony", "corny", "bumph", "dwarf"]
+    classes = letter_cover.LetterClasses(words)
+    assert len(classes) == 4
+    assert classes.representatives() == ["least", "crony", "bumph", "dwarf"]
+    engine = letter_cover.CoverSearch(classes.representatives())
+    combos = {c for ids in engine.search_ids(2, 10) for c in classes.expand(ids)}
+    assert combos == brute_force(words, 2, 10)
+    assert classes.first_expansion([1, 0]) == [0, 3]
+    assert classes.first_expansion([0], after=2) is None
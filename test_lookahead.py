@@ -0,0 +1,116 @@
+import math
+import random
+
+import pytest
+
+import new_advanced_solver as solver
+import pattern_matrix
+import wordlist
+from lookahead import Lookahead
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    words = sorted(random.Random(0).sample(wordlist.load_words("fives.txt"), 250))
+    return pattern_matrix.PatternMatrix(words, words, pattern_matrix.build_pattern_matrix(words, words))
+
+
+def buckets(guess, cands):
+    out = {}
+    for a in cands:
+        out.setdefault(solver.feedback_pattern(guess, a), []).append(a)
+    return list(out.values())
+
+
+def entropy(guess, cands):
+    n = len(cands)
+    return -sum(len(b) / n * math.log2(len(b) / n) for b in buckets(guess, cands))
+
+
+def squares(guess, cands):
+    return sum(len(b) ** 2 for b in buckets(guess, cands))
+
+
+def exhaustive(guess, pool, cands, prefer_entropy):
+    """Two-step score by brute force: the best follow-up from `pool` in every bucket."""
+    n = len(cands)
+    if prefer_entropy:
+        follow = sum(len(b) * max(entropy(f, b) for f in pool) for b in buckets(guess, cands))
+        return entropy(guess, cands) + follow / n
+    return sum(min(squares(f, b) for f in pool) for b in buckets(guess, cands)) / n
+
+
+def sample_case(matrix, n, seed):
+    r = random.Random(seed)
+    return r.sample(matrix.guesses, 60), r.sample(matrix.answers, n)
+
+
+@pytest.mark.parametrize("prefer_entropy", [True, False])
+def test_two_step_scores_match_exhaustive(matrix, prefer_entropy):
+    la = Lookahead(matrix)
+    for seed, n in enumerate((3, 12, 40)):
+        firsts, cands = sample_case(matrix, n, seed)
+        pool = firsts[:25]
+        got = la.two_step_scores(
+            np.asarray(matrix.guess_ids(firsts)),
+            np.asarray(matrix.guess_ids(pool)),
+            np.asarray(matrix._candidate_ids(cands)),
+            prefer_entropy,
+        )
+        for g, score in zip(firsts, got.tolist()):
+            assert score == pytest.approx(exhaustive(g, pool, cands, prefer_entropy))
+
+
+@pytest.mark.parametrize("prefer_entropy", [True, False])
+def test_unpruned_pick_is_the_exhaustive_best(matrix, prefer_entropy):
+    for seed, n in enumerate((5, 20, 40)):
+        guesses, cands = sample_case(matrix, n, 10 + seed)
+        la = Lookahead(matrix, k=len(guesses), follow_k=len(guesses), margin=math.inf)
+        pick = la.pick(guesses, cands, prefer_entropy)
+        pool = list(dict.fromkeys(guesses + cands))
+        two = {g: exhaustive(g, pool, cands, prefer_entropy) for g in guesses}
+        best = max(two.values()) if prefer_entropy else min(two.values())
+        assert two[pick] == pytest.approx(best)
+        # ties on the two-step score go to the better one-step score
+        one = entropy if prefer_entropy else squares
+        tied = [g for g in guesses if math.isclose(two[g], best, abs_tol=1e-9)]
+        best_one = (max if prefer_entropy else min)(one(g, cands) for g in tied)
+        assert one(pick, cands) == pytest.approx(best_one)
+
+
+def test_margin_and_k_prune_to_the_one_step_pick(matrix):
+    guesses, cands = sample_case(matrix, 30, 20)
+    one_step = solver._pick_best(guesses, cands, True)
+    for la in (Lookahead(matrix, k=1), Lookahead(matrix, margin=0.0)):
+        calls = []
+        la.two_step_scores = lambda *args: calls.append(args)
+        assert la.pick(guesses, cands) == one_step
+        assert calls == []  # a single survivor is returned without a second step
+
+
+def test_follow_up_pool_size(matrix):
+    guesses, cands = sample_case(matrix, 30, 21)
+    ent = matrix.score_guesses(guesses, cands)[0]
+    by_score = [guesses[i] for i in np.argsort(-ent, kind="stable")]
+    # more candidates than follow_k: the top follow-ups only; else the candidates join them
+    for follow_k, expected in ((10, 10), (40, len(set(by_score[:40]) | set(cands)))):
+        la = Lookahead(matrix, k=5, follow_k=follow_k, margin=math.inf)
+        pools = []
+        original = la.two_step_scores
+
+        def spy(first_ids, pool_ids, cids, prefer_entropy):
+            pools.append(len(pool_ids))
+            return original(first_ids, pool_ids, cids, prefer_entropy)
+
+        la.two_step_scores = spy
+        la.pick(guesses, cands)
+        assert pools == [expected]
+
+
+def test_falls_back_outside_its_range(matrix):
+    guesses, cands = sample_case(matrix, 30, 22)
+    assert Lookahead(matrix, min_candidates=31).pick(guesses, cands) is None
+    assert Lookahead(matrix, max_candidates=29).pick(guesses, cands) is None
+    assert Lookahead(None).pick(guesses, cands) is None
@@ -0,0 +1,70 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+import multi_board
+import pattern_matrix
+import wordlist
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def solver():
+    words = sorted(random.Random(0).sample(wordlist.load_words("fives.txt"), 300) + ["arose"])
+    data = pattern_matrix.build_pattern_matrix(words, words)
+    return multi_board.MultiBoardSolver(pattern_matrix.PatternMatrix(words, words, data), block=64)
+
+
+def board_entropy(m, g, cands):
+    counts = Counter(int(m.array[g, a]) for a in cands)
+    n = len(cands)
+    return -sum(c / n * math.log2(c / n) for c in counts.values())
+
+
+def test_info_scores_are_summed_per_board(solver):
+    m = solver.matrix
+    r = random.Random(1)
+    boards = [np.array(sorted(r.sample(range(m.n_answers), n)), dtype=np.intp) for n in (40, 7, 1)]
+    guesses = np.arange(0, m.n_guesses, 3, dtype=np.intp)
+    got = solver.info_scores(guesses, boards)
+    for g, score in zip(guesses, got):
+        assert score == pytest.approx(sum(board_entropy(m, g, b) for b in boards))
+
+    solver.prefer_entropy = False
+    try:
+        got = solver.info_scores(guesses[:20], boards)
+    finally:
+        solver.prefer_entropy = True
+    for g, score in zip(guesses[:20], got):
+        expected = 0.0
+        for b in boards:
+            counts = Counter(int(m.array[g, a]) for a in b)
+            expected += sum(c * c for c in counts.values()) / len(b)
+        assert score == pytest.approx(expected)
+
+
+def test_single_candidate_is_played_first(solver):
+    boards = [np.arange(50, dtype=np.intp), np.array([12], dtype=np.intp)]
+    assert solver.choose(boards) == 12
+    chances = solver.solve_chances(boards)
+    assert chances[12] == pytest.approx(1 + 1 / 50)
+
+
+def test_play_solves_every_board(solver):
+    m = solver.matrix
+    for game in range(5):
+        answer_ids = multi_board.answer_tuple(0, 4, game, m.n_answers)
+        assert answer_ids == multi_board.answer_tuple(0, 4, game, m.n_answers)
+        score, solved_on = solver.play(answer_ids)
+        assert score <= multi_board.max_guesses(4)
+        assert max(solved_on) == score and all(solved_on)
+
+
+def test_rejects_board_counts_below_one():
+    with pytest.raises(SystemExit):
+        multi_board.main(["--boards", "4", "0"])
+    with pytest.raises(SystemExit):
+        multi_board.main(["--games", "0"])
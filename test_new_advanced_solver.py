@@ -0,0 +1,92 @@
+import math
+import random
+
+import pytest
+
+import new_advanced_solver as solver
+import pattern_matrix
+import wordlist
+
+
+def full_scan(guess_list, candidates, prefer_entropy):
+    """The pick as a plain scan scoring every guess (no bounds, no early stop)."""
+    best = ""
+    if prefer_entropy:
+        best_ent, best_cov = -1.0, -1.0
+        for w in guess_list:
+            ent = solver.entropy_of_guess(w, candidates)
+            cov = solver.coverage_score(w, candidates)
+            if ent > best_ent or (math.isclose(ent, best_ent) and cov > best_cov):
+                best, best_ent, best_cov = w, ent, cov
+    else:
+        best_er, best_ent = float("inf"), -1.0
+        for w in guess_list:
+            er = solver.expected_remaining_of_guess(w, candidates)
+            ent = solver.entropy_of_guess(w, candidates)
+            if er < best_er or (math.isclose(er, best_er) and ent > best_ent):
+                best, best_er, best_ent = w, er, ent
+    return best
+
+
+def cases(seed=0):
+    """(guess list, candidates): small sets where singleton splits and ties are common."""
+    words = wordlist.load_words("fives.txt")
+    r = random.Random(seed)
+    out = []
+    for n in (2, 3, 5, 8, 13, 30, 80):
+        for _ in range(3):
+            guesses = r.sample(words, 200)
+            out.append((guesses, r.sample(words, n)))
+            out.append((guesses[::-1], out[-1][1]))  # ties are broken by list order
+    # anagrams and one-letter clusters score identically
+    cluster = ["batch", "catch", "hatch", "latch", "match", "patch", "watch"]
+    out.append((["least", "slate", "steal", "stale", "tales"] + cluster, cluster))
+    return out
+
+
+@pytest.fixture
+def matrix():
+    """A pattern matrix over 400 words, installed for the test (the batched contender pass)."""
+    pytest.importorskip("numpy")
+    words = sorted(random.Random(1).sample(wordlist.load_words("fives.txt"), 400))
+    data = pattern_matrix.build_pattern_matrix(words, words)
+    solver.use_pattern_matrix(pattern_matrix.PatternMatrix(words, words, data))
+    yield words
+    solver.use_pattern_matrix(None)
+
+
+@pytest.mark.parametrize("prefer_entropy", [True, False])
+def test_pick_best_matches_full_scan(prefer_entropy):
+    for guesses, cands in cases():
+        assert solver._pick_best(guesses, cands, prefer_entropy) == full_scan(
+            guesses, cands, prefer_entropy
+        )
+
+
+@pytest.mark.parametrize("prefer_entropy", [True, False])
+def test_pick_best_matches_full_scan_with_matrix(matrix, prefer_entropy):
+    r = random.Random(2)
+    for n in (2, 4, 9, 25, 100):
+        for _ in range(5):
+            guesses = r.sample(matrix, 200)
+            cands = r.sample(matrix, n)
+            assert solver._pick_best(guesses, cands, prefer_entropy) == full_scan(
+                guesses, cands, prefer_entropy
+            )
+
+
+def test_top_from_guess_list_matches_sorted_prefix():
+    for guesses, cands in cases(seed=3)[::3]:
+        ranked = solver.rank_from_guess_list(guesses, cands)
+        for k in (1, 5, 20):
+            assert solver.top_from_guess_list(guesses, cands, k) == ranked[:k]
+    assert solver.top_from_guess_list(guesses, cands, 0) == []
+
+
+def test_top_from_guess_list_matches_sorted_prefix_with_matrix(matrix):
+    r = random.Random(4)
+    for n in (3, 30, 150):
+        guesses, cands = r.sample(matrix, 250), r.sample(matrix, n)
+        ranked = solver.rank_from_guess_list(guesses, cands)
+        for k in (1, 5, 20):
+            assert solver.top_from_guess_list(guesses, cands, k) == ranked[:k]
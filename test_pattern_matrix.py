@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+import pattern_matrix
+import wordlist
+
+np = pytest.importorskip("numpy")
+
+# repeated letters in guess and answer exercise the green-first / left-to-right yellow rules
+DUPLICATES = [
+    "speed", "erase", "eerie", "abbey", "llama", "geese", "sassy", "crane", "eaten", "level"
+]
+
+
+def sample(words, k, seed=0):
+    return random.Random(seed).sample(words, k)
+
+
+def test_vectorized_builder_matches_scalar_five_letters():
+    words = DUPLICATES + sample(wordlist.load_words("fives.txt"), 150)
+    vectorized = pattern_matrix.build_pattern_matrix(words, words, block=16)
+    assert vectorized == pattern_matrix.build_pattern_matrix_scalar(words, words)
+
+
+def test_scalar_builder_matches_feedback_pattern():
+    words = DUPLICATES
+    data = pattern_matrix.build_pattern_matrix(words, words)
+    m = pattern_matrix.PatternMatrix(words, words, data)
+    assert pattern_matrix.verify_pattern_matrix(m, words, words) == 0
+    assert m.code("speed", "erase") == int("10110", 3)
+    assert m.code("geese", "eerie") == int("02102", 3)
+
+
+def test_save_and_open(tmp_path):
+    words = DUPLICATES + sample(wordlist.load_words("fives.txt"), 50)
+    data = pattern_matrix.build_pattern_matrix(words, words)
+    path = str(tmp_path / "five.bin")
+    pattern_matrix.save_pattern_matrix(path, words, words, data)
+    m = pattern_matrix.open_pattern_matrix(path, words, words)
+    assert m.code("crane", "crane") == 3**5 - 1
+    assert pattern_matrix.verify_pattern_matrix(m, words[:20], words) == 0
+    m.close()
+
+
+def test_six_letters_use_uint16(tmp_path):
+    words = ["bubble", "access", "letter", "eerier"] + sample(wordlist.words_of_length(6), 120)
+    data = pattern_matrix.build_pattern_matrix(words, words)
+    assert data == pattern_matrix.build_pattern_matrix_scalar(words, words)
+    assert len(data) == 2 * len(words) ** 2
+
+    path = str(tmp_path / "six.bin")
+    pattern_matrix.save_pattern_matrix(path, words, words, data)
+    m = pattern_matrix.open_pattern_matrix(path, words, words)
+    assert m.array.dtype == np.dtype("<u2")
+    assert m.code("bubble", "bubble") == 3**6 - 1
+    assert pattern_matrix.verify_pattern_matrix(m, words[:20], words) == 0
+    m.close()
+
+
+def test_code_itemsize_limits():
+    assert pattern_matrix.code_itemsize(5) == 1
+    assert pattern_matrix.code_itemsize(6) == 2
+    assert pattern_matrix.code_itemsize(10) == 2
+    with pytest.raises(ValueError):
+        pattern_matrix.code_itemsize(11)
+
+
+def test_sorted_scoring_matches_histograms():
+    words = sample(wordlist.words_of_length(7), 400)
+    data = pattern_matrix.build_pattern_matrix(words, words)
+    m = pattern_matrix.PatternMatrix(words, words, data)
+    gids = m.guess_ids(words)
+    cids = np.asarray(m.answer_ids(words[:50]), dtype=np.intp)
+    expected = pattern_matrix.score_histograms(m.bucket_histograms(gids, cids), len(cids))
+    got = pattern_matrix.score_sorted_codes(m.array[np.ix_(gids, cids)], len(cids))
+    for e, g in zip(expected, got):
+        assert np.allclose(e, g)
@@ -0,0 +1,60 @@
+import json
+import types
+
+import profiling
+
+
+def _module():
+    mod = types.ModuleType("fake_solver")
+
+    def double(x):
+        return 2 * x
+
+    double.__module__ = "fake_solver"
+    mod.double = double
+    return mod
+
+
+def test_install_counts_calls_and_uninstall_restores():
+    mod = _module()
+    original = mod.double
+    instr = profiling.Instrumentation()
+    instr.install(mod)
+    assert mod.double(3) == 6 and mod.double(4) == 8
+    assert instr.calls["double"] == 2
+    instr.uninstall()
+    assert mod.double is original
+
+
+def test_stats_session_writes_counters_without_cprofile(tmp_path):
+    mod = _module()
+    runner = types.SimpleNamespace(choose_guess=lambda turn, candidates: candidates[0])
+    instr = profiling.Instrumentation()
+    instr.install(mod)
+    instr.install_decisions(runner)
+    session = profiling.Session(str(tmp_path / "run"), instr, cprofile=False)
+    assert session.profiler is None
+    mod.double(1)
+    runner.choose_guess(0, ["crane", "slate"])
+    session.finish()
+
+    report = json.loads((tmp_path / "run.json").read_text())
+    assert report["functions"]["double"]["calls"] == 1
+    assert report["turns"][0]["guess_number"] == 2
+    assert report["turns"][0]["max_candidates"] == 2
+    assert "cprofile" not in report
+    assert not (tmp_path / "run.folded").exists()
+
+
+def test_profile_session_adds_cprofile_and_stacks(tmp_path):
+    mod = _module()
+    instr = profiling.Instrumentation()
+    instr.install(mod)
+    session = profiling.Session(str(tmp_path / "run"), instr)
+    mod.double(1)
+    session.finish()
+
+    report = json.loads((tmp_path / "run.json").read_text())
+    assert report["functions"]["double"]["calls"] == 1
+    assert report["cprofile"]
+    assert (tmp_path / "run.folded").exists()
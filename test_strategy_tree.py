@@ -0,0 +1,77 @@
+import random
+import struct
+
+import pytest
+
+import new_advanced_solver as solver
+import strategy_tree
+import wordlist
+from game_state import GameState
+
+
+def choose(turn, cands):
+    return cands[len(cands) // 2]
+
+
+@pytest.fixture(scope="module")
+def answers():
+    return sorted(random.Random(0).sample(wordlist.load_words("fives.txt"), 400))
+
+
+def simulate(answers, answer, first="arose", max_guesses=6):
+    state = GameState(answers)
+    guess = first
+    for turn in range(max_guesses):
+        code = solver.feedback_code(solver.word_codes(guess), solver.word_codes(answer))
+        if code == solver.ALL_GREEN:
+            return turn + 1
+        state.apply(guess, code)
+        cands = state.candidates()
+        if not cands:
+            break
+        guess = choose(turn, cands)
+    return strategy_tree.UNSOLVED
+
+
+def test_tree_scores_match_simulation(answers):
+    tree = strategy_tree.compile_tree(answers, "arose", choose)
+    assert tree.guess_at(0) == "arose"
+    assert tree.score_all(answers) == [simulate(answers, a) for a in answers]
+
+
+def test_next_guess(answers):
+    tree = strategy_tree.compile_tree(answers, "arose", choose)
+    answer = answers[123]
+    code = solver.encode_pattern(solver.feedback_pattern("arose", answer))
+    state = GameState(answers)
+    state.apply("arose", code)
+    assert tree.next_guess([]) == "arose"
+    assert tree.next_guess([("arose", code)]) == choose(0, state.candidates())
+    with pytest.raises(ValueError):
+        tree.next_guess([("crane", code)])
+
+
+def test_save_load_round_trip_little_endian(answers, tmp_path):
+    tree = strategy_tree.compile_tree(answers, "arose", choose)
+    path = str(tmp_path / "tree.bin")
+    tree.save(path)
+    loaded = strategy_tree.StrategyTree.load(path)
+    assert loaded.words == tree.words
+    assert loaded.answers_key == strategy_tree.answers_key(answers)
+    for name in ("guess", "edge_start", "edge_code", "edge_child"):
+        assert getattr(loaded, name) == getattr(tree, name)
+    assert loaded.score_all(answers) == tree.score_all(answers)
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    header = strategy_tree._HEADER.unpack_from(raw)
+    start = strategy_tree._HEADER.size + header[-1]
+    n_nodes = header[5]
+    assert list(struct.unpack_from(f"<{n_nodes}i", raw, start)) == list(tree.guess)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.bin"
+    path.write_bytes(b"\0" * strategy_tree._HEADER.size)
+    with pytest.raises(ValueError):
+        strategy_tree.StrategyTree.load(str(path))
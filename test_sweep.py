@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+import sweep
+
+FINGERPRINT = {"mode": "hard", "openers": ["arose"]}
+ANSWERS = ["abide", "crane", "eerie", "llama", "zebra"]
+SCORES = [4, 3, 5, 7, 4]
+
+
+def run(path, resume, stop=None, every=2):
+    """Score ANSWERS through a checkpoint, optionally 'crashing' after `stop` answers."""
+    computed = []
+
+    def compute(pending):
+        for i in pending:
+            computed.append(i)
+            yield SCORES[i]
+
+    checkpoint, done = sweep.start_checkpoint(path, FINGERPRINT, resume, every=every)
+    scores = []
+    for i, score in enumerate(sweep.resume_answers(done, len(ANSWERS), compute)):
+        if i == stop:
+            break
+        checkpoint.record(i, ANSWERS[i], score, score > 6)
+        scores.append(score)
+    checkpoint.close()
+    return scores, computed
+
+
+def test_resume_replays_logged_scores(tmp_path):
+    path = str(tmp_path / "sweep.jsonl")
+    assert run(path, resume=False, stop=3) == (SCORES[:3], [0, 1, 2, 3])
+    scores, computed = run(path, resume=True)
+    assert scores == SCORES
+    assert computed == [3, 4]
+    with open(path) as f:
+        records = [json.loads(line) for line in f]
+    assert records[0] == {"version": 1, "fingerprint": FINGERPRINT}
+    assert [r["i"] for r in records if "i" in r] == [0, 1, 2, 3, 4]
+    assert records[-1] == {"done": 5, "sum": sum(SCORES), "unsolved": 1}
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    path = str(tmp_path / "sweep.jsonl")
+    run(path, resume=False, stop=2)
+    with open(path, "a") as f:
+        f.write('{"i": 2, "answer": "eer')
+    scores, computed = run(path, resume=True)
+    assert scores == SCORES and computed == [2, 3, 4]
+    with open(path) as f:
+        for line in f:
+            json.loads(line)
+
+
+def test_record_without_newline_is_dropped(tmp_path):
+    path = str(tmp_path / "sweep.jsonl")
+    run(path, resume=False, stop=2)
+    with open(path, "a") as f:
+        f.write('{"i":2,"answer":"eerie","score":9}')
+    scores, computed = run(path, resume=True)
+    assert scores == SCORES and computed == [2, 3, 4]
+    # the next resume sees every record
+    scores, computed = run(path, resume=True)
+    assert scores == SCORES and computed == []
+
+
+def test_other_configuration_is_refused(tmp_path):
+    path = str(tmp_path / "sweep.jsonl")
+    run(path, resume=False)
+    with pytest.raises(ValueError):
+        sweep.start_checkpoint(path, {"mode": "normal"}, resume=True)
+    # a fresh run overwrites it
+    checkpoint, done = sweep.start_checkpoint(path, {"mode": "normal"}, resume=False)
+    checkpoint.close()
+    assert done == {}
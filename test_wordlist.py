@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+import wordlist
+
+WORDS = ["crane", "slate", "ab", "abcdefghijklm", "quiz", "eerie", "zebra"]
+
+
+def test_pack_round_trip():
+    for w in ["a", "zz", "crane", "abcdefghijkl"]:
+        assert wordlist.unpack_word(wordlist.pack_word(w), len(w)) == w
+    assert wordlist.pack_word("ab") == 0 | 1 << 5
+
+
+def test_write_and_open(tmp_path):
+    path = str(tmp_path / "words.wlst")
+    wordlist.write_word_list(path, WORDS)
+    wl = wordlist.open_word_list(path)
+    assert wl.lengths() == [2, 4, 5, 13]
+    fives = wl.section(5)
+    assert list(fives) == ["crane", "slate", "eerie", "zebra"]
+    assert fives[1] == "slate" and fives[-1] == "zebra"
+    assert fives[1:3] == ["slate", "eerie"]
+    assert fives.id_of("eerie") == 2 and fives.id_of("quiz") == -1
+    assert fives.codes(0) == bytes([2, 17, 0, 13, 4])
+    assert fives.packed(3) == wordlist.pack_word("zebra")
+    assert wl.section(13).packed(0) == wordlist.pack_word("abcdefghijklm")  # unpacked section
+    assert len(wl.section(7)) == 0
+    assert wl.digest == wordlist.list_digest(WORDS)
+    wl.close()
+
+
+def test_rejects_bad_words_and_files(tmp_path):
+    with pytest.raises(ValueError):
+        wordlist.write_word_list(str(tmp_path / "bad.wlst"), ["Crane"])
+    junk = tmp_path / "junk.wlst"
+    junk.write_bytes(b"not a word list at all, just some bytes")
+    assert wordlist.open_word_list(str(junk)) is None
+    assert wordlist.open_word_list(str(tmp_path / "missing.wlst")) is None
+
+
+def test_load_word_list_rebuilds_when_text_changes(tmp_path):
+    text = tmp_path / "list.txt"
+    text.write_text("Crane\nslate\n\nquiz\n")
+    wl = wordlist.load_word_list(str(text))
+    assert wl.section(5).words() == ["crane", "slate"]
+    wl.close()
+
+    text.write_text("crane\nslate\nzebra\n")
+    os.utime(text, ns=(0, 1))  # make sure the mtime differs even on coarse clocks
+    wl = wordlist.load_word_list(str(text))
+    assert wl.section(5).words() == ["crane", "slate", "zebra"]
+    assert wl.section(4).words() == []
+    wl.close()
+
+
+def test_load_words_matches_text_file():
+    assert wordlist.load_words("fives.txt") == [
+        w for w in wordlist.read_text_words("fives.txt") if len(w) == 5
+    ]
+    assert all(len(w) == 6 for w in wordlist.words_of_length(6))
+
+
+def test_fives_has_no_trailing_junk_line():
+    # wordle.py used to read fives.txt with split("\n")[:-1]; the file has no trailing
+    # newline, so every line is a word and load_words keeps all of them
+    lines = open("fives.txt").read().split("\n")
+    assert all(len(line.strip()) == 5 for line in lines)
+    assert wordlist.load_words("fives.txt") == [line.strip() for line in lines]
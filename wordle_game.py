@@ -1,3 +1,6 @@
+import wordlist
+
+
 class Wordle(object):
     """docstring for Wordle"""
 
@@ -89,9 +92,7 @@ class Wordle(object):
     def generate_word(self, filename="fives"):
         import random
 
-        f = open(filename + ".txt", "r")
-        self.word = random.choice(f.read().split("\n")).upper()
-        f.close()
+        self.word = random.choice(wordlist.load_words(filename + ".txt")).upper()
 
     def get_instructions(self):
         return "Welcome to Wordle!\nWordle is a 5-letter game, where you try to find out the word in as few guesses as possible.\nYou will be given a hint after each guess,\nsignified by\n\t(A) for a letter that is not in the word,\n\t*A* for a letter that is in the word but not in the correct position, and\n\t[A] for a letter that is in the correct position.\nYou have 5 guesses to find the word.\nGood luck!"
@@ -100,13 +101,11 @@ class Wordle(object):
 filename = "uniques"
 game = Wordle(filename=filename)
 print(game.get_instructions())
+valid = {w.upper() for w in wordlist.load_words(filename + ".txt")}
 
 while True:
     guess = input("Guess a word! ").upper()
-    f = open(filename + ".txt", "r")
-    g = f.read().split("\n")
-    f.close()
-    if len(guess) != 5 or not guess.isalpha() and guess not in [i.upper() for i in g]:
+    if len(guess) != 5 or not guess.isalpha() and guess not in valid:
         print("Please enter a valid word of length 5!")
         continue
     state = game.new_guess(guess)
@@ -1,3 +1,6 @@
+import wordlist
+
+
 # user-defined (only removed letters)
 def not_removed(w):
     letters = "tyre"
@@ -15,10 +18,8 @@ def found_letters(w):
     )
 
 
-f = open("english3.txt", "r")
-g = f.read().split("\n")
 length = 8
-g = [i for i in g if len(i) == length]
+g = wordlist.words_of_length(length)
 for i in g:
     if not_removed(i) and found_letters(i):
         print(i)
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Packed binary word lists (.wlst) with a memory-mapped loader.
+- One section per word length: fixed-width letter codes (a=0 .. z=25, one byte per
+  letter), words kept in their text-file order, optionally followed by every word packed
+  into a uint64 at 5 bits per letter (first letter in the lowest bits; up to 12 letters).
+- The header carries a sha256 of the text list ("\\n".join of its words, file order) and
+  the size/mtime of the source file, so a stale .wlst is noticed without re-reading the text.
+- open_word_list memory-maps the file; a section's word IDs are indices into it, and
+  strings are only decoded when asked for (one at a time, or a whole section at once).
+- load_words(path, length) is the drop-in for the scripts' "read fives.txt, keep 5-letter
+  words" loops: it converts the text file on first use and mmaps the .wlst afterwards.
+- words_of_length(n) is the solvers' length-partitioned index: fives.txt for 5 letters,
+  the n-letter section of english3.txt for any other length.
+
+Usage:
+  python wordlist.py convert fives.txt [uniques.txt english3.txt ...] [--no-packed]
+  python wordlist.py info fives.wlst
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence
+
+MAGIC = b"WLST"
+VERSION = 1
+FLAG_PACKED = 1
+PACK_BITS = 5
+MAX_PACKED_LENGTH = 64 // PACK_BITS
+# magic, version, n_sections, flags, sha256 of the list, source size, source mtime_ns
+_HEADER = struct.Struct("<4sHHI32sQQ")
+# length, reserved, count, letter-code offset, packed offset (0 if absent)
+_SECTION = struct.Struct("<HHIQQ")
+
+_TO_CODES = bytes.maketrans(bytes(range(97, 123)), bytes(range(26)))
+_FROM_CODES = bytes.maketrans(bytes(range(26)), bytes(range(97, 123)))
+
+
+def binary_path(text_path: str) -> str:
+    """fives.txt -> fives.wlst (next to the text file)."""
+    return os.path.splitext(text_path)[0] + ".wlst"
+
+
+def list_digest(words: Sequence[str]) -> bytes:
+    import hashlib  # only needed when converting; keeps the loader import light
+
+    return hashlib.sha256("\n".join(words).encode("ascii")).digest()
+
+
+def pack_word(word: str) -> int:
+    """5 bits per letter, first letter lowest: 'ab' -> 0 | 1 << 5."""
+    value = 0
+    for i, ch in enumerate(word):
+        value |= (ord(ch) - 97) << (PACK_BITS * i)
+    return value
+
+
+def unpack_word(value: int, length: int) -> str:
+    return "".join(chr(97 + ((value >> (PACK_BITS * i)) & 31)) for i in range(length))
+
+
+def read_text_words(path: str) -> List[str]:
+    """Words of a text list, one per line, stripped and lower-cased (blank lines dropped)."""
+    with open(path, "r") as f:
+        return [w for w in (line.strip().lower() for line in f) if w]
+
+
+class WordSection(Sequence):
+    """The words of one length; index = word ID."""
+
+    def __init__(self, length: int, count: int, codes: memoryview, packed=None):
+        self.length = length
+        self.count = count
+        self._codes = codes
+        self._packed = packed
+        self._words: Optional[List[str]] = None
+        self._ids: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("word id out of range")
+        start = i * self.length
+        return bytes(self._codes[start : start + self.length]).translate(_FROM_CODES).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words())
+
+    def codes(self, i: int) -> bytes:
+        """Letter codes (0..25) of word i."""
+        start = i * self.length
+        return bytes(self._codes[start : start + self.length])
+
+    def packed(self, i: int) -> int:
+        """Word i as a 5-bit-per-letter integer (see pack_word)."""
+        if self._packed is not None:
+            return self._packed[i]
+        return pack_word(self[i])
+
+    def words(self) -> List[str]:
+        """All words, decoded once and cached."""
+        if self._words is None:
+            text = bytes(self._codes).translate(_FROM_CODES).decode()
+            n = self.length
+            self._words = [text[i : i + n] for i in range(0, len(text), n)]
+        return self._words
+
+    def id_of(self, word: str) -> int:
+        """Word ID of `word`, or -1."""
+        if self._ids is None:
+            self._ids = {w: i for i, w in enumerate(self.words())}
+        return self._ids.get(word, -1)
+
+
+class WordList:
+    """Read-only view of a memory-mapped .wlst file."""
+
+    def __init__(self, buf, digest: bytes, source_size: int, source_mtime: int):
+        self._buf = buf
+        self._view = memoryview(buf)
+        self.digest = digest
+        self.source_size = source_size
+        self.source_mtime = source_mtime
+        self.sections: Dict[int, WordSection] = {}
+
+    def section(self, length: int) -> WordSection:
+        """Words of `length` letters (an empty section if there are none)."""
+        sec = self.sections.get(length)
+        if sec is None:
+            sec = WordSection(length, 0, memoryview(b""))
+        return sec
+
+    def lengths(self) -> List[int]:
+        return sorted(self.sections)
+
+    def close(self) -> None:
+        for sec in self.sections.values():
+            sec._codes.release()
+            if isinstance(sec._packed, memoryview):
+                sec._packed.release()
+        self.sections = {}
+        self._view.release()
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+
+def write_word_list(
+    path: str,
+    words: Sequence[str],
+    packed: bool = True,
+    source_size: int = 0,
+    source_mtime: int = 0,
+) -> None:
+    """Write `words` (lower-case a-z only) as a .wlst file, atomically."""
+    by_length: Dict[int, List[str]] = {}
+    for w in words:
+        if not w.isascii() or not w.isalpha() or not w.islower():
+            raise ValueError(f"cannot pack {w!r}: only lower-case a-z words are supported")
+        by_length.setdefault(len(w), []).append(w)
+    lengths = sorted(by_length)
+    offset = _HEADER.size + _SECTION.size * len(lengths)
+    table, blobs = [], []
+    for n in lengths:
+        group = by_length[n]
+        codes = "".join(group).encode("ascii").translate(_TO_CODES)
+        codes_at = offset
+        offset += len(codes)
+        blobs.append(codes)
+        packed_at = 0
+        if packed and n <= MAX_PACKED_LENGTH:
+            pad = -offset % 8  # keep the uint64 array aligned
+            blobs.append(b"\0" * pad)
+            offset += pad
+            packed_at = offset
+            values = array("Q", (pack_word(w) for w in group))
+            if sys.byteorder != "little":
+                values.byteswap()
+            blobs.append(values.tobytes())
+            offset += 8 * len(group)
+        table.append(_SECTION.pack(n, 0, len(group), codes_at, packed_at))
+    flags = FLAG_PACKED if packed else 0
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                MAGIC, VERSION, len(lengths), flags, list_digest(words), source_size, source_mtime
+            )
+        )
+        for entry in table:
+            f.write(entry)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+
+
+def open_word_list(path: str) -> Optional[WordList]:
+    """Memory-map a .wlst file; None if it is missing or not a valid word list."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        head = f.read(_HEADER.size)
+        if len(head) != _HEADER.size:
+            return None
+        magic, version, n_sections, flags, digest, size, mtime = _HEADER.unpack(head)
+        if magic != MAGIC or version != VERSION:
+            return None
+        if os.fstat(f.fileno()).st_size == _HEADER.size:
+            buf = b""
+        else:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    wl = WordList(buf, digest, size, mtime)
+    for k in range(n_sections):
+        n, _, count, codes_at, packed_at = _SECTION.unpack_from(
+            wl._view, _HEADER.size + k * _SECTION.size
+        )
+        codes = wl._view[codes_at : codes_at + n * count]
+        packed = None
+        if packed_at and sys.byteorder == "little":
+            packed = wl._view[packed_at : packed_at + 8 * count].cast("Q")
+        wl.sections[n] = WordSection(n, count, codes, packed)
+    return wl
+
+
+def convert(text_path: str, packed: bool = True) -> str:
+    """Convert a text word list to .wlst next to it; returns the new path."""
+    st = os.stat(text_path)
+    out = binary_path(text_path)
+    write_word_list(out, read_text_words(text_path), packed, st.st_size, st.st_mtime_ns)
+    return out
+
+
+def load_word_list(text_path: str, build: bool = True) -> Optional[WordList]:
+    """
+    The mmapped .wlst for `text_path`, (re)converting it first if it is missing or the
+    text file changed since. Without the text file an existing .wlst is used as is.
+    """
+    path = binary_path(text_path)
+    wl = open_word_list(path)
+    try:
+        st = os.stat(text_path)
+    except FileNotFoundError:
+        if wl is None:
+            raise
+        return wl
+    if wl is not None and (wl.source_size, wl.source_mtime) == (st.st_size, st.st_mtime_ns):
+        return wl
+    if wl is not None:
+        wl.close()
+    if not build:
+        return None
+    convert(text_path)
+    return open_word_list(path)
+
+
+_LOADED: Dict[str, WordList] = {}
+
+
+def load_words(text_path: str = "fives.txt", length: Optional[int] = 5) -> List[str]:
+    """
+    Words of `length` letters from a word list, in file order, as the scripts used to read
+    them (stripped, lower-cased). length=None returns every word, grouped by length.
+    Repeated loads in one process reuse the same mapping.
+    """
+    wl = _LOADED.get(text_path)
+    if wl is None:
+        wl = _LOADED[text_path] = load_word_list(text_path)
+    if length is not None:
+        return list(wl.section(length).words())
+    return [w for n in wl.lengths() for w in wl.section(n).words()]
+
+
+# fives.txt is the curated 5-letter list; every other length comes from english3.txt
+LENGTH_SOURCES: Dict[int, str] = {5: "fives.txt"}
+DEFAULT_SOURCE = "english3.txt"
+SOLVER_LENGTHS = range(4, 9)  # word lengths the solvers and sweeps support
+
+
+def source_for_length(length: int) -> str:
+    return LENGTH_SOURCES.get(length, DEFAULT_SOURCE)
+
+
+def words_of_length(length: int) -> List[str]:
+    """The solvers' word list for `length`-letter words (one section of a mapped .wlst)."""
+    return load_words(source_for_length(length), length)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) >= 2 and argv[0] == "convert":
+        packed = "--no-packed" not in argv
+        for text_path in (a for a in argv[1:] if a != "--no-packed"):
+            out = convert(text_path, packed)
+            print(f"{text_path} -> {out} ({os.path.getsize(out)} bytes)")
+    elif len(argv) == 2 and argv[0] == "info":
+        wl = open_word_list(argv[1])
+        if wl is None:
+            print(f"{argv[1]} is not a word list file", file=sys.stderr)
+            sys.exit(1)
+        print(f"sha256 {wl.digest.hex()}")
+        for n in wl.lengths():
+            sec = wl.section(n)
+            kind = "codes + packed" if sec._packed is not None else "codes"
+            print(f"  length {n:2}: {len(sec):6} words ({kind})")
+    else:
+        print(__doc__.split("Usage:")[1].rstrip(), file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()